@@ -1,5 +1,6 @@
 import io
 import logging
+import os
 import shutil
 import struct
 
@@ -10,11 +11,12 @@ import sh
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
-from mayan.apps.storage.utils import NamedTemporaryFile
+from mayan.apps.storage.utils import NamedTemporaryFile, fs_cleanup, mkdtemp
 
 from ..classes import ConverterBase
 from ..exceptions import PageCountError
 from ..settings import setting_graphics_backend_arguments
+from ..utils import get_pdf_page_count
 
 from ..literals import (
     DEFAULT_PDFTOPPM_DPI, DEFAULT_PDFTOPPM_FORMAT, DEFAULT_PDFTOPPM_PATH,
@@ -84,6 +86,46 @@ class Python(ConverterBase):
             finally:
                 new_file_object.close()
 
+    def convert_range(self, first_page_number, last_page_number):
+        if self.mime_type == 'application/pdf' and pdftoppm:
+            new_file_object = NamedTemporaryFile()
+            input_filepath = new_file_object.name
+            self.file_object.seek(0)
+            shutil.copyfileobj(fsrc=self.file_object, fdst=new_file_object)
+            self.file_object.seek(0)
+            new_file_object.seek(0)
+
+            output_directory = mkdtemp()
+            try:
+                # Rasterize the entire range with a single execution.
+                # pdftoppm writes one file per page using the output
+                # root as prefix and the page number as suffix.
+                pdftoppm(
+                    input_filepath, os.path.join(output_directory, 'page'),
+                    f=first_page_number + 1, l=last_page_number + 1
+                )
+
+                filenames = sorted(
+                    os.listdir(output_directory), key=lambda filename: int(
+                        os.path.splitext(filename)[0].split('-')[-1]
+                    )
+                )
+
+                for filename in filenames:
+                    image = Image.open(
+                        fp=os.path.join(output_directory, filename)
+                    )
+                    image.load()
+                    yield image
+            finally:
+                fs_cleanup(filename=output_directory)
+                new_file_object.close()
+        else:
+            yield from super().convert_range(
+                first_page_number=first_page_number,
+                last_page_number=last_page_number
+            )
+
     def get_page_count(self):
         super().get_page_count()
 
@@ -95,6 +137,21 @@ class Python(ConverterBase):
             else:
                 file_object = self.file_object
 
+            try:
+                # Read the page count from the page tree root without
+                # parsing the entire document.
+                page_count = get_pdf_page_count(file_object=file_object)
+            except PageCountError as exception:
+                logger.debug(
+                    'Unable to read the page count from the page tree '
+                    'root; %s', exception
+                )
+            else:
+                logger.debug('Document contains %d pages', page_count)
+                return page_count
+            finally:
+                file_object.seek(0)
+
             try:
                 # Try PyPDF to determine the page number
                 pdf_reader = PyPDF2.PdfFileReader(
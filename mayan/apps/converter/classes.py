@@ -1,8 +1,11 @@
+from contextlib import contextmanager
 import copy
 from io import BytesIO
 import logging
 import os
+import platform
 import shutil
+import time
 
 import PIL
 from PIL import Image
@@ -18,21 +21,26 @@ from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.appearance.classes import Icon
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.mimetype.api import get_mimetype
 from mayan.apps.navigation.classes import Link
 from mayan.apps.storage.compressed_files import MsgArchive
 from mayan.apps.storage.literals import MSG_MIME_TYPES
 from mayan.apps.storage.settings import setting_temporary_directory
-from mayan.apps.storage.utils import (
-    NamedTemporaryFile, fs_cleanup, mkdtemp
-)
+from mayan.apps.storage.utils import NamedTemporaryFile, fs_cleanup
 
 from .exceptions import (
     InvalidOfficeFormat, LayerError, OfficeConversionError
 )
 from .literals import (
     CONVERTER_OFFICE_FILE_MIMETYPES, DEFAULT_LIBREOFFICE_PATH,
-    DEFAULT_PAGE_NUMBER, DEFAULT_PILLOW_FORMAT
+    DEFAULT_LIBREOFFICE_POOL_SIZE, DEFAULT_LIBREOFFICE_TIMEOUT,
+    DEFAULT_PAGE_NUMBER, DEFAULT_PILLOW_FORMAT,
+    LIBREOFFICE_PROFILE_POOL_RETRY_DELAY, OUTPUT_FORMAT_BILEVEL_RATIO,
+    OUTPUT_FORMAT_BILEVEL_THRESHOLD, OUTPUT_FORMAT_PREFERENCE_PHOTOGRAPHIC,
+    OUTPUT_FORMAT_PREFERENCE_TEXT, OUTPUT_FORMAT_SAMPLE_SIZE,
+    TRANSFORMATION_PLAN_REDUCING_GAP
 )
 from .settings import (
     setting_graphics_backend, setting_graphics_backend_arguments
@@ -44,6 +52,12 @@ logger = logging.getLogger(name=__name__)
 libreoffice_path = setting_graphics_backend_arguments.value.get(
     'libreoffice_path', DEFAULT_LIBREOFFICE_PATH
 )
+libreoffice_pool_size = setting_graphics_backend_arguments.value.get(
+    'libreoffice_pool_size', DEFAULT_LIBREOFFICE_POOL_SIZE
+)
+libreoffice_timeout = setting_graphics_backend_arguments.value.get(
+    'libreoffice_timeout', DEFAULT_LIBREOFFICE_TIMEOUT
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -94,20 +108,97 @@ class ConverterBase:
     def convert(self, page_number=DEFAULT_PAGE_NUMBER):
         self.page_number = page_number
 
-    def get_page(self, output_format=None):
-        output_format = output_format or setting_graphics_backend_arguments.value.get(
-            'pillow_format', DEFAULT_PILLOW_FORMAT
-        )
+    def convert_range(self, first_page_number, last_page_number):
+        """
+        Generator that converts a contiguous range of pages and returns
+        each one as an image. Backends able to rasterize several pages with
+        a single execution should override this method, by default each
+        page is converted individually.
+        """
+        for page_number in range(first_page_number, last_page_number + 1):
+            yield self.convert(page_number=page_number)
 
+    def draft(self, transformations):
+        """
+        Configure the decoder of the current image to produce the smallest
+        image that still has enough resolution for the result of the
+        transformations. Only formats that support reduced size decoding
+        like JPEG are affected.
+        """
+        transformation_plan = TransformationPlan(size=self.image.size)
+
+        for transformation in transformations:
+            if not transformation.plan_on(plan=transformation_plan):
+                return
+
+        size = transformation_plan.get_draft_size()
+        if size:
+            self.image.draft(mode=None, size=size)
+
+    def get_output_format(self, output_formats):
+        """
+        Choose the output format best suited for the content of the current
+        image from a list of allowed formats. Images made mostly of near
+        black and near white pixels, like text pages, prefer lossless
+        formats while photographic images prefer lossy formats.
+        """
+        if not self.image:
+            self.seek_page(page_number=0)
+
+        if self.image.mode == '1':
+            preference = OUTPUT_FORMAT_PREFERENCE_TEXT
+        else:
+            sample = self.image.resize(
+                size=(
+                    min(self.image.size[0], OUTPUT_FORMAT_SAMPLE_SIZE),
+                    min(self.image.size[1], OUTPUT_FORMAT_SAMPLE_SIZE)
+                ), resample=Image.NEAREST
+            )
+            histogram = sample.convert('L').histogram()
+
+            bilevel_pixel_count = sum(
+                histogram[:OUTPUT_FORMAT_BILEVEL_THRESHOLD]
+            ) + sum(histogram[-OUTPUT_FORMAT_BILEVEL_THRESHOLD:])
+
+            if bilevel_pixel_count >= sum(histogram) * OUTPUT_FORMAT_BILEVEL_RATIO:
+                preference = OUTPUT_FORMAT_PREFERENCE_TEXT
+            else:
+                preference = OUTPUT_FORMAT_PREFERENCE_PHOTOGRAPHIC
+
+        output_formats = [
+            output_format.upper() for output_format in output_formats
+        ]
+        for output_format in preference:
+            if output_format in output_formats:
+                return output_format
+
+        return output_formats[0]
+
+    def get_page(self, output_format=None, output_formats=None):
+        """
+        Encode the current image. If a list of allowed output formats is
+        provided instead of an output format, the format is chosen based
+        on the content of the image.
+        """
         if not self.image:
             self.seek_page(page_number=0)
 
+        if not output_format and output_formats:
+            output_format = self.get_output_format(
+                output_formats=output_formats
+            )
+
+        output_format = output_format or setting_graphics_backend_arguments.value.get(
+            'pillow_format', DEFAULT_PILLOW_FORMAT
+        )
+
         image_buffer = BytesIO()
         new_mode = self.image.mode
 
-        if output_format.upper() == 'JPEG':
+        if output_format.upper() in ('JPEG', 'WEBP'):
             # JPEG doesn't support transparency channel, convert the image to
-            # RGB. Removes modes: P and RGBA
+            # RGB. Removes modes: P and RGBA. WebP only supports RGB based
+            # modes.
             new_mode = 'RGB'
 
         self.image.convert(new_mode).save(image_buffer, format=output_format)
@@ -122,11 +213,14 @@ class ConverterBase:
         except InvalidOfficeFormat as exception:
             logger.debug('Is not an office format document; %s', exception)
 
-    def seek_page(self, page_number):
+    def seek_page(self, page_number, transformations=None):
         """
         Seek the specified page number from the source file object.
         If the file is a paged image get the page if not convert it to a
         paged image format and return the specified page as an image.
+        If the transformations that will be applied to the page are
+        provided, the page is decoded at the lowest resolution able to
+        produce the transformed image.
         """
         # Starting with #0
         self.file_object.seek(0)
@@ -146,8 +240,50 @@ class ConverterBase:
             raise
         else:
             self.image.seek(page_number)
+            if transformations:
+                self.draft(transformations=transformations)
             self.image.load()
 
+    def seek_page_range(self, first_page_number, last_page_number):
+        """
+        Generator version of seek_page. Seek each page of the specified
+        range in order and set it as the current image, allowing
+        .get_page() and the transformation methods to be used for each
+        page between iterations.
+        """
+        # Starting with #0
+        self.file_object.seek(0)
+
+        try:
+            image = Image.open(fp=self.file_object)
+        except IOError:
+            # Cannot identify image file
+            for image in self.convert_range(
+                first_page_number=first_page_number,
+                last_page_number=last_page_number
+            ):
+                self.image = image
+                yield self.image
+        except PIL.Image.DecompressionBombError as exception:
+            logger.error(
+                'Unable to seek document page. Increase the value of '
+                'the argument "pillow_maximum_image_pixels" in the '
+                'CONVERTER_GRAPHICS_BACKEND_ARGUMENTS setting; %s',
+                exception
+            )
+            raise
+        else:
+            for page_number in range(first_page_number, last_page_number + 1):
+                try:
+                    image.seek(page_number)
+                except EOFError:
+                    # Range extends beyond the last page of the image.
+                    break
+                else:
+                    image.load()
+                    self.image = image
+                    yield self.image
+
     def soffice(self):
         """
         Executes LibreOffice as a sub process
@@ -168,37 +304,47 @@ class ConverterBase:
             self.file_object.seek(0)
             temporary_file_object.seek(0)
 
-            libreoffice_home_directory = mkdtemp()
-            args = (
-                temporary_file_object.name, '--outdir', setting_temporary_directory.value,
-                '-env:UserInstallation=file://{}'.format(
-                    os.path.join(
-                        libreoffice_home_directory, 'LibreOffice_Conversion'
-                    )
-                ),
-            )
+            with libreoffice_profile_pool.acquire() as libreoffice_profile:
+                args = (
+                    temporary_file_object.name, '--outdir',
+                    setting_temporary_directory.value,
+                    '-env:UserInstallation={}'.format(
+                        libreoffice_profile.get_user_installation_url()
+                    ),
+                )
 
-            kwargs = {'_env': {'HOME': libreoffice_home_directory}}
+                kwargs = {
+                    '_env': {'HOME': libreoffice_profile.path},
+                    '_timeout': libreoffice_profile_pool.timeout
+                }
 
-            if self.mime_type == 'text/plain':
-                kwargs.update(
-                    {'infilter': 'Text (encoded):UTF8,LF,,,'}
-                )
+                if self.mime_type == 'text/plain':
+                    kwargs.update(
+                        {'infilter': 'Text (encoded):UTF8,LF,,,'}
+                    )
 
-            try:
-                self.command_libreoffice(*args, **kwargs)
-            except sh.ErrorReturnCode as exception:
-                temporary_file_object.close()
-                raise OfficeConversionError(exception)
-            except Exception as exception:
-                temporary_file_object.close()
-                logger.error(
-                    'Exception launching LibreOffice; %s', exception,
-                    exc_info=True
-                )
-                raise
-            finally:
-                fs_cleanup(filename=libreoffice_home_directory)
+                try:
+                    self.command_libreoffice(*args, **kwargs)
+                except sh.TimeoutException:
+                    temporary_file_object.close()
+                    # The process was killed, discard the profile in case
+                    # it was left in an inconsistent state.
+                    libreoffice_profile.reset()
+                    raise OfficeConversionError(
+                        _('LibreOffice conversion timed out.')
+                    )
+                except sh.ErrorReturnCode as exception:
+                    temporary_file_object.close()
+                    libreoffice_profile.reset()
+                    raise OfficeConversionError(exception)
+                except Exception as exception:
+                    temporary_file_object.close()
+                    libreoffice_profile.reset()
+                    logger.error(
+                        'Exception launching LibreOffice; %s', exception,
+                        exc_info=True
+                    )
+                    raise
 
             # LibreOffice return a PDF file with the same name as the input
             # provided but with the .pdf extension.
@@ -270,8 +416,18 @@ class ConverterBase:
         if not self.image:
             self.seek_page(page_number=0)
 
+        # Geometric transformations are collected and executed together
+        # only when a transformation that needs the actual pixels is
+        # found or when the list is exhausted.
+        transformation_plan = TransformationPlan(size=self.image.size)
+
         for transformation in transformations:
-            self.image = transformation.execute_on(image=self.image)
+            if not transformation.plan_on(plan=transformation_plan):
+                self.image = transformation_plan.execute_on(image=self.image)
+                self.image = transformation.execute_on(image=self.image)
+                transformation_plan = TransformationPlan(size=self.image.size)
+
+        self.image = transformation_plan.execute_on(image=self.image)
 
 
 class Layer:
@@ -506,3 +662,233 @@ class LayerLinkKwargsFactory:
             }
 
         return get_kwargs
+
+
+class LibreOfficeProfile:
+    """
+    A persistent LibreOffice user installation directory belonging to a
+    slot of a LibreOffice profile pool.
+    """
+    def __init__(self, pool, slot):
+        self.pool = pool
+        self.slot = slot
+        self.path = os.path.join(
+            pool.get_path(), 'profile_{}'.format(slot)
+        )
+
+    def __str__(self):
+        return self.path
+
+    def check(self):
+        """
+        Prepare the profile for a new conversion. The slot lock guarantees
+        no other LibreOffice instance is using the profile, so a user
+        installation lock file left behind by a killed process is stale
+        and is removed.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        fs_cleanup(
+            filename=os.path.join(
+                self.get_user_installation_path(), 'user', '.lock'
+            )
+        )
+
+    def get_user_installation_path(self):
+        return os.path.join(self.path, 'LibreOffice_Conversion')
+
+    def get_user_installation_url(self):
+        return 'file://{}'.format(self.get_user_installation_path())
+
+    def reset(self):
+        """
+        Delete the profile. It will be created again by LibreOffice on the
+        next conversion using this slot.
+        """
+        logger.debug('Resetting LibreOffice profile: %s', self)
+        fs_cleanup(filename=self.path)
+
+
+class LibreOfficeProfilePool:
+    """
+    Pool of reusable LibreOffice user profiles. Creating the user profile
+    is the most expensive part of a LibreOffice cold start. Each slot of
+    the pool keeps its profile between conversions and is guarded by a
+    lock so that at most `size` LibreOffice instances run at the same time
+    per host. Requests wait for a free slot up to `timeout` seconds.
+    """
+    def __init__(self, name, size, timeout):
+        self.name = name
+        self.size = size
+        self.timeout = timeout
+
+    @contextmanager
+    def acquire(self):
+        time_start = time.time()
+
+        while True:
+            for slot in range(self.size):
+                try:
+                    # Allow the lock to outlive a conversion that reaches
+                    # the timeout so that the profile is not reused before
+                    # the process is killed.
+                    lock = LockingBackend.get_backend().acquire_lock(
+                        name=self.get_lock_name(slot=slot),
+                        timeout=self.timeout * 2
+                    )
+                except LockError:
+                    continue
+                else:
+                    try:
+                        libreoffice_profile = LibreOfficeProfile(
+                            pool=self, slot=slot
+                        )
+                        libreoffice_profile.check()
+                        yield libreoffice_profile
+                    finally:
+                        lock.release()
+
+                    return
+
+            if time.time() - time_start > self.timeout:
+                raise OfficeConversionError(
+                    _('Timeout waiting for a free LibreOffice profile.')
+                )
+
+            time.sleep(LIBREOFFICE_PROFILE_POOL_RETRY_DELAY)
+
+    def get_lock_name(self, slot):
+        return 'converter_libreoffice_profile_pool-{}-{}-{}'.format(
+            self.name, platform.node(), slot
+        )
+
+    def get_path(self):
+        return os.path.join(
+            setting_temporary_directory.value,
+            'libreoffice_profile_pool_{}'.format(self.name)
+        )
+
+
+libreoffice_profile_pool = LibreOfficeProfilePool(
+    name='default', size=libreoffice_pool_size, timeout=libreoffice_timeout
+)
+
+
+class TransformationPlan:
+    """
+    Collect consecutive geometric transformations and execute them on the
+    image pixels as a single resample followed by a lossless transposition.
+    Coordinates are tracked as the box of the source image being
+    displayed, the final size and the orientation matrix mapping centered
+    output coordinates to centered source coordinates.
+    """
+    _transpose_matrices = {
+        Image.FLIP_LEFT_RIGHT: ((-1, 0), (0, 1)),
+        Image.FLIP_TOP_BOTTOM: ((1, 0), (0, -1)),
+        Image.ROTATE_90: ((0, -1), (1, 0)),
+        Image.ROTATE_180: ((-1, 0), (0, -1)),
+        Image.ROTATE_270: ((0, 1), (-1, 0)),
+        Image.TRANSPOSE: ((0, 1), (1, 0)),
+        Image.TRANSVERSE: ((0, -1), (-1, 0))
+    }
+
+    def __init__(self, size):
+        self.box = (0, 0, size[0], size[1])
+        self.draft_size = None
+        self.is_cropped = False
+        self.is_relative = False
+        self.matrix = ((1, 0), (0, 1))
+        self.size = tuple(size)
+        self.source_size = tuple(size)
+
+    def crop(self, box):
+        """
+        Crop the planned image using a box in planned image coordinates.
+        """
+        corners = []
+        for x, y in ((box[0], box[1]), (box[2], box[3])):
+            u = 2.0 * x / self.size[0] - 1
+            v = 2.0 * y / self.size[1] - 1
+            corners.append(
+                (
+                    self.matrix[0][0] * u + self.matrix[0][1] * v,
+                    self.matrix[1][0] * u + self.matrix[1][1] * v
+                )
+            )
+
+        box_width = self.box[2] - self.box[0]
+        box_height = self.box[3] - self.box[1]
+
+        self.box = (
+            self.box[0] + (min(corners[0][0], corners[1][0]) + 1) / 2 * box_width,
+            self.box[1] + (min(corners[0][1], corners[1][1]) + 1) / 2 * box_height,
+            self.box[0] + (max(corners[0][0], corners[1][0]) + 1) / 2 * box_width,
+            self.box[1] + (max(corners[0][1], corners[1][1]) + 1) / 2 * box_height
+        )
+        self.is_cropped = True
+        self.size = (box[2] - box[0], box[3] - box[1])
+
+    def execute_on(self, image):
+        size = self.get_source_oriented_size()
+
+        box = self.box
+        box_size = (box[2] - box[0], box[3] - box[1])
+
+        if size == box_size and all(float(value).is_integer() for value in box):
+            box = tuple(int(value) for value in box)
+            if box != (0, 0) + image.size:
+                image = image.crop(box)
+        else:
+            image = image.resize(
+                size=size, resample=Image.ANTIALIAS, box=box,
+                reducing_gap=TRANSFORMATION_PLAN_REDUCING_GAP
+            )
+
+        for method, matrix in self._transpose_matrices.items():
+            if matrix == self.matrix:
+                image = image.transpose(method)
+
+        return image
+
+    def get_draft_size(self):
+        """
+        Return the smallest source image size able to produce the planned
+        image or None if the plan requires the source image at its
+        original size. The transformations are executed again on the
+        reduced image, the size is the one of the last absolute resize
+        found before any size relative to the source image, like a zoom or
+        a crop in source pixel coordinates.
+        """
+        if not self.is_cropped:
+            return self.draft_size
+
+    def get_source_oriented_size(self):
+        if self.matrix[0][0] == 0:
+            return (self.size[1], self.size[0])
+        else:
+            return self.size
+
+    def resize(self, size, relative=False):
+        """
+        Resize the planned image. Relative resizes depend on the size of
+        the source image and stop the draft size from being reduced.
+        """
+        self.size = tuple(size)
+
+        if relative:
+            self.is_relative = True
+        elif not self.is_relative:
+            self.draft_size = self.get_source_oriented_size()
+
+    def transpose(self, method):
+        matrix = self._transpose_matrices[method]
+
+        self.matrix = tuple(
+            tuple(
+                sum(
+                    self.matrix[row][index] * matrix[index][column] for index in range(2)
+                ) for column in range(2)
+            ) for row in range(2)
+        )
+
+        if matrix[0][0] == 0:
+            self.size = (self.size[1], self.size[0])
@@ -73,6 +73,8 @@ DEFAULT_CONVERTER_ASSET_STORAGE_BACKEND_ARGUMENTS = {
     'location': os.path.join(settings.MEDIA_ROOT, 'converter_assets')
 }
 DEFAULT_CONVERTER_GRAPHICS_BACKEND = 'mayan.apps.converter.backends.python.Python'
+DEFAULT_LIBREOFFICE_POOL_SIZE = 2
+DEFAULT_LIBREOFFICE_TIMEOUT = 120  # seconds
 DEFAULT_PAGE_NUMBER = 1
 DEFAULT_PDFTOPPM_DPI = 300
 DEFAULT_PDFTOPPM_FORMAT = 'jpeg'  # Possible values jpeg, png, tiff
@@ -83,6 +85,8 @@ DEFAULT_ZOOM_LEVEL = 100
 
 DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS = {
     'libreoffice_path': DEFAULT_LIBREOFFICE_PATH,
+    'libreoffice_pool_size': DEFAULT_LIBREOFFICE_POOL_SIZE,
+    'libreoffice_timeout': DEFAULT_LIBREOFFICE_TIMEOUT,
     'pdftoppm_dpi': DEFAULT_PDFTOPPM_DPI,
     'pdftoppm_format': DEFAULT_PDFTOPPM_FORMAT,
     'pdftoppm_path': DEFAULT_PDFTOPPM_PATH,
@@ -91,7 +95,30 @@ DEFAULT_CONVERTER_GRAPHICS_BACKEND_ARGUMENTS = {
     'pillow_maximum_image_pixels': DEFAULT_PILLOW_MAXIMUM_IMAGE_PIXELS,
 }
 
+LIBREOFFICE_PROFILE_POOL_RETRY_DELAY = 0.5  # seconds
+
+# Page images with at least this ratio of near black or near white pixels
+# are considered text and encoded losslessly.
+OUTPUT_FORMAT_BILEVEL_RATIO = 0.95
+OUTPUT_FORMAT_BILEVEL_THRESHOLD = 32
+OUTPUT_FORMAT_MIME_TYPES = {
+    'image/jpeg': 'JPEG',
+    'image/png': 'PNG',
+    'image/webp': 'WEBP'
+}
+OUTPUT_FORMAT_PREFERENCE_PHOTOGRAPHIC = ('WEBP', 'JPEG', 'PNG')
+OUTPUT_FORMAT_PREFERENCE_TEXT = ('PNG', 'WEBP', 'JPEG')
+OUTPUT_FORMAT_SAMPLE_SIZE = 256
+
+PDF_OBJECT_READ_SIZE = 4096
+# The end of file marker must appear in the last 1024 bytes, allow for
+# some trailing garbage.
+PDF_TAIL_READ_SIZE = 4096
+
 STORAGE_NAME_ASSETS = 'converter__assets'
 STORAGE_NAME_ASSETS_CACHE = 'converter__assets_cache'
 
 TASK_ASSET_IMAGE_GENERATE_RETRY_DELAY = 10
+
+# Same value used by Pillow thumbnail(), close to a fair resample.
+TRANSFORMATION_PLAN_REDUCING_GAP = 2.0
@@ -31,3 +31,12 @@ TEST_TRANSFORMATION_ROTATE_DEGRESS = 34
 TEST_TRANSFORMATION_ROTATE_NAME = 'rotate'
 TEST_TRANSFORMATION_ZOOM_CACHE_HASH = b'ac7a864de6a95889d5892301e142f8cdc5808f55010c0b820ed056902fc25a73'
 TEST_TRANSFORMATION_ZOOM_PERCENT = 49
+
+TEST_LIBREOFFICE_PROFILE_POOL_NAME = 'test_pool'
+TEST_LIBREOFFICE_PROFILE_POOL_SIZE = 2
+
+TEST_CONVERTER_DRAFT_IMAGE_SIZE = (1200, 1600)
+TEST_TRANSFORMATION_PLAN_IMAGE_SIZE = (301, 173)
+
+TEST_PDF_BENCHMARK_PAGE_COUNT = 2000
+TEST_PDF_PAGE_COUNT = 25
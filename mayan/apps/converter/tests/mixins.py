@@ -1,3 +1,8 @@
+from io import BytesIO
+import zlib
+
+import PyPDF2
+
 from django.core.files import File
 from django.db.models import Q
 
@@ -170,6 +175,112 @@ class LayerTestMixin(PermissionTestMixin):
         super().tearDown()
 
 
+class PDFTestMixin:
+    def _create_test_pdf(self, page_count):
+        """
+        Create a PDF with a classic cross reference table.
+        """
+        pdf_writer = PyPDF2.PdfFileWriter()
+        for page_number in range(page_count):
+            pdf_writer.addBlankPage(width=612, height=792)
+
+        self.test_pdf_file_object = BytesIO()
+        pdf_writer.write(stream=self.test_pdf_file_object)
+        self.test_pdf_file_object.seek(0)
+
+    def _create_test_pdf_with_cross_reference_stream(self, page_count):
+        """
+        Create a PDF storing all its objects in a compressed object stream
+        indexed by a cross reference stream using the PNG up predictor.
+        """
+        page_numbers = range(3, page_count + 3)
+        objects = [
+            b'<< /Type /Catalog /Pages 2 0 R >>',
+            '<< /Type /Pages /Kids [{}] /Count {} >>'.format(
+                ' '.join('{} 0 R'.format(number) for number in page_numbers),
+                page_count
+            ).encode()
+        ]
+        objects.extend(
+            [
+                b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] >>'
+            ] * page_count
+        )
+
+        object_stream_header = []
+        object_stream_body = BytesIO()
+        for number, obj in enumerate(objects, 1):
+            object_stream_header.append(
+                '{} {}'.format(number, object_stream_body.tell())
+            )
+            object_stream_body.write(obj + b' ')
+
+        object_stream_header = ' '.join(object_stream_header).encode() + b' '
+        object_stream_data = zlib.compress(
+            object_stream_header + object_stream_body.getvalue()
+        )
+
+        object_stream_number = len(objects) + 1
+        cross_reference_stream_number = len(objects) + 2
+
+        self.test_pdf_file_object = BytesIO()
+        self.test_pdf_file_object.write(b'%PDF-1.5\n')
+
+        object_stream_offset = self.test_pdf_file_object.tell()
+        self.test_pdf_file_object.write(
+            '{} 0 obj\n<< /Type /ObjStm /N {} /First {} /Length {} '
+            '/Filter /FlateDecode >>\nstream\n'.format(
+                object_stream_number, len(objects),
+                len(object_stream_header), len(object_stream_data)
+            ).encode()
+        )
+        self.test_pdf_file_object.write(object_stream_data)
+        self.test_pdf_file_object.write(b'\nendstream\nendobj\n')
+
+        cross_reference_stream_offset = self.test_pdf_file_object.tell()
+
+        entries = [(0, 0, 65535)]
+        entries.extend(
+            [(2, object_stream_number, index) for index in range(len(objects))]
+        )
+        entries.append((1, object_stream_offset, 0))
+        entries.append((1, cross_reference_stream_offset, 0))
+
+        rows = [
+            bytes((entry_type,)) + field_1.to_bytes(4, 'big') + field_2.to_bytes(2, 'big')
+            for entry_type, field_1, field_2 in entries
+        ]
+
+        previous_row = bytes(7)
+        predicted_data = BytesIO()
+        for row in rows:
+            predicted_data.write(b'\x02')
+            predicted_data.write(
+                bytes(
+                    (value - previous) & 0xff for value, previous in zip(row, previous_row)
+                )
+            )
+            previous_row = row
+
+        cross_reference_stream_data = zlib.compress(predicted_data.getvalue())
+
+        self.test_pdf_file_object.write(
+            '{} 0 obj\n<< /Type /XRef /Size {} /Root 1 0 R /W [1 4 2] '
+            '/Filter /FlateDecode /DecodeParms << /Columns 7 /Predictor 12 >> '
+            '/Length {} >>\nstream\n'.format(
+                cross_reference_stream_number, len(entries),
+                len(cross_reference_stream_data)
+            ).encode()
+        )
+        self.test_pdf_file_object.write(cross_reference_stream_data)
+        self.test_pdf_file_object.write(
+            '\nendstream\nendobj\nstartxref\n{}\n%%EOF\n'.format(
+                cross_reference_stream_offset
+            ).encode()
+        )
+        self.test_pdf_file_object.seek(0)
+
+
 class TransformationTestMixin(LayerTestMixin):
     auto_create_test_transformation_class = True
 
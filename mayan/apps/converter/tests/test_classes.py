@@ -0,0 +1,269 @@
+from io import BytesIO
+
+from PIL import Image, ImageChops, ImageDraw
+
+from mayan.apps.storage.utils import fs_cleanup
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import (
+    ConverterBase, LibreOfficeProfilePool, TransformationPlan
+)
+from ..exceptions import OfficeConversionError
+from ..transformations import (
+    TransformationCrop, TransformationFlip, TransformationMirror,
+    TransformationResize, TransformationRotate, TransformationRotate90,
+    TransformationZoom
+)
+
+from .literals import (
+    TEST_LIBREOFFICE_PROFILE_POOL_NAME, TEST_LIBREOFFICE_PROFILE_POOL_SIZE,
+    TEST_CONVERTER_DRAFT_IMAGE_SIZE, TEST_TRANSFORMATION_PLAN_IMAGE_SIZE
+)
+
+
+class ConverterBaseDraftTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_file_object = BytesIO()
+        Image.new(mode='RGB', size=TEST_CONVERTER_DRAFT_IMAGE_SIZE).save(
+            self.test_file_object, format='JPEG'
+        )
+        self.test_file_object.seek(0)
+        self.test_converter = ConverterBase.get_converter_class()(
+            file_object=self.test_file_object
+        )
+
+    def _get_test_converter_output_size(self, transformations, draft):
+        self.test_file_object.seek(0)
+        test_converter = ConverterBase.get_converter_class()(
+            file_object=self.test_file_object
+        )
+        if draft:
+            test_converter.seek_page(
+                page_number=0, transformations=transformations
+            )
+        else:
+            test_converter.seek_page(page_number=0)
+
+        test_converter.transform_many(transformations=transformations)
+
+        return test_converter.image.size
+
+    def _test_draft_output_size(self, transformations):
+        self.assertEqual(
+            self._get_test_converter_output_size(
+                draft=True, transformations=transformations
+            ), self._get_test_converter_output_size(
+                draft=False, transformations=transformations
+            )
+        )
+
+    def test_draft_crop_transformation(self):
+        self.test_converter.seek_page(
+            page_number=0, transformations=(
+                TransformationCrop(left='10'),
+                TransformationResize(width=100)
+            )
+        )
+
+        self.assertEqual(
+            self.test_converter.image.size, TEST_CONVERTER_DRAFT_IMAGE_SIZE
+        )
+
+    def test_draft_resize_transformation(self):
+        self.test_converter.seek_page(
+            page_number=0, transformations=(
+                TransformationRotate90(), TransformationResize(width=100)
+            )
+        )
+
+        self.assertTrue(
+            self.test_converter.image.size[0] < TEST_CONVERTER_DRAFT_IMAGE_SIZE[0]
+        )
+
+        self.test_converter.transform_many(
+            transformations=(
+                TransformationRotate90(), TransformationResize(width=100)
+            )
+        )
+
+        self.assertEqual(self.test_converter.image.size[0], 100)
+
+    def test_draft_resize_zoom_output_size(self):
+        self._test_draft_output_size(
+            transformations=(
+                TransformationResize(width=300),
+                TransformationZoom(percent=50)
+            )
+        )
+
+    def test_draft_rotate_resize_zoom_output_size(self):
+        self._test_draft_output_size(
+            transformations=(
+                TransformationRotate(degrees=0),
+                TransformationResize(width=600),
+                TransformationZoom(percent=25)
+            )
+        )
+
+    def test_draft_zoom_output_size(self):
+        self._test_draft_output_size(
+            transformations=(TransformationZoom(percent=50),)
+        )
+
+    def test_draft_zoom_resize_output_size(self):
+        self._test_draft_output_size(
+            transformations=(
+                TransformationZoom(percent=50),
+                TransformationResize(width=100)
+            )
+        )
+
+
+class ConverterBaseOutputFormatTestCase(BaseTestCase):
+    def _get_test_converter(self, image):
+        test_file_object = BytesIO()
+        image.save(test_file_object, format='PNG')
+        test_file_object.seek(0)
+
+        return ConverterBase.get_converter_class()(
+            file_object=test_file_object
+        )
+
+    def test_photographic_image(self):
+        test_image = Image.linear_gradient(mode='L').convert('RGB')
+        test_converter = self._get_test_converter(image=test_image)
+
+        self.assertEqual(
+            test_converter.get_output_format(
+                output_formats=('JPEG', 'PNG', 'WEBP')
+            ), 'WEBP'
+        )
+        self.assertEqual(
+            test_converter.get_output_format(output_formats=('JPEG', 'PNG')),
+            'JPEG'
+        )
+
+    def test_text_image(self):
+        test_image = Image.new(mode='RGB', size=(400, 600), color='white')
+        draw = ImageDraw.Draw(test_image)
+        draw.text(xy=(20, 20), text='Test text', fill='black')
+        test_converter = self._get_test_converter(image=test_image)
+
+        self.assertEqual(
+            test_converter.get_output_format(
+                output_formats=('JPEG', 'PNG', 'WEBP')
+            ), 'PNG'
+        )
+
+        image_buffer = test_converter.get_page(output_formats=('PNG',))
+        self.assertEqual(Image.open(fp=image_buffer).format, 'PNG')
+
+
+class LibreOfficeProfilePoolTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_libreoffice_profile_pool = LibreOfficeProfilePool(
+            name=TEST_LIBREOFFICE_PROFILE_POOL_NAME,
+            size=TEST_LIBREOFFICE_PROFILE_POOL_SIZE, timeout=0
+        )
+
+    def tearDown(self):
+        fs_cleanup(filename=self.test_libreoffice_profile_pool.get_path())
+
+        super().tearDown()
+
+    def test_profile_reuse(self):
+        with self.test_libreoffice_profile_pool.acquire() as libreoffice_profile:
+            test_profile_path = libreoffice_profile.path
+
+        with self.test_libreoffice_profile_pool.acquire() as libreoffice_profile:
+            self.assertEqual(libreoffice_profile.path, test_profile_path)
+
+    def test_profile_concurrent_use(self):
+        with self.test_libreoffice_profile_pool.acquire() as libreoffice_profile_1:
+            with self.test_libreoffice_profile_pool.acquire() as libreoffice_profile_2:
+                self.assertNotEqual(
+                    libreoffice_profile_1.path, libreoffice_profile_2.path
+                )
+
+    def test_pool_exhausted(self):
+        with self.test_libreoffice_profile_pool.acquire():
+            with self.test_libreoffice_profile_pool.acquire():
+                with self.assertRaises(expected_exception=OfficeConversionError):
+                    with self.test_libreoffice_profile_pool.acquire():
+                        """Pool exhausted."""
+
+
+class TransformationPlanTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_image = Image.new(
+            mode='RGB', size=TEST_TRANSFORMATION_PLAN_IMAGE_SIZE
+        )
+        draw = ImageDraw.Draw(self.test_image)
+        draw.rectangle((10, 20, 60, 40), fill=(255, 0, 0))
+        draw.rectangle((200, 100, 280, 160), fill=(0, 255, 0))
+
+    def _execute_test_transformations(self, transformations):
+        sequential_image = self.test_image.copy()
+        for transformation in transformations:
+            sequential_image = transformation.execute_on(
+                image=sequential_image
+            )
+
+        transformation_plan = TransformationPlan(size=self.test_image.size)
+        for transformation in transformations:
+            self.assertTrue(
+                transformation.plan_on(plan=transformation_plan)
+            )
+
+        planned_image = transformation_plan.execute_on(
+            image=self.test_image.copy()
+        )
+
+        return sequential_image, planned_image
+
+    def test_lossless_transformations(self):
+        sequential_image, planned_image = self._execute_test_transformations(
+            transformations=(
+                TransformationRotate90(), TransformationMirror(),
+                TransformationCrop(left='10', top='5', right='30'),
+                TransformationFlip()
+            )
+        )
+
+        self.assertEqual(planned_image.size, sequential_image.size)
+        self.assertEqual(
+            ImageChops.difference(planned_image, sequential_image).getbbox(),
+            None
+        )
+
+    def test_no_op_transformations(self):
+        test_image = self.test_image.copy()
+
+        transformation_plan = TransformationPlan(size=test_image.size)
+        TransformationRotate(degrees=360).plan_on(plan=transformation_plan)
+        TransformationZoom(percent=100).plan_on(plan=transformation_plan)
+
+        self.assertTrue(
+            transformation_plan.execute_on(image=test_image) is test_image
+        )
+
+    def test_non_right_angle_rotation(self):
+        transformation_plan = TransformationPlan(size=self.test_image.size)
+
+        self.assertFalse(
+            TransformationRotate(degrees=45).plan_on(plan=transformation_plan)
+        )
+
+    def test_resample_transformations(self):
+        sequential_image, planned_image = self._execute_test_transformations(
+            transformations=(
+                TransformationRotate(degrees=90),
+                TransformationResize(width=100, height=100),
+                TransformationZoom(percent=150)
+            )
+        )
+
+        self.assertEqual(planned_image.size, sequential_image.size)
@@ -0,0 +1,116 @@
+from io import BytesIO
+import logging
+import time
+
+from django.test import tag
+
+import PyPDF2
+
+from mayan.apps.documents.tests.literals import TEST_DOCUMENT_PATH
+from mayan.apps.testing.literals import EXCLUDE_TEST_TAG
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..exceptions import PageCountError
+from ..utils import get_accepted_output_formats, get_pdf_page_count
+
+from .literals import TEST_PDF_BENCHMARK_PAGE_COUNT, TEST_PDF_PAGE_COUNT
+from .mixins import PDFTestMixin
+
+logger = logging.getLogger(name=__name__)
+
+
+class AcceptedOutputFormatsTestCase(BaseTestCase):
+    def test_any_media_type(self):
+        self.assertEqual(get_accepted_output_formats(accept='*/*'), None)
+
+    def test_browser_media_types(self):
+        self.assertEqual(
+            get_accepted_output_formats(
+                accept='image/webp,image/apng,image/*,*/*;q=0.8'
+            ), ['JPEG', 'PNG', 'WEBP']
+        )
+
+    def test_no_header(self):
+        self.assertEqual(get_accepted_output_formats(accept=None), None)
+
+    def test_rejected_media_type(self):
+        self.assertEqual(
+            get_accepted_output_formats(accept='image/png, image/webp;q=0'),
+            ['PNG']
+        )
+
+
+class PDFPageCountTestCase(PDFTestMixin, BaseTestCase):
+    def test_cross_reference_stream(self):
+        self._create_test_pdf_with_cross_reference_stream(
+            page_count=TEST_PDF_PAGE_COUNT
+        )
+
+        self.assertEqual(
+            get_pdf_page_count(file_object=self.test_pdf_file_object),
+            TEST_PDF_PAGE_COUNT
+        )
+
+        self.test_pdf_file_object.seek(0)
+        self.assertEqual(
+            PyPDF2.PdfFileReader(
+                stream=self.test_pdf_file_object, strict=False
+            ).getNumPages(), TEST_PDF_PAGE_COUNT
+        )
+
+    def test_cross_reference_table(self):
+        self._create_test_pdf(page_count=TEST_PDF_PAGE_COUNT)
+
+        self.assertEqual(
+            get_pdf_page_count(file_object=self.test_pdf_file_object),
+            TEST_PDF_PAGE_COUNT
+        )
+
+    def test_document(self):
+        with open(file=TEST_DOCUMENT_PATH, mode='rb') as file_object:
+            page_count = get_pdf_page_count(file_object=file_object)
+
+            file_object.seek(0)
+            self.assertEqual(
+                page_count, PyPDF2.PdfFileReader(
+                    stream=file_object, strict=False
+                ).getNumPages()
+            )
+
+    def test_invalid_file(self):
+        with self.assertRaises(expected_exception=PageCountError):
+            get_pdf_page_count(file_object=BytesIO(b'%PDF-1.4\n%%EOF\n'))
+
+
+@tag('benchmark', EXCLUDE_TEST_TAG)
+class PDFPageCountBenchmarkTestCase(PDFTestMixin, BaseTestCase):
+    def _benchmark_page_count(self):
+        start_time = time.perf_counter()
+        page_count = get_pdf_page_count(file_object=self.test_pdf_file_object)
+        page_tree_root_time = time.perf_counter() - start_time
+
+        self.assertEqual(page_count, TEST_PDF_BENCHMARK_PAGE_COUNT)
+
+        self.test_pdf_file_object.seek(0)
+        start_time = time.perf_counter()
+        page_count = PyPDF2.PdfFileReader(
+            stream=self.test_pdf_file_object, strict=False
+        ).getNumPages()
+        pypdf2_time = time.perf_counter() - start_time
+
+        self.assertEqual(page_count, TEST_PDF_BENCHMARK_PAGE_COUNT)
+
+        logger.debug(
+            '%s: page tree root: %.4fs, PyPDF2: %.4fs',
+            self._testMethodName, page_tree_root_time, pypdf2_time
+        )
+
+    def test_cross_reference_stream_benchmark(self):
+        self._create_test_pdf_with_cross_reference_stream(
+            page_count=TEST_PDF_BENCHMARK_PAGE_COUNT
+        )
+        self._benchmark_page_count()
+
+    def test_cross_reference_table_benchmark(self):
+        self._create_test_pdf(page_count=TEST_PDF_BENCHMARK_PAGE_COUNT)
+        self._benchmark_page_count()
@@ -1,5 +1,6 @@
 import hashlib
 import logging
+import math
 
 from PIL import Image, ImageColor, ImageDraw, ImageFilter
 
@@ -29,14 +30,16 @@ class BaseTransformation(metaclass=BaseTransformationType):
     _registry = {}
 
     @staticmethod
-    def combine(transformations):
-        result = None
+    def combine(transformations, output_formats=None):
+        result = hashlib.sha256()
 
         for transformation in transformations:
-            if not result:
-                result = hashlib.sha256(transformation.cache_hash())
-            else:
-                result.update(transformation.cache_hash())
+            result.update(transformation.cache_hash())
+
+        if output_formats:
+            # Images encoded with different format choices must not share
+            # cache entries.
+            result.update(force_bytes(s=','.join(output_formats)))
 
         return result.hexdigest()
 
@@ -125,6 +128,14 @@ class BaseTransformation(metaclass=BaseTransformationType):
         self.image = image
         self.aspect = 1.0 * image.size[0] / image.size[1]
 
+    def plan_on(self, plan):
+        """
+        Add the transformation to a plan of geometric transformations.
+        Return False if the transformation needs the image pixels and
+        must be executed on its own.
+        """
+        return False
+
 
 class AssertTransformationMixin:
     @classmethod
@@ -353,6 +364,9 @@ class TransformationCrop(BaseTransformation):
     def execute_on(self, *args, **kwargs):
         super().execute_on(*args, **kwargs)
 
+        return self.image.crop(self.get_crop_box(size=self.image.size))
+
+    def get_crop_box(self, size):
         try:
             left = int(self.left or '0')
         except ValueError:
@@ -376,26 +390,26 @@ class TransformationCrop(BaseTransformation):
         if left < 0:
             left = 0
 
-        if left > self.image.size[0] - 1:
-            left = self.image.size[0] - 1
+        if left > size[0] - 1:
+            left = size[0] - 1
 
         if top < 0:
             top = 0
 
-        if top > self.image.size[1] - 1:
-            top = self.image.size[1] - 1
+        if top > size[1] - 1:
+            top = size[1] - 1
 
         if right < 0:
             right = 0
 
-        if right > self.image.size[0] - 1:
-            right = self.image.size[0] - 1
+        if right > size[0] - 1:
+            right = size[0] - 1
 
         if bottom < 0:
             bottom = 0
 
-        if bottom > self.image.size[1] - 1:
-            bottom = self.image.size[1] - 1
+        if bottom > size[1] - 1:
+            bottom = size[1] - 1
 
         # Invert right value
         # Pillow uses left, top, right, bottom to define a viewport
@@ -403,8 +417,8 @@ class TransformationCrop(BaseTransformation):
         # We invert the right and bottom to define a viewport
         # that can crop from the right and bottom borders without
         # having to know the real dimensions of an image
-        right = self.image.size[0] - right
-        bottom = self.image.size[1] - bottom
+        right = size[0] - right
+        bottom = size[1] - bottom
 
         if left > right:
             left = right - 1
@@ -417,7 +431,11 @@ class TransformationCrop(BaseTransformation):
             bottom
         )
 
-        return self.image.crop((left, top, right, bottom))
+        return (left, top, right, bottom)
+
+    def plan_on(self, plan):
+        plan.crop(box=self.get_crop_box(size=plan.size))
+        return True
 
 
 class TransformationDrawRectangle(BaseTransformation):
@@ -632,6 +650,10 @@ class TransformationFlip(BaseTransformation):
 
         return self.image.transpose(Image.FLIP_TOP_BOTTOM)
 
+    def plan_on(self, plan):
+        plan.transpose(method=Image.FLIP_TOP_BOTTOM)
+        return True
+
 
 class TransformationGaussianBlur(BaseTransformation):
     arguments = ('radius',)
@@ -664,6 +686,10 @@ class TransformationMirror(BaseTransformation):
 
         return self.image.transpose(Image.FLIP_LEFT_RIGHT)
 
+    def plan_on(self, plan):
+        plan.transpose(method=Image.FLIP_LEFT_RIGHT)
+        return True
+
 
 class TransformationResize(BaseTransformation):
     arguments = ('width', 'height')
@@ -691,6 +717,41 @@ class TransformationResize(BaseTransformation):
 
         return self.image
 
+    def get_thumbnail_size(self, size):
+        """
+        Calculate the final size of the image the same way Pillow's
+        thumbnail() does, without resampling the image.
+        """
+        aspect = 1.0 * size[0] / size[1]
+
+        width = int(self.width)
+        height = int(self.height or 1.0 * width / aspect)
+
+        if width >= size[0] and height >= size[1]:
+            return size
+
+        def round_aspect(number, key):
+            return max(
+                min(math.floor(number), math.ceil(number), key=key), 1
+            )
+
+        if width / height >= aspect:
+            width = round_aspect(
+                number=height * aspect,
+                key=lambda n: abs(aspect - n / height)
+            )
+        else:
+            height = round_aspect(
+                number=width / aspect,
+                key=lambda n: abs(aspect - width / n)
+            )
+
+        return (width, height)
+
+    def plan_on(self, plan):
+        plan.resize(size=self.get_thumbnail_size(size=plan.size))
+        return True
+
 
 class TransformationRotate(BaseTransformation):
     arguments = ('degrees', 'fillcolor')
@@ -716,6 +777,24 @@ class TransformationRotate(BaseTransformation):
             fillcolor=fillcolor
         )
 
+    def plan_on(self, plan):
+        self.degrees %= 360
+
+        if self.degrees == 0:
+            return True
+
+        # Right angle rotations are lossless transpositions, other
+        # angles need the pixels.
+        method = {
+            90: Image.ROTATE_270, 180: Image.ROTATE_180, 270: Image.ROTATE_90
+        }.get(self.degrees)
+
+        if method is None:
+            return False
+
+        plan.transpose(method=method)
+        return True
+
 
 class TransformationRotate90(TransformationRotate):
     arguments = ()
@@ -785,6 +864,19 @@ class TransformationZoom(BaseTransformation):
             ), Image.ANTIALIAS
         )
 
+    def plan_on(self, plan):
+        if self.percent == 100:
+            return True
+
+        decimal_value = float(self.percent) / 100
+        plan.resize(
+            relative=True, size=(
+                int(plan.size[0] * decimal_value),
+                int(plan.size[1] * decimal_value)
+            )
+        )
+        return True
+
 
 BaseTransformation.register(
     layer=layer_decorations, transformation=TransformationAssetPaste
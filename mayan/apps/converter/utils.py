@@ -0,0 +1,531 @@
+import logging
+import os
+import re
+import zlib
+
+from PIL import Image, features
+
+from django.utils.translation import ugettext_lazy as _
+
+from .exceptions import PageCountError
+from .literals import (
+    OUTPUT_FORMAT_MIME_TYPES, PDF_OBJECT_READ_SIZE, PDF_TAIL_READ_SIZE
+)
+
+logger = logging.getLogger(name=__name__)
+
+REGEX_PDF_CROSS_REFERENCE_ENTRY = re.compile(pattern=rb'(\d{10}) (\d{5}) ([fn])')
+REGEX_PDF_CROSS_REFERENCE_SUBSECTION = re.compile(
+    pattern=rb'\s*(\d+)[ ]+(\d+)[ \t]*(?:\r\n|\r|\n)'
+)
+REGEX_PDF_DICTIONARY_DELIMITER = re.compile(pattern=rb'<<|>>')
+REGEX_PDF_OBJECT_HEADER = re.compile(pattern=rb'\s*(\d+)\s+(\d+)\s+obj')
+REGEX_PDF_STARTXREF = re.compile(pattern=rb'startxref\s+(\d+)')
+REGEX_PDF_STREAM_START = re.compile(pattern=rb'\s*stream(?:\r\n|\n|\r)')
+
+
+def get_accepted_output_formats(accept):
+    """
+    Return the sorted list of image output formats allowed by the value of
+    an HTTP Accept header. Returns None if the header does not mention
+    image types, in which case the default output format is to be used.
+    """
+    accepted_mime_types = set()
+
+    for media_range in (accept or '').split(','):
+        parameters = media_range.split(';')
+        quality = 1.0
+
+        for parameter in parameters[1:]:
+            name, separator, value = parameter.partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    """Ignore invalid quality values."""
+
+        if quality > 0:
+            accepted_mime_types.add(parameters[0].strip().lower())
+
+    if 'image/*' in accepted_mime_types:
+        # Formats every image client is expected to support.
+        accepted_mime_types.update(('image/jpeg', 'image/png'))
+
+    output_formats = [
+        output_format for mime_type, output_format in OUTPUT_FORMAT_MIME_TYPES.items()
+        if mime_type in accepted_mime_types
+    ]
+
+    if 'WEBP' in output_formats and not features.check('webp'):
+        output_formats.remove('WEBP')
+
+    return sorted(output_formats) or None
+
+
+def get_image_mime_type(file_object):
+    """
+    Return the MIME type of an image file reading only its header.
+    """
+    try:
+        return Image.MIME.get(Image.open(fp=file_object).format)
+    except IOError:
+        return None
+    finally:
+        file_object.seek(0)
+
+
+def get_pdf_page_count(file_object):
+    """
+    Return the page count of a PDF file reading only the cross reference
+    sections, the document catalog and the root of the page tree instead
+    of parsing the entire object tree. Raises PageCountError when the
+    file structure can't be read this way so that the caller can use a
+    full parser instead.
+    """
+    try:
+        return PDFPageCountReader(file_object=file_object).get_page_count()
+    except PageCountError:
+        raise
+    except Exception as exception:
+        raise PageCountError(
+            _('Unable to read the PDF page tree; %s') % exception
+        )
+
+
+class PDFPageCountReader:
+    @staticmethod
+    def decode_png_predictor(data, columns):
+        """
+        Reverse the PNG row filters used by cross reference streams.
+        """
+        row_size = columns + 1
+        previous_row = bytearray(columns)
+        result = bytearray()
+
+        for row_start in range(0, len(data), row_size):
+            filter_type = data[row_start]
+            row = bytearray(data[row_start + 1:row_start + row_size])
+
+            for index in range(len(row)):
+                left = row[index - 1] if index else 0
+                up = previous_row[index]
+                if filter_type == 1:
+                    row[index] = (row[index] + left) & 0xff
+                elif filter_type == 2:
+                    row[index] = (row[index] + up) & 0xff
+                elif filter_type == 3:
+                    row[index] = (row[index] + (left + up) // 2) & 0xff
+                elif filter_type == 4:
+                    up_left = previous_row[index - 1] if index else 0
+                    estimate = left + up - up_left
+                    distances = (
+                        abs(estimate - left), abs(estimate - up),
+                        abs(estimate - up_left)
+                    )
+                    if distances[0] <= distances[1] and distances[0] <= distances[2]:
+                        predictor = left
+                    elif distances[1] <= distances[2]:
+                        predictor = up
+                    else:
+                        predictor = up_left
+                    row[index] = (row[index] + predictor) & 0xff
+                elif filter_type != 0:
+                    raise PageCountError(
+                        'Unsupported PNG predictor: {}'.format(filter_type)
+                    )
+
+            result.extend(row)
+            previous_row = row
+
+        return bytes(result)
+
+    @staticmethod
+    def get_dictionary(data, start=0):
+        """
+        Return the first complete dictionary found in the data or None if
+        the dictionary is not terminated inside the data.
+        """
+        position = data.find(b'<<', start)
+        if position == -1:
+            raise PageCountError('Dictionary not found.')
+
+        depth = 0
+        for match in REGEX_PDF_DICTIONARY_DELIMITER.finditer(data, position):
+            if match.group() == b'<<':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return data[position:match.end()]
+
+    @staticmethod
+    def get_dictionary_integer(dictionary, key):
+        match = re.search(
+            pattern=rb'/' + key + rb'\s+(\d+)(?![\d.]|\s+\d+\s+R)',
+            string=PDFPageCountReader.get_dictionary_top_level(
+                dictionary=dictionary
+            )
+        )
+        if match:
+            return int(match.group(1))
+
+    @staticmethod
+    def get_dictionary_reference(dictionary, key):
+        match = re.search(
+            pattern=rb'/' + key + rb'\s+(\d+)\s+(\d+)\s+R',
+            string=PDFPageCountReader.get_dictionary_top_level(
+                dictionary=dictionary
+            )
+        )
+        if match:
+            return int(match.group(1))
+
+    @staticmethod
+    def get_dictionary_top_level(dictionary):
+        """
+        Remove the nested dictionaries to avoid matching their keys.
+        """
+        result = []
+        depth = 0
+        last_position = 0
+
+        for match in REGEX_PDF_DICTIONARY_DELIMITER.finditer(dictionary):
+            if match.group() == b'<<':
+                depth += 1
+                if depth == 1:
+                    last_position = match.end()
+                elif depth == 2:
+                    result.append(dictionary[last_position:match.start()])
+            else:
+                if depth == 2:
+                    last_position = match.end()
+                elif depth == 1:
+                    result.append(dictionary[last_position:match.start()])
+                depth -= 1
+
+        return b' '.join(result)
+
+    def __init__(self, file_object):
+        self.cross_reference_sections = []
+        self.file_object = file_object
+        self.file_object.seek(0, os.SEEK_END)
+        self.size = self.file_object.tell()
+
+    def get_cross_reference_entry(self, number):
+        """
+        Return a tuple with the entry type and the two entry fields of the
+        newest cross reference section defining the object.
+        """
+        for section in self.cross_reference_sections:
+            start, count = section['start'], section['count']
+            if not start <= number < start + count:
+                continue
+
+            if section['type'] == 'table':
+                entry = self.read(
+                    offset=section['position'] + (number - start) * section['entry_size'],
+                    size=20
+                )
+                match = REGEX_PDF_CROSS_REFERENCE_ENTRY.match(entry)
+                if not match:
+                    raise PageCountError('Invalid cross reference entry.')
+
+                if match.group(3) == b'n':
+                    return 1, int(match.group(1)), int(match.group(2))
+                else:
+                    return 0, 0, 0
+            else:
+                widths = section['widths']
+                position = section['position'] + (number - start) * sum(widths)
+                fields = []
+                for width in widths:
+                    fields.append(
+                        int.from_bytes(
+                            section['data'][position:position + width],
+                            byteorder='big'
+                        )
+                    )
+                    position += width
+
+                if not widths[0]:
+                    # Type field omitted, defaults to uncompressed object.
+                    fields[0] = 1
+
+                return tuple(fields)
+
+        raise PageCountError(
+            'Object {} not found in the cross reference.'.format(number)
+        )
+
+    def get_object(self, number):
+        """
+        Return the data of an object starting at its value.
+        """
+        entry_type, field_1, field_2 = self.get_cross_reference_entry(
+            number=number
+        )
+
+        if entry_type == 1:
+            data = self.read(offset=field_1, size=PDF_OBJECT_READ_SIZE)
+            match = REGEX_PDF_OBJECT_HEADER.match(data)
+            if not match or int(match.group(1)) != number:
+                raise PageCountError(
+                    'Object {} not found at its offset.'.format(number)
+                )
+            return field_1 + match.end(), data[match.end():]
+        elif entry_type == 2:
+            offset, data = self.get_object(number=field_1)
+            dictionary, stream = self.read_stream(
+                offset=offset, data=data
+            )
+            first = self.get_dictionary_integer(
+                dictionary=dictionary, key=b'First'
+            )
+            header = stream[:first].split()
+            for index in range(0, len(header), 2):
+                if int(header[index]) == number:
+                    return None, stream[first + int(header[index + 1]):]
+
+        raise PageCountError('Object {} is not in use.'.format(number))
+
+    def get_object_dictionary(self, number):
+        offset, data = self.get_object(number=number)
+        dictionary = self.get_dictionary(data=data)
+
+        # Read larger chunks of objects stored directly in the file until
+        # the dictionary is complete.
+        size = PDF_OBJECT_READ_SIZE
+        while dictionary is None and offset is not None and size < self.size:
+            size *= 4
+            dictionary = self.get_dictionary(
+                data=self.read(offset=offset, size=size)
+            )
+
+        if dictionary is None:
+            raise PageCountError(
+                'Unterminated dictionary in object {}.'.format(number)
+            )
+
+        return dictionary
+
+    def get_page_count(self):
+        trailer = self.load_cross_references(offset=self.get_startxref())
+
+        root_number = self.get_dictionary_reference(
+            dictionary=trailer, key=b'Root'
+        )
+        catalog = self.get_object_dictionary(number=root_number)
+
+        pages_number = self.get_dictionary_reference(
+            dictionary=catalog, key=b'Pages'
+        )
+        pages = self.get_object_dictionary(number=pages_number)
+
+        if not re.search(pattern=rb'/Type\s*/Pages(?![\w])', string=pages):
+            raise PageCountError('Page tree root not found.')
+
+        page_count = self.get_dictionary_integer(
+            dictionary=pages, key=b'Count'
+        )
+
+        if page_count is None:
+            count_number = self.get_dictionary_reference(
+                dictionary=pages, key=b'Count'
+            )
+            if count_number is None:
+                raise PageCountError('Page tree root has no page count.')
+
+            offset, data = self.get_object(number=count_number)
+            page_count = int(data.split()[0])
+
+        return page_count
+
+    def get_startxref(self):
+        tail_offset = max(0, self.size - PDF_TAIL_READ_SIZE)
+        tail = self.read(offset=tail_offset, size=PDF_TAIL_READ_SIZE)
+
+        position = tail.rfind(b'startxref')
+        if position == -1:
+            raise PageCountError('startxref not found.')
+
+        match = REGEX_PDF_STARTXREF.match(tail, position)
+        if not match:
+            raise PageCountError('Invalid startxref.')
+
+        return int(match.group(1))
+
+    def load_cross_reference_stream(self, offset, data):
+        match = REGEX_PDF_OBJECT_HEADER.match(data)
+        if not match:
+            raise PageCountError('Cross reference stream not found.')
+
+        dictionary, stream = self.read_stream(
+            offset=offset + match.end(), data=data[match.end():]
+        )
+
+        widths = [
+            int(value) for value in re.search(
+                pattern=rb'/W\s*\[([\d\s]+)\]', string=dictionary
+            ).group(1).split()
+        ]
+
+        index_match = re.search(
+            pattern=rb'/Index\s*\[([\d\s]+)\]', string=dictionary
+        )
+        if index_match:
+            index = [int(value) for value in index_match.group(1).split()]
+        else:
+            index = [
+                0, self.get_dictionary_integer(
+                    dictionary=dictionary, key=b'Size'
+                )
+            ]
+
+        position = 0
+        for start, count in zip(index[0::2], index[1::2]):
+            self.cross_reference_sections.append(
+                {
+                    'count': count, 'data': stream, 'position': position,
+                    'start': start, 'type': 'stream', 'widths': widths
+                }
+            )
+            position += count * sum(widths)
+
+        return dictionary
+
+    def load_cross_reference_table(self, offset):
+        position = offset + len(b'xref')
+
+        while True:
+            data = self.read(offset=position, size=PDF_OBJECT_READ_SIZE)
+            if data.lstrip().startswith(b'trailer'):
+                dictionary = self.get_dictionary(data=data)
+                if dictionary is None:
+                    raise PageCountError('Unterminated trailer.')
+                return dictionary
+
+            match = REGEX_PDF_CROSS_REFERENCE_SUBSECTION.match(data)
+            if not match:
+                raise PageCountError('Invalid cross reference subsection.')
+
+            start, count = int(match.group(1)), int(match.group(2))
+
+            # Entries are 20 bytes long, some writers use a single byte
+            # end of line marker instead of two.
+            entry = data[match.end():match.end() + 20]
+            if entry[18:20] in (b' \n', b' \r', b'\r\n'):
+                entry_size = 20
+            else:
+                entry_size = 19
+
+            self.cross_reference_sections.append(
+                {
+                    'count': count, 'entry_size': entry_size,
+                    'position': position + match.end(), 'start': start,
+                    'type': 'table'
+                }
+            )
+            position += match.end() + count * entry_size
+
+    def load_cross_references(self, offset):
+        """
+        Load the cross reference sections following the chain of
+        previous sections and return the newest trailer dictionary.
+        """
+        offsets = set()
+        trailer = None
+
+        while offset is not None and offset not in offsets:
+            offsets.add(offset)
+
+            data = self.read(offset=offset, size=PDF_OBJECT_READ_SIZE)
+            stripped_data = data.lstrip()
+            if stripped_data.startswith(b'xref'):
+                dictionary = self.load_cross_reference_table(
+                    offset=offset + len(data) - len(stripped_data)
+                )
+
+                # Hybrid files store additional entries in a cross
+                # reference stream.
+                stream_offset = self.get_dictionary_integer(
+                    dictionary=dictionary, key=b'XRefStm'
+                )
+                if stream_offset is not None:
+                    self.load_cross_reference_stream(
+                        offset=stream_offset, data=self.read(
+                            offset=stream_offset, size=PDF_OBJECT_READ_SIZE
+                        )
+                    )
+            else:
+                dictionary = self.load_cross_reference_stream(
+                    offset=offset, data=data
+                )
+
+            if trailer is None:
+                trailer = dictionary
+
+            offset = self.get_dictionary_integer(
+                dictionary=dictionary, key=b'Prev'
+            )
+
+        return trailer
+
+    def read(self, offset, size):
+        self.file_object.seek(offset)
+        return self.file_object.read(size)
+
+    def read_stream(self, offset, data):
+        """
+        Return the dictionary and the decoded content of the stream object
+        whose value starts at the offset.
+        """
+        dictionary = self.get_dictionary(data=data)
+        if dictionary is None:
+            raise PageCountError('Unterminated stream dictionary.')
+
+        match = REGEX_PDF_STREAM_START.match(
+            data, data.find(dictionary) + len(dictionary)
+        )
+        if not match:
+            raise PageCountError('Stream data not found.')
+
+        position = match.end()
+
+        if re.search(pattern=rb'/Filter\s*\[?\s*/FlateDecode', string=dictionary):
+            decompressor = zlib.decompressobj()
+            chunks = [decompressor.decompress(data[position:])]
+
+            if offset is not None:
+                position = offset + len(data)
+                while not decompressor.eof:
+                    chunk = self.read(offset=position, size=PDF_OBJECT_READ_SIZE)
+                    if not chunk:
+                        raise PageCountError('Unterminated stream.')
+                    chunks.append(decompressor.decompress(chunk))
+                    position += len(chunk)
+
+            if not decompressor.eof:
+                raise PageCountError('Unterminated stream.')
+
+            stream = b''.join(chunks)
+        elif re.search(pattern=rb'/Filter', string=dictionary):
+            raise PageCountError('Unsupported stream filter.')
+        else:
+            length = self.get_dictionary_integer(
+                dictionary=dictionary, key=b'Length'
+            )
+            if length is None:
+                raise PageCountError('Unknown stream length.')
+            if offset is None:
+                stream = data[position:position + length]
+            else:
+                stream = self.read(offset=offset + position, size=length)
+
+        predictor = re.search(pattern=rb'/Predictor\s+(\d+)', string=dictionary)
+        if predictor and int(predictor.group(1)) >= 10:
+            columns = re.search(pattern=rb'/Columns\s+(\d+)', string=dictionary)
+            stream = self.decode_png_predictor(
+                data=stream, columns=int(columns.group(1)) if columns else 1
+            )
+
+        return dictionary, stream
@@ -1,9 +1,5 @@
 import logging
 
-from django.conf import settings
-from django.http import HttpResponse
-from django.views.decorators.cache import cache_control, patch_cache_control
-
 from rest_framework import status
 from rest_framework.response import Response
 
@@ -11,7 +7,6 @@ from mayan.apps.rest_api import generics
 from mayan.apps.storage.models import SharedUploadedFile
 from mayan.apps.views.generics import DownloadViewMixin
 
-from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
 from ..permissions import (
     permission_document_file_delete, permission_document_file_download,
     permission_document_file_edit, permission_document_file_new,
@@ -22,11 +17,15 @@ from ..serializers.document_file_serializers import (
 )
 from ..settings import setting_document_file_page_image_cache_time
 from ..tasks import (
-    task_document_file_page_image_generate, task_document_file_upload
+    task_document_file_page_image_generate,
+    task_document_file_page_image_tile_generate,
+    task_document_file_page_image_tile_info, task_document_file_upload
 )
 
 from .mixins import (
-    ParentObjectDocumentAPIViewMixin, ParentObjectDocumentFileAPIViewMixin
+    PageImageAPIViewMixin, PageImageTileAPIViewMixin,
+    PageImageTileInfoAPIViewMixin, ParentObjectDocumentAPIViewMixin,
+    ParentObjectDocumentFileAPIViewMixin
 )
 
 logger = logging.getLogger(name=__name__)
@@ -149,7 +148,8 @@ class APIDocumentFilePageDetailView(
 
 
 class APIDocumentFilePageImageView(
-    ParentObjectDocumentFileAPIViewMixin, generics.RetrieveAPIView
+    ParentObjectDocumentFileAPIViewMixin, PageImageAPIViewMixin,
+    generics.RetrieveAPIView
 ):
     """
     get: Returns an image representation of the selected document.
@@ -158,6 +158,9 @@ class APIDocumentFilePageImageView(
     mayan_object_permissions = {
         'GET': (permission_document_file_view,),
     }
+    page_image_cache_time_setting = setting_document_file_page_image_cache_time
+    page_image_generate_task = task_document_file_page_image_generate
+    page_image_generate_task_page_id_kwarg = 'document_file_page_id'
 
     def get_queryset(self):
         return self.get_document_file().pages.all()
@@ -168,53 +171,54 @@ class APIDocumentFilePageImageView(
     def get_serializer_class(self):
         return None
 
-    @cache_control(private=True)
-    def retrieve(self, request, *args, **kwargs):
-        width = request.GET.get('width')
-        height = request.GET.get('height')
-        zoom = request.GET.get('zoom')
 
-        if zoom:
-            zoom = int(zoom)
+class APIDocumentFilePageImageTileInfoView(
+    ParentObjectDocumentFileAPIViewMixin, PageImageTileInfoAPIViewMixin,
+    generics.RetrieveAPIView
+):
+    """
+    get: Returns the dimensions of the image tile pyramid of the selected document file page.
+    """
+    lookup_url_kwarg = 'document_file_page_id'
+    mayan_object_permissions = {
+        'GET': (permission_document_file_view,),
+    }
+    page_image_generate_task_page_id_kwarg = 'document_file_page_id'
+    page_image_tile_info_task = task_document_file_page_image_tile_info
 
-        rotation = request.GET.get('rotation')
+    def get_queryset(self):
+        return self.get_document_file().pages.all()
 
-        if rotation:
-            rotation = int(rotation)
+    def get_serializer(self, *args, **kwargs):
+        return None
 
-        maximum_layer_order = request.GET.get('maximum_layer_order')
-        if maximum_layer_order:
-            maximum_layer_order = int(maximum_layer_order)
+    def get_serializer_class(self):
+        return None
 
-        task = task_document_file_page_image_generate.apply_async(
-            kwargs={
-                'document_file_page_id': self.get_object().pk,
-                'height': height,
-                'maximum_layer_order': maximum_layer_order,
-                'rotation': rotation,
-                'user_id': request.user.pk,
-                'width': width,
-                'zoom': zoom
-            }
-        )
 
-        kwargs = {'timeout': DOCUMENT_IMAGE_TASK_TIMEOUT}
-        if settings.DEBUG:
-            # In debug more, task are run synchronously, causing this method
-            # to be called inside another task. Disable the check of nested
-            # tasks when using debug mode.
-            kwargs['disable_sync_subtasks'] = False
-
-        cache_filename = task.get(**kwargs)
-        cache_file = self.get_object().cache_partition.get_file(filename=cache_filename)
-        with cache_file.open() as file_object:
-            response = HttpResponse(file_object.read(), content_type='image')
-            if '_hash' in request.GET:
-                patch_cache_control(
-                    response=response,
-                    max_age=setting_document_file_page_image_cache_time.value
-                )
-            return response
+class APIDocumentFilePageImageTileView(
+    ParentObjectDocumentFileAPIViewMixin, PageImageTileAPIViewMixin,
+    generics.RetrieveAPIView
+):
+    """
+    get: Returns a tile of the image pyramid of the selected document file page.
+    """
+    lookup_url_kwarg = 'document_file_page_id'
+    mayan_object_permissions = {
+        'GET': (permission_document_file_view,),
+    }
+    page_image_cache_time_setting = setting_document_file_page_image_cache_time
+    page_image_generate_task_page_id_kwarg = 'document_file_page_id'
+    page_image_tile_generate_task = task_document_file_page_image_tile_generate
+
+    def get_queryset(self):
+        return self.get_document_file().pages.all()
+
+    def get_serializer(self, *args, **kwargs):
+        return None
+
+    def get_serializer_class(self):
+        return None
 
 
 class APIDocumentFilePageListView(
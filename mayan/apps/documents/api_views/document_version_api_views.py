@@ -1,15 +1,10 @@
 import logging
 
-from django.conf import settings
-from django.http import HttpResponse
-from django.views.decorators.cache import cache_control, patch_cache_control
-
 from rest_framework import status
 
 from mayan.apps.rest_api import generics
 from mayan.apps.rest_api.api_view_mixins import ActionAPIViewMixin
 
-from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
 from ..permissions import (
     permission_document_version_create, permission_document_version_delete,
     permission_document_version_edit, permission_document_version_export,
@@ -20,11 +15,15 @@ from ..serializers.document_version_serializers import (
 )
 from ..settings import setting_document_version_page_image_cache_time
 from ..tasks import (
-    task_document_version_export, task_document_version_page_image_generate
+    task_document_version_export, task_document_version_page_image_generate,
+    task_document_version_page_image_tile_generate,
+    task_document_version_page_image_tile_info
 )
 
 from .mixins import (
-    ParentObjectDocumentAPIViewMixin, ParentObjectDocumentVersionAPIViewMixin
+    PageImageAPIViewMixin, PageImageTileAPIViewMixin,
+    PageImageTileInfoAPIViewMixin, ParentObjectDocumentAPIViewMixin,
+    ParentObjectDocumentVersionAPIViewMixin
 )
 
 logger = logging.getLogger(name=__name__)
@@ -139,7 +138,8 @@ class APIDocumentVersionPageDetailView(
 
 
 class APIDocumentVersionPageImageView(
-    ParentObjectDocumentVersionAPIViewMixin, generics.RetrieveAPIView
+    ParentObjectDocumentVersionAPIViewMixin, PageImageAPIViewMixin,
+    generics.RetrieveAPIView
 ):
     """
     get: Returns an image representation of the selected document version page.
@@ -148,6 +148,9 @@ class APIDocumentVersionPageImageView(
     mayan_object_permissions = {
         'GET': (permission_document_version_view,),
     }
+    page_image_cache_time_setting = setting_document_version_page_image_cache_time
+    page_image_generate_task = task_document_version_page_image_generate
+    page_image_generate_task_page_id_kwarg = 'document_version_page_id'
 
     def get_queryset(self):
         return self.get_document_version().pages.all()
@@ -158,50 +161,54 @@ class APIDocumentVersionPageImageView(
     def get_serializer_class(self):
         return None
 
-    @cache_control(private=True)
-    def retrieve(self, request, *args, **kwargs):
-        width = request.GET.get('width')
-        height = request.GET.get('height')
-        zoom = request.GET.get('zoom')
 
-        if zoom:
-            zoom = int(zoom)
+class APIDocumentVersionPageImageTileInfoView(
+    ParentObjectDocumentVersionAPIViewMixin, PageImageTileInfoAPIViewMixin,
+    generics.RetrieveAPIView
+):
+    """
+    get: Returns the dimensions of the image tile pyramid of the selected document version page.
+    """
+    lookup_url_kwarg = 'document_version_page_id'
+    mayan_object_permissions = {
+        'GET': (permission_document_version_view,),
+    }
+    page_image_generate_task_page_id_kwarg = 'document_version_page_id'
+    page_image_tile_info_task = task_document_version_page_image_tile_info
 
-        rotation = request.GET.get('rotation')
+    def get_queryset(self):
+        return self.get_document_version().pages.all()
 
-        if rotation:
-            rotation = int(rotation)
+    def get_serializer(self, *args, **kwargs):
+        return None
 
-        maximum_layer_order = request.GET.get('maximum_layer_order')
-        if maximum_layer_order:
-            maximum_layer_order = int(maximum_layer_order)
+    def get_serializer_class(self):
+        return None
 
-        task = task_document_version_page_image_generate.apply_async(
-            kwargs=dict(
-                document_version_page_id=self.get_object().pk, width=width,
-                height=height, zoom=zoom, rotation=rotation,
-                maximum_layer_order=maximum_layer_order,
-                user_id=request.user.pk
-            )
-        )
 
-        kwargs = {'timeout': DOCUMENT_IMAGE_TASK_TIMEOUT}
-        if settings.DEBUG:
-            # In debug more, task are run synchronously, causing this method
-            # to be called inside another task. Disable the check of nested
-            # tasks when using debug mode.
-            kwargs['disable_sync_subtasks'] = False
-
-        cache_filename = task.get(**kwargs)
-        cache_file = self.get_object().cache_partition.get_file(filename=cache_filename)
-        with cache_file.open() as file_object:
-            response = HttpResponse(file_object.read(), content_type='image')
-            if '_hash' in request.GET:
-                patch_cache_control(
-                    response=response,
-                    max_age=setting_document_version_page_image_cache_time.value
-                )
-            return response
+class APIDocumentVersionPageImageTileView(
+    ParentObjectDocumentVersionAPIViewMixin, PageImageTileAPIViewMixin,
+    generics.RetrieveAPIView
+):
+    """
+    get: Returns a tile of the image pyramid of the selected document version page.
+    """
+    lookup_url_kwarg = 'document_version_page_id'
+    mayan_object_permissions = {
+        'GET': (permission_document_version_view,),
+    }
+    page_image_cache_time_setting = setting_document_version_page_image_cache_time
+    page_image_generate_task_page_id_kwarg = 'document_version_page_id'
+    page_image_tile_generate_task = task_document_version_page_image_tile_generate
+
+    def get_queryset(self):
+        return self.get_document_version().pages.all()
+
+    def get_serializer(self, *args, **kwargs):
+        return None
+
+    def get_serializer_class(self):
+        return None
 
 
 class APIDocumentVersionPageListView(
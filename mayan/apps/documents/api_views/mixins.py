@@ -1,7 +1,25 @@
+import time
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.cache import cache_control, patch_cache_control
+
+from rest_framework.exceptions import NotFound
 from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
 
 from mayan.apps.acls.models import AccessControlList
+from mayan.apps.converter.utils import (
+    get_accepted_output_formats, get_image_mime_type
+)
+from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 
+from ..literals import (
+    DOCUMENT_IMAGE_TASK_TIMEOUT, DOCUMENT_PAGE_IMAGE_SINGLE_FLIGHT_POLL_INTERVAL
+)
 from ..models.document_models import Document
 from ..models.document_type_models import DocumentType
 
@@ -64,3 +82,227 @@ class ParentObjectDocumentVersionAPIViewMixin(ParentObjectDocumentAPIViewMixin):
         return get_object_or_404(
             queryset=queryset, pk=self.kwargs['document_version_id']
         )
+
+
+class PageImageAPIViewMixin:
+    """
+    Return the image of a document file or document version page.
+    Images already present in the page cache partition are returned
+    directly by the web process. On a cache miss, concurrent requests for
+    the same image are coalesced using a lock of the locking backend,
+    shared by all the web processes. Only the request holding the lock
+    dispatches the image generation task, the following requests wait for
+    the lock to be released and return the image generated in the
+    meantime instead of dispatching their own task.
+    """
+    page_image_cache_time_setting = None
+    page_image_generate_task = None
+    page_image_generate_task_page_id_kwarg = None
+
+    def get_page_image_cache_filename(
+        self, combined_cache_filename, page, **kwargs
+    ):
+        single_flight_lock_name = 'single_flight_{}'.format(
+            page.get_lock_name(
+                _combined_cache_filename=combined_cache_filename
+            )
+        )
+
+        task_kwargs = {'timeout': DOCUMENT_IMAGE_TASK_TIMEOUT}
+        if settings.DEBUG:
+            # In debug more, task are run synchronously, causing this method
+            # to be called inside another task. Disable the check of nested
+            # tasks when using debug mode.
+            task_kwargs['disable_sync_subtasks'] = False
+
+        locking_backend = LockingBackend.get_backend()
+        timeout_time = time.time() + DOCUMENT_IMAGE_TASK_TIMEOUT
+        waited = False
+
+        while True:
+            try:
+                lock = locking_backend.acquire_lock(
+                    name=single_flight_lock_name,
+                    timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
+                )
+            except LockError:
+                if time.time() > timeout_time:
+                    # The request in flight is taking too long, don't
+                    # wait for it any longer.
+                    return self.page_image_generate_task_dispatch(
+                        page=page, **kwargs
+                    ).get(**task_kwargs)
+
+                waited = True
+                time.sleep(DOCUMENT_PAGE_IMAGE_SINGLE_FLIGHT_POLL_INTERVAL)
+            else:
+                break
+
+        try:
+            if waited:
+                try:
+                    page.cache_partition.get_file(
+                        filename=combined_cache_filename
+                    )
+                except (CachePartitionFile.DoesNotExist, LockError):
+                    """
+                    The request in flight failed to generate the image.
+                    """
+                else:
+                    return combined_cache_filename
+
+            return self.page_image_generate_task_dispatch(
+                page=page, **kwargs
+            ).get(**task_kwargs)
+        finally:
+            lock.release()
+
+    def get_page_image_response(self, cache_file, output_formats):
+        with cache_file.open() as file_object:
+            content_type = 'image'
+            if output_formats:
+                content_type = get_image_mime_type(
+                    file_object=file_object
+                ) or content_type
+
+            response = HttpResponse(
+                file_object.read(), content_type=content_type
+            )
+
+        if '_hash' in self.request.GET:
+            patch_cache_control(
+                response=response,
+                max_age=self.page_image_cache_time_setting.value
+            )
+        if output_formats:
+            patch_vary_headers(
+                response=response, newheaders=('Accept',)
+            )
+        return response
+
+    def page_image_generate_task_dispatch(self, page, **kwargs):
+        kwargs[self.page_image_generate_task_page_id_kwarg] = page.pk
+        kwargs['user_id'] = self.request.user.pk
+
+        return self.page_image_generate_task.apply_async(kwargs=kwargs)
+
+    @cache_control(private=True)
+    def retrieve(self, request, *args, **kwargs):
+        width = request.GET.get('width')
+        height = request.GET.get('height')
+        zoom = request.GET.get('zoom')
+
+        if zoom:
+            zoom = int(zoom)
+
+        rotation = request.GET.get('rotation')
+
+        if rotation:
+            rotation = int(rotation)
+
+        maximum_layer_order = request.GET.get('maximum_layer_order')
+        if maximum_layer_order:
+            maximum_layer_order = int(maximum_layer_order)
+
+        output_formats = get_accepted_output_formats(
+            accept=request.META.get('HTTP_ACCEPT')
+        )
+
+        page = self.get_object()
+
+        combined_cache_filename = page.get_combined_cache_filename(
+            height=height, maximum_layer_order=maximum_layer_order,
+            output_formats=output_formats, rotation=rotation,
+            user=request.user, width=width, zoom=zoom
+        )
+
+        try:
+            return self.get_page_image_response(
+                cache_file=page.cache_partition.get_file(
+                    filename=combined_cache_filename
+                ), output_formats=output_formats
+            )
+        except (CachePartitionFile.DoesNotExist, LockError):
+            """
+            Cache miss or the cache file is still being written. Generate
+            the image using the task.
+            """
+
+        cache_filename = self.get_page_image_cache_filename(
+            combined_cache_filename=combined_cache_filename,
+            height=height, maximum_layer_order=maximum_layer_order,
+            output_formats=output_formats, page=page, rotation=rotation,
+            width=width, zoom=zoom
+        )
+
+        return self.get_page_image_response(
+            cache_file=page.cache_partition.get_file(filename=cache_filename),
+            output_formats=output_formats
+        )
+
+
+class PageImageTileAPIViewMixinBase:
+    page_image_cache_time_setting = None
+    page_image_generate_task_page_id_kwarg = None
+    page_image_tile_generate_task = None
+    page_image_tile_info_task = None
+
+    def get_maximum_layer_order(self):
+        maximum_layer_order = self.request.GET.get('maximum_layer_order')
+        if maximum_layer_order:
+            maximum_layer_order = int(maximum_layer_order)
+
+        return maximum_layer_order
+
+    def get_task_result(self, task, **kwargs):
+        kwargs[self.page_image_generate_task_page_id_kwarg] = self.get_object().pk
+        kwargs['maximum_layer_order'] = self.get_maximum_layer_order()
+        kwargs['user_id'] = self.request.user.pk
+
+        task_kwargs = {'timeout': DOCUMENT_IMAGE_TASK_TIMEOUT}
+        if settings.DEBUG:
+            # In debug more, task are run synchronously, causing this method
+            # to be called inside another task. Disable the check of nested
+            # tasks when using debug mode.
+            task_kwargs['disable_sync_subtasks'] = False
+
+        return task.apply_async(kwargs=kwargs).get(**task_kwargs)
+
+
+class PageImageTileAPIViewMixin(PageImageTileAPIViewMixinBase):
+    """
+    Return a tile of the image pyramid of a document file or document
+    version page.
+    """
+    @cache_control(private=True)
+    def retrieve(self, request, *args, **kwargs):
+        cache_filename = self.get_task_result(
+            column=int(self.kwargs['column']),
+            level=int(self.kwargs['level']), row=int(self.kwargs['row']),
+            task=self.page_image_tile_generate_task
+        )
+        if not cache_filename:
+            raise NotFound(detail='Tile outside of the image pyramid.')
+
+        cache_file = self.get_object().cache_partition.get_file(
+            filename=cache_filename
+        )
+        with cache_file.open() as file_object:
+            response = HttpResponse(file_object.read(), content_type='image')
+            if '_hash' in request.GET:
+                patch_cache_control(
+                    response=response,
+                    max_age=self.page_image_cache_time_setting.value
+                )
+            return response
+
+
+class PageImageTileInfoAPIViewMixin(PageImageTileAPIViewMixinBase):
+    """
+    Return the dimensions of the image tile pyramid of a document file or
+    document version page.
+    """
+    def retrieve(self, request, *args, **kwargs):
+        return Response(
+            data=self.get_task_result(task=self.page_image_tile_info_task)
+        )
@@ -75,7 +75,8 @@ from .events import (
 from .handlers import (
     handler_create_default_document_type,
     handler_create_document_file_page_image_cache,
-    handler_create_document_version_page_image_cache
+    handler_create_document_version_page_image_cache,
+    handler_document_version_page_images_prewarm
 )
 from .html_widgets import ThumbnailWidget
 from .links.document_links import (
@@ -197,6 +198,7 @@ from .permissions import (
     permission_trashed_document_delete, permission_trashed_document_restore
 )
 
+from .signals import signal_post_document_version_remap
 from .statistics import *  # NOQA
 
 
@@ -968,6 +970,10 @@ class DocumentsApp(MayanAppConfig):
             dispatch_uid='documents_handler_create_document_version_page_image_cache',
             receiver=handler_create_document_version_page_image_cache,
         )
+        signal_post_document_version_remap.connect(
+            dispatch_uid='documents_handler_document_version_page_images_prewarm',
+            receiver=handler_document_version_page_images_prewarm
+        )
         signal_post_initial_setup.connect(
             dispatch_uid='documents_handler_create_default_document_type',
             receiver=handler_create_default_document_type
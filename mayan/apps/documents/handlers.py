@@ -1,4 +1,5 @@
 from django.apps import apps
+from django.db import transaction
 
 from .literals import (
     DEFAULT_DOCUMENT_TYPE_LABEL, STORAGE_NAME_DOCUMENT_FILE_PAGE_IMAGE_CACHE,
@@ -9,6 +10,7 @@ from .settings import (
     setting_document_version_page_image_cache_maximum_size
 )
 from .signals import signal_post_initial_document_type
+from .tasks import task_document_version_page_images_prewarm
 
 
 def handler_create_default_document_type(sender, **kwargs):
@@ -41,3 +43,12 @@ def handler_create_document_version_page_image_cache(sender, **kwargs):
             'maximum_size': setting_document_version_page_image_cache_maximum_size.value,
         }, defined_storage_name=STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE,
     )
+
+
+def handler_document_version_page_images_prewarm(sender, instance, **kwargs):
+    if instance.active and instance.document.document_type.page_image_prewarm_page_count:
+        transaction.on_commit(
+            lambda: task_document_version_page_images_prewarm.apply_async(
+                kwargs={'document_version_id': instance.pk}
+            )
+        )
@@ -21,6 +21,7 @@ DEFAULT_DOCUMENTS_STORAGE_BACKEND_ARGUMENTS = {
 DEFAULT_DOCUMENTS_DISPLAY_HEIGHT = ''
 DEFAULT_DOCUMENTS_DISPLAY_WIDTH = '3600'
 DEFAULT_DOCUMENTS_FAVORITE_COUNT = 400
+DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_BATCH_SIZE = 10
 DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE = 500 * 2 ** 20  # 500 Megabytes
 DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_TIME = '31556926'
 DEFAULT_DOCUMENTS_FILE_STORAGE_BACKEND = 'django.core.files.storage.FileSystemStorage'
@@ -53,6 +54,7 @@ DEFAULT_DOCUMENTS_VERSION_PAGE_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS = {
         settings.MEDIA_ROOT, 'document_version_page_image_cache'
     )
 }
+DEFAULT_DOCUMENTS_VERSION_PAGE_IMAGE_PREWARM_CONCURRENCY = 2
 DEFAULT_DOCUMENTS_ZOOM_MAX_LEVEL = 300
 DEFAULT_DOCUMENTS_ZOOM_MIN_LEVEL = 25
 DEFAULT_DOCUMENTS_ZOOM_PERCENT_STEP = 25
@@ -85,6 +87,14 @@ DOCUMENT_FILE_ACTION_PAGE_CHOICES = (
     (DOCUMENT_FILE_ACTION_PAGES_KEEP, _('Keep. Do not create a new version and keep the current version pages.')),
 )
 DOCUMENT_IMAGE_TASK_TIMEOUT = 120
+DOCUMENT_PAGE_IMAGE_SINGLE_FLIGHT_POLL_INTERVAL = 0.1  # Seconds
+# Accept headers sent by the common browsers when loading images. The
+# page images are prewarmed for the output formats allowed by each.
+DOCUMENT_VERSION_PAGE_IMAGE_PREWARM_ACCEPT_HEADERS = (
+    'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
+    'image/avif,image/webp,*/*'
+)
+DOCUMENT_VERSION_PAGE_IMAGE_PREWARM_RETRY_DELAY = 30
 
 IMAGE_ERROR_NO_ACTIVE_VERSION = 'document_no_active_version'
 IMAGE_ERROR_NO_VERSION_PAGES = 'document_no_version_pages'
@@ -95,6 +105,8 @@ MONTH_NAMES = (
     _('November'), _('December')
 )
 
+PAGE_IMAGE_TILE_SIZE = 256
+
 PAGE_RANGE_ALL = 'all'
 PAGE_RANGE_RANGE = 'range'
 PAGE_RANGE_CHOICES = (
@@ -0,0 +1,83 @@
+from django.apps import apps
+from django.core import management
+from django.core.management.base import CommandError
+
+from ...tasks import task_document_version_page_images_prewarm
+
+
+class Command(management.BaseCommand):
+    help = (
+        'Submit for generation the thumbnail and preview images of the '
+        'documents of a document type or of an index to populate the '
+        'document file page image cache in advance.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--document-type', action='append', dest='document_type_ids',
+            help='ID of the document type whose documents will be warmed. '
+            'Can be specified multiple times.', type=int
+        )
+        parser.add_argument(
+            '--index', action='append', dest='index_slugs',
+            help='Slug of the index whose documents will be warmed. Can be '
+            'specified multiple times.'
+        )
+        parser.add_argument(
+            '--page-count', action='store', dest='page_count',
+            help='Number of pages, starting from the first one, to warm for '
+            'each document. Defaults to all the pages.', type=int
+        )
+
+    def handle(self, *args, **options):
+        Document = apps.get_model(app_label='documents', model_name='Document')
+
+        document_type_ids = options['document_type_ids']
+        index_slugs = options['index_slugs']
+
+        if not document_type_ids and not index_slugs:
+            raise CommandError('A document type or an index is required.')
+
+        queryset = Document.valid.all()
+
+        if document_type_ids:
+            queryset = queryset.filter(document_type_id__in=document_type_ids)
+
+        if index_slugs:
+            queryset = queryset.filter(
+                index_instance_nodes__index_template_node__index__slug__in=index_slugs
+            ).distinct()
+
+        document_version_count = 0
+        page_total = 0
+        for document in queryset.iterator():
+            document_version = document.version_active
+
+            if document_version:
+                page_count = options['page_count']
+
+                # Zero is a valid page count and must not mean all pages.
+                if page_count is None:
+                    page_count = document_version.pages.count()
+
+                task_document_version_page_images_prewarm.apply_async(
+                    kwargs={
+                        'document_version_id': document_version.pk,
+                        'page_count': page_count
+                    }
+                )
+                document_version_count += 1
+                page_total += page_count
+
+                if options['verbosity'] >= 2:
+                    self.stdout.write(
+                        'Document version "{}" of document ID {} submitted '
+                        'for the cache warming of {} pages.'.format(
+                            document_version, document.pk, page_count
+                        )
+                    )
+
+        self.stdout.write(
+            '{} document versions submitted for the cache warming of {} '
+            'pages.'.format(document_version_count, page_total)
+        )
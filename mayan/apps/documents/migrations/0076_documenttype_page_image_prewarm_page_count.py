@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('documents', '0075_delete_duplicateddocumentold'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documenttype',
+            name='page_image_prewarm_page_count',
+            field=models.PositiveIntegerField(
+                blank=True, help_text='Number of pages, starting from the '
+                'first one, for which the thumbnail and preview images will '
+                'be generated in advance after the pages of a new document '
+                'file are detected. Leave blank or use 0 to disable.',
+                null=True, verbose_name='Page image prewarm page count'
+            ),
+        ),
+    ]
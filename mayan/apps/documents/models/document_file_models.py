@@ -174,7 +174,7 @@ class DocumentFile(
     @cached_property
     def cache_partition(self):
         partition, created = self.cache.partitions.get_or_create(
-            name='file-{}'.format(self.uuid)
+            name=self.get_cache_partition_name()
         )
         return partition
 
@@ -217,7 +217,13 @@ class DocumentFile(
             page.delete()
 
         self.file.storage.delete(name=self.file.name)
-        self.cache_partition.delete()
+
+        if self.get_cache_partition_reference_count() <= 1:
+            self.cache_partition.delete()
+
+        # Cache partition used before the files were content addressed.
+        for cache_partition in self.cache.partitions.filter(name='file-{}'.format(self.uuid)):
+            cache_partition.delete()
 
         result = super().delete(*args, **kwargs)
 
@@ -259,6 +265,26 @@ class DocumentFile(
         if first_page:
             return first_page.get_api_image_url(*args, **kwargs)
 
+    def get_cache_partition_name(self):
+        """
+        Document files with the same checksum share the same cache
+        partition.
+        """
+        if self.checksum:
+            return 'file-content-{}'.format(self.checksum)
+        else:
+            return 'file-{}'.format(self.uuid)
+
+    def get_cache_partition_reference_count(self):
+        """
+        Number of document files using the cache partition of this
+        document file.
+        """
+        if self.checksum:
+            return DocumentFile.objects.filter(checksum=self.checksum).count()
+        else:
+            return 1
+
     def get_cache_partitions(self):
         result = [self.cache_partition]
         for page in self.file_pages.all():
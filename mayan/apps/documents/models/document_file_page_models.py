@@ -16,22 +16,26 @@ from mayan.apps.converter.transformations import (
 )
 from mayan.apps.file_caching.models import CachePartitionFile
 from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 
 from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT
 from ..managers import DocumentFilePageManager, ValidDocumentFilePageManager
 from ..settings import (
-    setting_display_width, setting_display_height, setting_zoom_max_level,
+    setting_display_width, setting_display_height,
+    setting_document_file_page_image_batch_size, setting_zoom_max_level,
     setting_zoom_min_level
 )
 
 from .document_file_models import DocumentFile
-from .mixins import PagedModelMixin
+from .mixins import PageImageTileModelMixin, PagedModelMixin
 
 __all__ = ('DocumentFilePage', 'DocumentFilePageSearchResult')
 logger = logging.getLogger(name=__name__)
 
 
-class DocumentFilePage(PagedModelMixin, models.Model):
+class DocumentFilePage(
+    PageImageTileModelMixin, PagedModelMixin, models.Model
+):
     """
     Model that describes a document file page
     """
@@ -62,20 +66,86 @@ class DocumentFilePage(PagedModelMixin, models.Model):
     @cached_property
     def cache_partition(self):
         partition, created = self.document_file.cache.partitions.get_or_create(
-            name=self.uuid
+            name=self.get_cache_partition_name()
         )
         return partition
 
     def delete(self, *args, **kwargs):
-        self.cache_partition.delete()
+        if self.get_cache_partition_reference_count() <= 1:
+            self.cache_partition.delete()
+
+        # Cache partition used before the pages were content addressed.
+        for cache_partition in self.document_file.cache.partitions.filter(name=self.uuid):
+            cache_partition.delete()
+
         super().delete(*args, **kwargs)
 
-    def generate_image(self, _acquire_lock=True, user=None, **kwargs):
+    def generate_base_images(self):
+        """
+        Rasterize this page and the following pages of the document file
+        with a single converter execution and store the result as the
+        base image of each page. Pages that already have a base image are
+        not overwritten.
+        """
+        cache_filename = 'base_image'
+
+        queryset = self.document_file.file_pages.filter(
+            page_number__gte=self.page_number,
+            page_number__lt=self.page_number + setting_document_file_page_image_batch_size.value
+        )
+
+        pages = {}
+        for page in queryset:
+            if page == self or not page.cache_partition.files.filter(filename=cache_filename).exists():
+                pages[page.page_number] = page
+
+        with self.document_file.get_intermediate_file() as file_object:
+            converter = ConverterBase.get_converter_class()(
+                file_object=file_object
+            )
+
+            first_page_number = self.page_number
+            last_page_number = max(pages)
+
+            page_range = zip(
+                range(first_page_number, last_page_number + 1),
+                converter.seek_page_range(
+                    first_page_number=first_page_number - 1,
+                    last_page_number=last_page_number - 1
+                )
+            )
+
+            for page_number, image in page_range:
+                page = pages.get(page_number)
+
+                # Check again in case the base image was created by another
+                # process while the range was being rasterized.
+                if page and not page.cache_partition.files.filter(filename=cache_filename).exists():
+                    page_image = converter.get_page()
+
+                    try:
+                        with page.cache_partition.create_file(filename=cache_filename) as cache_file_object:
+                            cache_file_object.write(page_image.getvalue())
+                    except LockError:
+                        if page == self:
+                            raise
+                        else:
+                            # Another process is generating the base image
+                            # of this page.
+                            logger.debug(
+                                'Unable to cache base image of page %s; '
+                                'already being generated.', page
+                            )
+
+    def generate_image(
+        self, _acquire_lock=True, output_formats=None, user=None, **kwargs
+    ):
         transformation_list = self.get_combined_transformation_list(
             user=user, **kwargs
         )
         combined_cache_filename = self.get_combined_cache_filename(
-            _transformation_list=transformation_list
+            _transformation_list=transformation_list,
+            output_formats=output_formats
         )
 
         logger.debug(
@@ -104,7 +174,10 @@ class DocumentFilePage(PagedModelMixin, models.Model):
                     logger.debug(
                         'transformations cache file "%s" not found', combined_cache_filename
                     )
-                    image = self.get_image(transformations=transformation_list)
+                    image = self.get_image(
+                        output_formats=output_formats,
+                        transformations=transformation_list
+                    )
                     with self.cache_partition.create_file(filename=combined_cache_filename) as file_object:
                         file_object.write(image.getvalue())
                 else:
@@ -152,11 +225,15 @@ class DocumentFilePage(PagedModelMixin, models.Model):
 
         return final_url.tostr()
 
-    def get_combined_cache_filename(self, _transformation_list=None, user=None, **kwargs):
+    def get_combined_cache_filename(
+        self, _transformation_list=None, output_formats=None, user=None,
+        **kwargs
+    ):
         transformation_list = _transformation_list or self.get_combined_transformation_list(
             user=user, **kwargs
         )
         return BaseTransformation.combine(
+            output_formats=output_formats,
             transformations=transformation_list
         )
 
@@ -213,7 +290,13 @@ class DocumentFilePage(PagedModelMixin, models.Model):
 
         return transformation_list
 
-    def get_image(self, transformations=None):
+    def get_image(
+        self, output_formats=None, transformations=None, _as_image=False
+    ):
+        """
+        Return the base image of the page with the transformations applied
+        encoded in a buffer or as a Pillow image when `_as_image` is True.
+        """
         cache_filename = 'base_image'
         logger.debug('Page cache filename: %s', cache_filename)
 
@@ -223,23 +306,10 @@ class DocumentFilePage(PagedModelMixin, models.Model):
             logger.debug('Page cache file "%s" not found', cache_filename)
 
             try:
-                with self.document_file.get_intermediate_file() as file_object:
-                    converter = ConverterBase.get_converter_class()(
-                        file_object=file_object
-                    )
-                    converter.seek_page(page_number=self.page_number - 1)
-
-                    page_image = converter.get_page()
-
-                    # Since open "wb+" doesn't create files, create it explicitly
-                    with self.cache_partition.create_file(filename=cache_filename) as file_object:
-                        file_object.write(page_image.getvalue())
-
-                    # Apply runtime transformations
-                    for transformation in transformations or ():
-                        converter.transform(transformation=transformation)
-
-                    return converter.get_page()
+                self.generate_base_images()
+                cache_file = self.cache_partition.get_file(
+                    filename=cache_filename
+                )
             except Exception as exception:
                 logger.error(
                     'Error creating document file page cache file from '
@@ -251,20 +321,25 @@ class DocumentFilePage(PagedModelMixin, models.Model):
         else:
             logger.debug('Page cache file "%s" found', cache_filename)
 
-            with cache_file.open() as file_object:
-                converter = ConverterBase.get_converter_class()(
-                    file_object=file_object
-                )
+        with cache_file.open() as file_object:
+            converter = ConverterBase.get_converter_class()(
+                file_object=file_object
+            )
+
+            converter.seek_page(
+                page_number=0, transformations=transformations
+            )
 
-                converter.seek_page(page_number=0)
+            # Apply runtime transformations
+            converter.transform_many(transformations=transformations or ())
 
-                # This code is also repeated below to allow using a context
-                # manager with cache_file.open and close it automatically.
-                # Apply runtime transformations
-                for transformation in transformations or ():
-                    converter.transform(transformation=transformation)
+            if _as_image:
+                return converter.image
 
-                return converter.get_page()
+            return converter.get_page(output_formats=output_formats)
+
+    def get_image_tile_source_page(self):
+        return self
 
     def get_label(self):
         return _(
@@ -276,6 +351,32 @@ class DocumentFilePage(PagedModelMixin, models.Model):
         }
     get_label.short_description = _('Label')
 
+    def get_cache_partition_name(self):
+        """
+        The images of a page depend only on the content of the document
+        file, the page number and the transformations. Pages of document
+        files with the same checksum share the same cache partition. The
+        transformations are part of the name of each cache file.
+        """
+        if self.document_file.checksum:
+            return 'content-{}-{}'.format(
+                self.document_file.checksum, self.page_number
+            )
+        else:
+            return self.uuid
+
+    def get_cache_partition_reference_count(self):
+        """
+        Number of pages using the cache partition of this page.
+        """
+        if self.document_file.checksum:
+            return DocumentFilePage.objects.filter(
+                document_file__checksum=self.document_file.checksum,
+                page_number=self.page_number
+            ).count()
+        else:
+            return 1
+
     def get_lock_name(self, _combined_cache_filename=None, user=None, **kwargs):
         if _combined_cache_filename:
             combined_cache_filename = _combined_cache_filename
@@ -289,7 +390,7 @@ class DocumentFilePage(PagedModelMixin, models.Model):
             )
 
         return 'document_file_page_generate_image_{}_{}'.format(
-            self.pk, combined_cache_filename
+            self.get_cache_partition_name(), combined_cache_filename
         )
 
     @property
@@ -75,6 +75,14 @@ class DocumentType(ExtraDataModelMixin, models.Model):
             'Filename generator backend arguments'
         )
     )
+    page_image_prewarm_page_count = models.PositiveIntegerField(
+        blank=True, help_text=_(
+            'Number of pages, starting from the first one, for which the '
+            'thumbnail and preview images will be generated in advance '
+            'after the pages of a new document file are detected. Leave '
+            'blank or use 0 to disable.'
+        ), null=True, verbose_name=_('Page image prewarm page count')
+    )
 
     objects = DocumentTypeManager()
 
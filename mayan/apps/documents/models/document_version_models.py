@@ -12,9 +12,12 @@ from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.classes import ModelQueryFields
 from mayan.apps.converter.exceptions import AppImageError
+from mayan.apps.converter.utils import get_accepted_output_formats
 from mayan.apps.databases.model_mixins import ExtraDataModelMixin
 from mayan.apps.events.classes import EventManagerMethodAfter, EventManagerSave
 from mayan.apps.events.decorators import method_event
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.messaging.models import Message
 from mayan.apps.storage.models import DownloadFile
 from mayan.apps.templating.classes import Template
@@ -24,11 +27,18 @@ from ..events import (
     event_document_version_edited, event_document_version_exported
 )
 from ..literals import (
+    DOCUMENT_IMAGE_TASK_TIMEOUT,
+    DOCUMENT_VERSION_PAGE_IMAGE_PREWARM_ACCEPT_HEADERS,
     IMAGE_ERROR_NO_VERSION_PAGES,
     STORAGE_NAME_DOCUMENT_VERSION_PAGE_IMAGE_CACHE
 )
 from ..managers import ValidDocumentVersionManager
 from ..permissions import permission_document_version_export
+from ..settings import (
+    setting_document_version_page_image_prewarm_concurrency,
+    setting_preview_height, setting_preview_width, setting_thumbnail_height,
+    setting_thumbnail_width
+)
 from ..signals import signal_post_document_version_remap
 
 from .document_file_page_models import DocumentFilePage
@@ -248,6 +258,68 @@ class DocumentVersion(ExtraDataModelMixin, models.Model):
 
         return result
 
+    def page_images_prewarm(self, page_count=None):
+        """
+        Generate the thumbnail and preview images of the first pages of the
+        document version for the output formats requested by the common
+        browsers. The number of pages defaults to the one configured by the
+        document type. The number of pages being prewarmed at the same time
+        is limited by acquiring one of the available prewarm lock slots for
+        each page. The slot lock timeout covers a single page to avoid
+        blocking the slot for long if the worker is terminated.
+        """
+        if page_count is None:
+            page_count = self.document.document_type.page_image_prewarm_page_count
+
+        if page_count:
+            output_formats_list = []
+            for accept in DOCUMENT_VERSION_PAGE_IMAGE_PREWARM_ACCEPT_HEADERS:
+                output_formats = get_accepted_output_formats(accept=accept)
+                if output_formats not in output_formats_list:
+                    output_formats_list.append(output_formats)
+
+            # Two images, thumbnail and preview, per output format.
+            lock_timeout = DOCUMENT_IMAGE_TASK_TIMEOUT * 2 * len(
+                output_formats_list
+            )
+
+            for document_version_page in self.pages.all()[:page_count]:
+                lock = self.page_images_prewarm_slot_acquire(
+                    timeout=lock_timeout
+                )
+
+                try:
+                    for output_formats in output_formats_list:
+                        document_version_page.generate_image(
+                            height=setting_thumbnail_height.value,
+                            output_formats=output_formats,
+                            width=setting_thumbnail_width.value
+                        )
+                        document_version_page.generate_image(
+                            height=setting_preview_height.value,
+                            output_formats=output_formats,
+                            width=setting_preview_width.value
+                        )
+                finally:
+                    lock.release()
+
+    def page_images_prewarm_slot_acquire(self, timeout):
+        locking_backend = LockingBackend.get_backend()
+
+        for slot in range(setting_document_version_page_image_prewarm_concurrency.value):
+            try:
+                return locking_backend.acquire_lock(
+                    name='document_version_page_image_prewarm_{}'.format(
+                        slot
+                    ), timeout=timeout
+                )
+            except LockError:
+                """Slot in use, try the next one."""
+
+        raise LockError(
+            'No document version page image prewarm slot available.'
+        )
+
     @property
     def pages(self):
         DocumentVersionPage = apps.get_model(
@@ -36,14 +36,15 @@ from ..settings import (
 )
 
 from .document_version_models import DocumentVersion
-from .mixins import PagedModelMixin
+from .mixins import PageImageTileModelMixin, PagedModelMixin
 
 __all__ = ('DocumentVersionPage', 'DocumentVersionPageSearchResult')
 logger = logging.getLogger(name=__name__)
 
 
 class DocumentVersionPage(
-    ExtraDataModelMixin, PagedModelMixin, models.Model
+    ExtraDataModelMixin, PageImageTileModelMixin, PagedModelMixin,
+    models.Model
 ):
     _paged_model_parent_field = 'document_version'
 
@@ -107,12 +108,15 @@ class DocumentVersionPage(
                 resolution=resolution
             )
 
-    def generate_image(self, user=None, _acquire_lock=True, **kwargs):
+    def generate_image(
+        self, user=None, _acquire_lock=True, output_formats=None, **kwargs
+    ):
         transformation_list = self.get_combined_transformation_list(
             user=user, **kwargs
         )
         combined_cache_filename = self.get_combined_cache_filename(
-            _transformation_list=transformation_list
+            _transformation_list=transformation_list,
+            output_formats=output_formats
         )
 
         logger.debug(
@@ -151,7 +155,10 @@ class DocumentVersionPage(
                             'transformations cache file "%s" not found, '
                             'generating new image', combined_cache_filename
                         )
-                        image = self.get_image(transformations=transformation_list)
+                        image = self.get_image(
+                            output_formats=output_formats,
+                            transformations=transformation_list
+                        )
                         with self.cache_partition.create_file(filename=combined_cache_filename) as file_object:
                             file_object.write(image.getvalue())
                     else:
@@ -213,7 +220,10 @@ class DocumentVersionPage(
 
         return final_url.tostr()
 
-    def get_combined_cache_filename(self, _transformation_list=None, user=None, **kwargs):
+    def get_combined_cache_filename(
+        self, _transformation_list=None, output_formats=None, user=None,
+        **kwargs
+    ):
         transformation_list = _transformation_list or self.get_combined_transformation_list(
             user=user, **kwargs
         )
@@ -223,7 +233,10 @@ class DocumentVersionPage(
         )
         return '{}-{}'.format(
             content_object_cache_filename,
-            BaseTransformation.combine(transformations=transformation_list)
+            BaseTransformation.combine(
+                output_formats=output_formats,
+                transformations=transformation_list
+            )
         )
 
     def get_combined_transformation_list(self, user=None, *args, **kwargs):
@@ -279,7 +292,7 @@ class DocumentVersionPage(
 
         return transformation_list
 
-    def get_image(self, transformations=None):
+    def get_image(self, output_formats=None, transformations=None):
         cache_filename = '{}-base_image'.format(self.content_object.get_combined_cache_filename())
         logger.debug('Page cache filename: %s', cache_filename)
 
@@ -310,10 +323,11 @@ class DocumentVersionPage(
                         file_object.write(page_image.getvalue())
 
                     # Apply runtime transformations.
-                    for transformation in transformations or ():
-                        converter.transform(transformation=transformation)
+                    converter.transform_many(
+                        transformations=transformations or ()
+                    )
 
-                    return converter.get_page()
+                    return converter.get_page(output_formats=output_formats)
             except Exception as exception:
                 # Cleanup in case of error.
                 logger.error(
@@ -330,15 +344,21 @@ class DocumentVersionPage(
                     file_object=file_object
                 )
 
-                converter.seek_page(page_number=0)
+                converter.seek_page(
+                    page_number=0, transformations=transformations
+                )
 
                 # This code is also repeated below to allow using a context
                 # manager with cache_version.open and close it automatically.
                 # Apply runtime transformations.
-                for transformation in transformations or ():
-                    converter.transform(transformation=transformation)
+                converter.transform_many(
+                    transformations=transformations or ()
+                )
+
+                return converter.get_page(output_formats=output_formats)
 
-                return converter.get_page()
+    def get_image_tile_source_page(self):
+        return self.content_object
 
     def get_label(self):
         return _(
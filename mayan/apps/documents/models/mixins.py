@@ -1,5 +1,22 @@
+from contextlib import contextmanager
+import logging
+
+from PIL import Image
+
 from django.db.models import Max
 
+from mayan.apps.converter.classes import ConverterBase
+from mayan.apps.converter.models import LayerTransformation
+from mayan.apps.converter.transformations import (
+    BaseTransformation, TransformationCrop, TransformationResize
+)
+from mayan.apps.file_caching.models import CachePartitionFile
+from mayan.apps.lock_manager.backends.base import LockingBackend
+
+from ..literals import DOCUMENT_IMAGE_TASK_TIMEOUT, PAGE_IMAGE_TILE_SIZE
+
+logger = logging.getLogger(name=__name__)
+
 
 class HooksModelMixin:
     @classmethod
@@ -19,6 +36,264 @@ class HooksModelMixin:
         hook_list.insert(order, func)
 
 
+class PageImageTileModelMixin:
+    """
+    Deep Zoom style image pyramid for the page models. The last level of
+    the pyramid is the native resolution base image of the source document
+    file page with the stored transformations applied. Each lower level
+    halves the dimensions of the level above it until the image is one
+    pixel in size. The image of each level is generated on demand from
+    the level above and divided in square tiles. The level images and the
+    tiles are stored in the cache partition of the page.
+    """
+    @staticmethod
+    def get_image_tile_level_count(width, height):
+        return (max(width, height) - 1).bit_length() + 1
+
+    @staticmethod
+    def get_image_tile_geometry(width, height, level, column, row):
+        """
+        Return the box of the level image covered by a tile for a pyramid
+        of the given size. Returns None if the tile is outside the
+        pyramid.
+        """
+        level_count = PageImageTileModelMixin.get_image_tile_level_count(
+            width=width, height=height
+        )
+
+        if level < 0 or level >= level_count or column < 0 or row < 0:
+            return None
+
+        scale = 2 ** (level_count - 1 - level)
+        level_width = -(-width // scale)
+        level_height = -(-height // scale)
+
+        left = column * PAGE_IMAGE_TILE_SIZE
+        top = row * PAGE_IMAGE_TILE_SIZE
+
+        if left >= level_width or top >= level_height:
+            return None
+
+        return (
+            left, top, min(left + PAGE_IMAGE_TILE_SIZE, level_width),
+            min(top + PAGE_IMAGE_TILE_SIZE, level_height)
+        )
+
+    def _generate_image_tile_cache_file(self, cache_filename, image_function):
+        """
+        Store the image returned by `image_function` in the cache file
+        unless the cache file already exists.
+        """
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.get_lock_name(_combined_cache_filename=cache_filename),
+            timeout=DOCUMENT_IMAGE_TASK_TIMEOUT
+        )
+
+        try:
+            try:
+                self.cache_partition.get_file(filename=cache_filename)
+            except CachePartitionFile.DoesNotExist:
+                logger.debug(
+                    'tile cache file "%s" not found', cache_filename
+                )
+
+                image = image_function()
+
+                with self.cache_partition.create_file(filename=cache_filename) as file_object:
+                    file_object.write(image.getvalue())
+
+            return cache_filename
+        finally:
+            lock.release()
+
+    @contextmanager
+    def _open_image_tile_level(self, cache_filename):
+        cache_file = self.cache_partition.get_file(filename=cache_filename)
+
+        with cache_file.open() as file_object:
+            converter = ConverterBase.get_converter_class()(
+                file_object=file_object
+            )
+            converter.seek_page(page_number=0)
+
+            yield converter
+
+    def generate_image_tile(
+        self, level, column, row, user=None, maximum_layer_order=None
+    ):
+        """
+        Return the cache filename of the tile or None if the tile
+        coordinates are outside the pyramid.
+        """
+        base_cache_filename = self.get_image_tile_base_cache_filename(
+            maximum_layer_order=maximum_layer_order, user=user
+        )
+        tile_cache_filename = '{}-tile-{}-{}-{}'.format(
+            base_cache_filename, level, column, row
+        )
+
+        try:
+            self.cache_partition.get_file(filename=tile_cache_filename)
+        except CachePartitionFile.DoesNotExist:
+            """The tile needs to be generated."""
+        else:
+            return tile_cache_filename
+
+        image_tile_info = self.get_image_tile_info(
+            maximum_layer_order=maximum_layer_order, user=user
+        )
+
+        geometry = self.get_image_tile_geometry(
+            width=image_tile_info['width'],
+            height=image_tile_info['height'], level=level, column=column,
+            row=row
+        )
+
+        if not geometry:
+            return None
+
+        level_cache_filename = self.generate_image_tile_level(
+            base_cache_filename=base_cache_filename, level=level,
+            level_count=image_tile_info['level_count']
+        )
+
+        def get_tile_image():
+            with self._open_image_tile_level(cache_filename=level_cache_filename) as converter:
+                width, height = converter.image.size
+                left, top, right, bottom = geometry
+
+                converter.transform_many(
+                    transformations=(
+                        TransformationCrop(
+                            left=left, top=top, right=max(width - right, 0),
+                            bottom=max(height - bottom, 0)
+                        ),
+                    )
+                )
+
+                return converter.get_page()
+
+        return self._generate_image_tile_cache_file(
+            cache_filename=tile_cache_filename, image_function=get_tile_image
+        )
+
+    def generate_image_tile_base(self, maximum_layer_order=None, user=None):
+        """
+        Render the native resolution image of the page, the last level of
+        the pyramid, and return its cache filename.
+        """
+        transformations = self.get_image_tile_transformation_list(
+            maximum_layer_order=maximum_layer_order, user=user
+        )
+        cache_filename = self.get_image_tile_base_cache_filename(
+            _transformation_list=transformations
+        )
+
+        def get_base_image():
+            return self.get_image_tile_source_page().get_image(
+                transformations=transformations
+            )
+
+        return self._generate_image_tile_cache_file(
+            cache_filename=cache_filename, image_function=get_base_image
+        )
+
+    def generate_image_tile_level(
+        self, base_cache_filename, level, level_count
+    ):
+        """
+        Return the cache filename of the image of a level of the pyramid.
+        Each level is generated from the level above it, so only the
+        smaller image is decoded for the lower levels.
+        """
+        if level == level_count - 1:
+            return base_cache_filename
+
+        upper_level_cache_filename = self.generate_image_tile_level(
+            base_cache_filename=base_cache_filename, level=level + 1,
+            level_count=level_count
+        )
+
+        def get_level_image():
+            with self._open_image_tile_level(cache_filename=upper_level_cache_filename) as converter:
+                width, height = converter.image.size
+
+                converter.transform_many(
+                    transformations=(
+                        TransformationResize(
+                            width=-(-width // 2), height=-(-height // 2)
+                        ),
+                    )
+                )
+
+                return converter.get_page()
+
+        return self._generate_image_tile_cache_file(
+            cache_filename='{}-level-{}'.format(base_cache_filename, level),
+            image_function=get_level_image
+        )
+
+    def get_image_tile_base_cache_filename(
+        self, _transformation_list=None, maximum_layer_order=None, user=None
+    ):
+        transformation_list = _transformation_list or self.get_image_tile_transformation_list(
+            maximum_layer_order=maximum_layer_order, user=user
+        )
+
+        return 'tile-{}-{}'.format(
+            self.get_image_tile_source_page().get_cache_partition_name(),
+            BaseTransformation.combine(transformations=transformation_list)
+        )
+
+    def get_image_tile_info(self, maximum_layer_order=None, user=None):
+        base_cache_filename = self.generate_image_tile_base(
+            maximum_layer_order=maximum_layer_order, user=user
+        )
+
+        base_cache_file = self.cache_partition.get_file(
+            filename=base_cache_filename
+        )
+        with base_cache_file.open() as file_object:
+            # Only the image header is read to obtain the size.
+            width, height = Image.open(fp=file_object).size
+
+        return {
+            'height': height,
+            'level_count': self.get_image_tile_level_count(
+                width=width, height=height
+            ),
+            'tile_size': PAGE_IMAGE_TILE_SIZE,
+            'width': width
+        }
+
+    def get_image_tile_transformation_list(
+        self, maximum_layer_order=None, user=None
+    ):
+        """
+        Return the stored transformations of the source page and of this
+        page. The display size transformations are not included to keep
+        the native resolution of the source page.
+        """
+        source_page = self.get_image_tile_source_page()
+        transformation_list = []
+
+        if source_page != self:
+            transformation_list.extend(
+                LayerTransformation.objects.get_for_object(
+                    obj=source_page, as_classes=True, user=user
+                )
+            )
+
+        transformation_list.extend(
+            LayerTransformation.objects.get_for_object(
+                obj=self, maximum_layer_order=maximum_layer_order,
+                as_classes=True, user=user
+            )
+        )
+
+        return transformation_list
+
+
 class PagedModelMixin:
     def get_pages_last_number(self):
         last_page_number = self.siblings.aggregate(
@@ -4,7 +4,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.converter.queues import queue_converter
 from mayan.apps.task_manager.classes import CeleryQueue
-from mayan.apps.task_manager.workers import worker_b, worker_c
+from mayan.apps.task_manager.workers import worker_b, worker_c, worker_d
 
 from .literals import (
     CHECK_DELETE_PERIOD_INTERVAL, CHECK_TRASH_PERIOD_INTERVAL,
@@ -21,15 +21,35 @@ queue_uploads = CeleryQueue(
 queue_documents = CeleryQueue(
     name='documents', label=_('Documents'), worker=worker_c
 )
+queue_documents_prewarm = CeleryQueue(
+    name='documents_prewarm', label=_('Documents prewarm'), transient=True,
+    worker=worker_d
+)
 
 queue_converter.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_file_page_image_generate',
     label=_('Generate document file page image')
 )
+queue_converter.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_file_page_image_tile_generate',
+    label=_('Generate document file page image tile')
+)
+queue_converter.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_file_page_image_tile_info',
+    label=_('Generate document file page image tile pyramid')
+)
 queue_converter.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_version_page_image_generate',
     label=_('Generate document version page image')
 )
+queue_converter.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_version_page_image_tile_generate',
+    label=_('Generate document version page image tile')
+)
+queue_converter.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_version_page_image_tile_info',
+    label=_('Generate document version page image tile pyramid')
+)
 
 queue_documents.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_trash_can_empty',
@@ -48,6 +68,11 @@ queue_documents.add_task_type(
     label=_('Export a document version')
 )
 
+queue_documents_prewarm.add_task_type(
+    dotted_path='mayan.apps.documents.tasks.task_document_version_page_images_prewarm',
+    label=_('Prewarm the page images of a document version')
+)
+
 queue_documents_periodic.add_task_type(
     dotted_path='mayan.apps.documents.tasks.task_document_type_document_trash_periods_check',
     label=_('Check document type trash periods'),
@@ -5,6 +5,7 @@ from mayan.apps.smart_settings.classes import SettingNamespace
 from .literals import (
     DEFAULT_DOCUMENTS_DISPLAY_HEIGHT, DEFAULT_DOCUMENTS_DISPLAY_WIDTH,
     DEFAULT_DOCUMENTS_FAVORITE_COUNT,
+    DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_BATCH_SIZE,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS,
     DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_TIME,
@@ -21,6 +22,7 @@ from .literals import (
     DEFAULT_DOCUMENTS_VERSION_PAGE_IMAGE_CACHE_TIME,
     DEFAULT_DOCUMENTS_VERSION_PAGE_IMAGE_CACHE_STORAGE_BACKEND,
     DEFAULT_DOCUMENTS_VERSION_PAGE_IMAGE_CACHE_STORAGE_BACKEND_ARGUMENTS,
+    DEFAULT_DOCUMENTS_VERSION_PAGE_IMAGE_PREWARM_CONCURRENCY,
     DEFAULT_DOCUMENTS_ZOOM_MAX_LEVEL, DEFAULT_DOCUMENTS_ZOOM_MIN_LEVEL,
     DEFAULT_DOCUMENTS_ZOOM_PERCENT_STEP, DEFAULT_LANGUAGE,
     DEFAULT_LANGUAGE_CODES, DEFAULT_STUB_EXPIRATION_INTERVAL,
@@ -47,6 +49,15 @@ setting_display_width = namespace.add_setting(
     default=DEFAULT_DOCUMENTS_DISPLAY_WIDTH,
     global_name='DOCUMENTS_DISPLAY_WIDTH'
 )
+setting_document_file_page_image_batch_size = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_BATCH_SIZE,
+    global_name='DOCUMENTS_FILE_PAGE_IMAGE_BATCH_SIZE', help_text=_(
+        'Number of consecutive document file pages to rasterize with a '
+        'single converter execution when the base image of a page is not '
+        'found in the cache. The base images of the following pages are '
+        'cached in advance. A value of 1 disables batch rasterization.'
+    )
+)
 setting_document_file_page_image_cache_maximum_size = namespace.add_setting(
     default=DEFAULT_DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE,
     global_name='DOCUMENTS_FILE_PAGE_IMAGE_CACHE_MAXIMUM_SIZE',
@@ -145,6 +156,15 @@ setting_document_version_page_image_cache_storage_backend_arguments = namespace.
         'Arguments to pass to the DOCUMENTS_VERSION_PAGE_IMAGE_CACHE_STORAGE_BACKEND.'
     ),
 )
+setting_document_version_page_image_prewarm_concurrency = namespace.add_setting(
+    default=DEFAULT_DOCUMENTS_VERSION_PAGE_IMAGE_PREWARM_CONCURRENCY,
+    global_name='DOCUMENTS_VERSION_PAGE_IMAGE_PREWARM_CONCURRENCY',
+    help_text=_(
+        'Maximum number of document versions whose page images are '
+        'prewarmed at the same time. Prewarm tasks that exceed this limit '
+        'are retried later.'
+    )
+)
 setting_preview_height = namespace.add_setting(
     default=DEFAULT_DOCUMENTS_PREVIEW_HEIGHT,
     global_name='DOCUMENTS_PREVIEW_HEIGHT'
@@ -8,6 +8,7 @@ from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
 from .literals import (
+    DOCUMENT_VERSION_PAGE_IMAGE_PREWARM_RETRY_DELAY,
     UPDATE_PAGE_COUNT_RETRY_DELAY, UPLOAD_NEW_VERSION_RETRY_DELAY
 )
 from .settings import (
@@ -86,6 +87,76 @@ def task_document_file_page_image_generate(
         raise self.retry(exc=exception)
 
 
+@app.task(
+    bind=True,
+    default_retry_delay=setting_task_document_file_page_image_generate_retry_delay.value
+)
+def task_document_file_page_image_tile_generate(
+    self, document_file_page_id, level, column, row,
+    maximum_layer_order=None, user_id=None
+):
+    DocumentFilePage = apps.get_model(
+        app_label='documents', model_name='DocumentFilePage'
+    )
+    User = get_user_model()
+
+    if user_id:
+        user = User.objects.get(pk=user_id)
+    else:
+        user = None
+
+    document_file_page = DocumentFilePage.objects.get(pk=document_file_page_id)
+    try:
+        return document_file_page.generate_image_tile(
+            column=column, level=level,
+            maximum_layer_order=maximum_layer_order, row=row, user=user
+        )
+    except LockError as exception:
+        logger.warning(
+            'LockError during attempt to generate document page image '
+            'tile for document id: %d, document file id: %d, document '
+            'file page id: %d. Retrying.',
+            document_file_page.document_file.document_id,
+            document_file_page.document_file_id,
+            document_file_page.pk,
+        )
+        raise self.retry(exc=exception)
+
+
+@app.task(
+    bind=True,
+    default_retry_delay=setting_task_document_file_page_image_generate_retry_delay.value
+)
+def task_document_file_page_image_tile_info(
+    self, document_file_page_id, maximum_layer_order=None, user_id=None
+):
+    DocumentFilePage = apps.get_model(
+        app_label='documents', model_name='DocumentFilePage'
+    )
+    User = get_user_model()
+
+    if user_id:
+        user = User.objects.get(pk=user_id)
+    else:
+        user = None
+
+    document_file_page = DocumentFilePage.objects.get(pk=document_file_page_id)
+    try:
+        return document_file_page.get_image_tile_info(
+            maximum_layer_order=maximum_layer_order, user=user
+        )
+    except LockError as exception:
+        logger.warning(
+            'LockError during attempt to generate document page image '
+            'tile pyramid for document id: %d, document file id: %d, '
+            'document file page id: %d. Retrying.',
+            document_file_page.document_file.document_id,
+            document_file_page.document_file_id,
+            document_file_page.pk,
+        )
+        raise self.retry(exc=exception)
+
+
 @app.task(
     bind=True, default_retry_delay=UPLOAD_NEW_VERSION_RETRY_DELAY,
     ignore_result=True
@@ -196,6 +267,29 @@ def task_document_version_page_list_reset(document_version_id):
     document_version.pages_reset()
 
 
+@app.task(
+    bind=True,
+    default_retry_delay=DOCUMENT_VERSION_PAGE_IMAGE_PREWARM_RETRY_DELAY,
+    ignore_result=True, max_retries=None
+)
+def task_document_version_page_images_prewarm(
+    self, document_version_id, page_count=None
+):
+    DocumentVersion = apps.get_model(
+        app_label='documents', model_name='DocumentVersion'
+    )
+
+    document_version = DocumentVersion.objects.get(pk=document_version_id)
+    try:
+        document_version.page_images_prewarm(page_count=page_count)
+    except LockError as exception:
+        logger.warning(
+            'LockError during attempt to prewarm the page images of '
+            'document version: %s. Retrying.', document_version
+        )
+        raise self.retry(exc=exception)
+
+
 @app.task(ignore_result=True)
 def task_document_version_export(
     document_version_id, organization_installation_url=None, user_id=None
@@ -255,6 +349,80 @@ def task_document_version_page_image_generate(
         raise self.retry(exc=exception)
 
 
+@app.task(
+    bind=True,
+    default_retry_delay=setting_task_document_version_page_image_generate_retry_delay.value
+)
+def task_document_version_page_image_tile_generate(
+    self, document_version_page_id, level, column, row,
+    maximum_layer_order=None, user_id=None
+):
+    DocumentVersionPage = apps.get_model(
+        app_label='documents', model_name='DocumentVersionPage'
+    )
+    User = get_user_model()
+
+    if user_id:
+        user = User.objects.get(pk=user_id)
+    else:
+        user = None
+
+    document_version_page = DocumentVersionPage.objects.get(
+        pk=document_version_page_id
+    )
+    try:
+        return document_version_page.generate_image_tile(
+            column=column, level=level,
+            maximum_layer_order=maximum_layer_order, row=row, user=user
+        )
+    except LockError as exception:
+        logger.warning(
+            'LockError during attempt to generate document page image '
+            'tile for document id: %d, document version id: %d, document '
+            'version page id: %d. Retrying.',
+            document_version_page.document_version.document_id,
+            document_version_page.document_version_id,
+            document_version_page.pk,
+        )
+        raise self.retry(exc=exception)
+
+
+@app.task(
+    bind=True,
+    default_retry_delay=setting_task_document_version_page_image_generate_retry_delay.value
+)
+def task_document_version_page_image_tile_info(
+    self, document_version_page_id, maximum_layer_order=None, user_id=None
+):
+    DocumentVersionPage = apps.get_model(
+        app_label='documents', model_name='DocumentVersionPage'
+    )
+    User = get_user_model()
+
+    if user_id:
+        user = User.objects.get(pk=user_id)
+    else:
+        user = None
+
+    document_version_page = DocumentVersionPage.objects.get(
+        pk=document_version_page_id
+    )
+    try:
+        return document_version_page.get_image_tile_info(
+            maximum_layer_order=maximum_layer_order, user=user
+        )
+    except LockError as exception:
+        logger.warning(
+            'LockError during attempt to generate document page image '
+            'tile pyramid for document id: %d, document version id: %d, '
+            'document version page id: %d. Retrying.',
+            document_version_page.document_version.document_id,
+            document_version_page.document_version_id,
+            document_version_page.pk,
+        )
+        raise self.retry(exc=exception)
+
+
 # Trash can
 
 @app.task(ignore_result=True)
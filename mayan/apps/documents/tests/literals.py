@@ -36,6 +36,7 @@ TEST_NON_ASCII_COMPRESSED_DOCUMENT_FILENAME = 'I18N_title_áéíóúüñÑ.png.z
 TEST_NON_ASCII_DOCUMENT_FILENAME = 'I18N_title_áéíóúüñÑ.png'
 TEST_OFFICE_DOCUMENT = 'simple_2_page_document.doc'
 TEST_PDF_DOCUMENT_FILENAME = 'mayan_11_1.pdf'
+TEST_SINGLE_FLIGHT_LOCK_HOLD_TIME = 1  # Seconds
 TEST_SMALL_DOCUMENT_FILENAME = 'title_page.png'
 TEST_SMALL_DOCUMENT_CHECKSUM = 'efa10e6cc21f83078aaa94d5cbe51de67b51af706143b\
 afc7fd6d4c02124879a'
@@ -166,12 +166,33 @@ class DocumentFilePageAPIViewTestMixin:
             }
         )
 
-    def _request_test_document_file_page_image_api_view(self):
+    def _request_test_document_file_page_image_api_view(self, **kwargs):
         return self.get(
             viewname='rest_api:documentfilepage-image', kwargs={
                 'document_id': self.test_document.pk,
                 'document_file_id': self.test_document_file.pk,
                 'document_file_page_id': self.test_document_file_page.pk
+            }, **kwargs
+        )
+
+    def _request_test_document_file_page_image_tile_api_view(
+        self, level=0, column=0, row=0
+    ):
+        return self.get(
+            viewname='rest_api:documentfilepage-image-tile', kwargs={
+                'document_id': self.test_document.pk,
+                'document_file_id': self.test_document_file.pk,
+                'document_file_page_id': self.test_document_file_page.pk,
+                'level': level, 'column': column, 'row': row
+            }
+        )
+
+    def _request_test_document_file_page_image_tile_info_api_view(self):
+        return self.get(
+            viewname='rest_api:documentfilepage-image-tile-info', kwargs={
+                'document_id': self.test_document.pk,
+                'document_file_id': self.test_document_file.pk,
+                'document_file_page_id': self.test_document_file_page.pk
             }
         )
 
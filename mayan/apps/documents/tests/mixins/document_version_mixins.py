@@ -161,12 +161,33 @@ class DocumentVersionPageAPIViewTestMixin:
             }
         )
 
-    def _request_test_document_version_page_image_api_view(self):
+    def _request_test_document_version_page_image_api_view(self, **kwargs):
         return self.get(
             viewname='rest_api:documentversionpage-image', kwargs={
                 'document_id': self.test_document.pk,
                 'document_version_id': self.test_document_version.pk,
                 'document_version_page_id': self.test_document_version_page.pk
+            }, **kwargs
+        )
+
+    def _request_test_document_version_page_image_tile_api_view(
+        self, level=0, column=0, row=0
+    ):
+        return self.get(
+            viewname='rest_api:documentversionpage-image-tile', kwargs={
+                'document_id': self.test_document.pk,
+                'document_version_id': self.test_document_version.pk,
+                'document_version_page_id': self.test_document_version_page.pk,
+                'level': level, 'column': column, 'row': row
+            }
+        )
+
+    def _request_test_document_version_page_image_tile_info_api_view(self):
+        return self.get(
+            viewname='rest_api:documentversionpage-image-tile-info', kwargs={
+                'document_id': self.test_document.pk,
+                'document_version_id': self.test_document_version.pk,
+                'document_version_page_id': self.test_document_version_page.pk
             }
         )
 
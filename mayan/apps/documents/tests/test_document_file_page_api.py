@@ -1,9 +1,17 @@
+import multiprocessing
+import time
+
+import mock
+
 from rest_framework import status
 
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.rest_api.tests.base import BaseAPITestCase
 
 from ..permissions import permission_document_file_view
+from ..tasks import task_document_file_page_image_generate
 
+from .literals import TEST_SINGLE_FLIGHT_LOCK_HOLD_TIME
 from .mixins.document_mixins import DocumentTestMixin
 from .mixins.document_file_mixins import DocumentFilePageAPIViewTestMixin
 
@@ -34,6 +42,105 @@ class DocumentFilePageAPIViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_document_file_page_image_api_view_accept_with_access(self):
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_file_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_file_page_image_api_view(
+            headers={'HTTP_ACCEPT': 'image/webp,image/*,*/*;q=0.8'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(
+            response['Content-Type'] in ('image/png', 'image/webp')
+        )
+        self.assertTrue('Accept' in response['Vary'])
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_file_page_image_api_view_cached_with_access(self):
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_file_view
+        )
+
+        self.test_document_file_page.generate_image(
+            user=self._test_case_user
+        )
+
+        self._clear_events()
+
+        with mock.patch.object(
+            target=task_document_file_page_image_generate,
+            attribute='apply_async'
+        ) as mock_object:
+            response = self._request_test_document_file_page_image_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(mock_object.called)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_file_page_image_api_view_in_flight_with_access(self):
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_file_view
+        )
+
+        cache_filename = self.test_document_file_page.generate_image(
+            user=self._test_case_user
+        )
+        single_flight_lock_name = 'single_flight_{}'.format(
+            self.test_document_file_page.get_lock_name(
+                _combined_cache_filename=cache_filename
+            )
+        )
+        file_lock_name = self.test_document_file_page.cache_partition.get_file_lock_name(
+            filename=cache_filename
+        )
+
+        # Simulate the cache file being written by a request in flight in
+        # another web process.
+        self.test_document_file_page.cache_partition.files.filter(
+            filename=cache_filename
+        ).update(immutable=False)
+
+        event_locked = multiprocessing.Event()
+
+        def hold_locks():
+            locking_backend = LockingBackend.get_backend()
+            locks = (
+                locking_backend.acquire_lock(name=single_flight_lock_name),
+                locking_backend.acquire_lock(name=file_lock_name)
+            )
+            event_locked.set()
+            time.sleep(TEST_SINGLE_FLIGHT_LOCK_HOLD_TIME)
+            for lock in locks:
+                lock.release()
+
+        process = multiprocessing.get_context(method='fork').Process(
+            target=hold_locks
+        )
+        process.start()
+        event_locked.wait(timeout=TEST_SINGLE_FLIGHT_LOCK_HOLD_TIME)
+
+        self._clear_events()
+
+        with mock.patch.object(
+            target=task_document_file_page_image_generate,
+            attribute='apply_async'
+        ) as mock_object:
+            response = self._request_test_document_file_page_image_api_view()
+
+        process.join()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(mock_object.called)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_document_file_page_image_api_view_no_permission(self):
         self._clear_events()
 
@@ -56,6 +163,66 @@ class DocumentFilePageAPIViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_document_file_page_image_tile_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_document_file_page_image_tile_api_view()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_file_page_image_tile_api_view_with_access(self):
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_file_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_file_page_image_tile_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_file_page_image_tile_invalid_api_view_with_access(self):
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_file_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_file_page_image_tile_api_view(
+            level=99
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_file_page_image_tile_info_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_document_file_page_image_tile_info_api_view()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_file_page_image_tile_info_api_view_with_access(self):
+        self.grant_access(
+            obj=self.test_document, permission=permission_document_file_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_file_page_image_tile_info_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['level_count'] > 0)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_document_file_page_list_api_view_no_permission(self):
         self._clear_events()
 
@@ -0,0 +1,179 @@
+from PIL import Image
+
+from mayan.apps.smart_settings.tests.mixins import SmartSettingTestMixin
+
+from ..settings import (
+    setting_display_width, setting_document_file_page_image_batch_size
+)
+
+from .base import GenericDocumentTestCase
+from .literals import TEST_MULTI_PAGE_TIFF
+
+
+class DocumentFilePageBaseImageTestCase(
+    SmartSettingTestMixin, GenericDocumentTestCase
+):
+    test_document_filename = TEST_MULTI_PAGE_TIFF
+
+    def _get_test_document_file_page_base_image_count(self):
+        count = 0
+        for document_file_page in self.test_document_file.pages.all():
+            count += document_file_page.cache_partition.files.filter(
+                filename='base_image'
+            ).count()
+
+        return count
+
+    def test_base_image_batch_generation(self):
+        self.test_document_file.pages.first().generate_image()
+
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(),
+            self.test_document_file.pages.count()
+        )
+
+    def test_base_image_batch_generation_disabled(self):
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(
+                setting_document_file_page_image_batch_size.global_name
+            ), value='1'
+        )
+
+        self.test_document_file.pages.first().generate_image()
+
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(), 1
+        )
+
+    def test_base_image_batch_generation_existing(self):
+        test_document_file_page_last = self.test_document_file.pages.last()
+        test_document_file_page_last.generate_image()
+
+        cache_file = test_document_file_page_last.cache_partition.get_file(
+            filename='base_image'
+        )
+
+        self.test_document_file.pages.first().generate_image()
+
+        self.assertEqual(
+            self._get_test_document_file_page_base_image_count(),
+            self.test_document_file.pages.count()
+        )
+        self.assertEqual(
+            test_document_file_page_last.cache_partition.get_file(
+                filename='base_image'
+            ), cache_file
+        )
+
+
+class DocumentFilePageCacheDeduplicationTestCase(GenericDocumentTestCase):
+    def setUp(self):
+        super().setUp()
+        self.test_document_file_page.generate_image()
+
+        self._upload_test_document()
+
+    def test_cache_partition_shared(self):
+        self.assertEqual(
+            self.test_documents[0].file_latest.pages.first().cache_partition,
+            self.test_document_file_page.cache_partition
+        )
+        self.assertEqual(
+            self.test_documents[0].file_latest.cache_partition,
+            self.test_document_file.cache_partition
+        )
+
+    def test_cache_partition_reference_release(self):
+        cache_partition = self.test_document_file_page.cache_partition
+
+        self.test_documents[0].file_latest.delete()
+
+        self.assertTrue(cache_partition.files.exists())
+
+        self.test_document_file.delete()
+
+        self.assertFalse(
+            cache_partition.cache.partitions.filter(
+                pk=cache_partition.pk
+            ).exists()
+        )
+
+
+class DocumentFilePageImageTileTestCase(
+    SmartSettingTestMixin, GenericDocumentTestCase
+):
+    def test_image_tile_generation(self):
+        image_tile_info = self.test_document_file_page.get_image_tile_info()
+
+        cache_filename = self.test_document_file_page.generate_image_tile(
+            level=image_tile_info['level_count'] - 1, column=0, row=0
+        )
+
+        cache_file = self.test_document_file_page.cache_partition.get_file(
+            filename=cache_filename
+        )
+        with cache_file.open() as file_object:
+            image = Image.open(fp=file_object)
+            self.assertEqual(
+                image.size, (
+                    min(image_tile_info['tile_size'], image_tile_info['width']),
+                    min(image_tile_info['tile_size'], image_tile_info['height'])
+                )
+            )
+
+    def test_image_tile_lowest_level(self):
+        cache_filename = self.test_document_file_page.generate_image_tile(
+            level=0, column=0, row=0
+        )
+
+        cache_file = self.test_document_file_page.cache_partition.get_file(
+            filename=cache_filename
+        )
+        with cache_file.open() as file_object:
+            self.assertEqual(Image.open(fp=file_object).size, (1, 1))
+
+    def test_image_tile_native_resolution(self):
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_display_width.global_name),
+            value='100'
+        )
+
+        image_tile_info = self.test_document_file_page.get_image_tile_info()
+
+        base_image = self.test_document_file_page.get_image(_as_image=True)
+        self.assertTrue(base_image.size[0] > 100)
+        self.assertEqual(
+            (image_tile_info['width'], image_tile_info['height']),
+            base_image.size
+        )
+
+        # The display image is not needed to generate the pyramid.
+        self.assertFalse(
+            self.test_document_file_page.cache_partition.files.filter(
+                filename=self.test_document_file_page.get_combined_cache_filename()
+            ).exists()
+        )
+
+    def test_image_tile_geometry_out_of_range(self):
+        self.assertEqual(
+            self.test_document_file_page.get_image_tile_geometry(
+                width=1024, height=600, level=11, column=0, row=0
+            ), None
+        )
+        self.assertEqual(
+            self.test_document_file_page.get_image_tile_geometry(
+                width=1024, height=600, level=10, column=4, row=0
+            ), None
+        )
+
+    def test_image_tile_level_count(self):
+        self.assertEqual(
+            self.test_document_file_page.get_image_tile_level_count(
+                width=1, height=1
+            ), 1
+        )
+        self.assertEqual(
+            self.test_document_file_page.get_image_tile_level_count(
+                width=1024, height=600
+            ), 11
+        )
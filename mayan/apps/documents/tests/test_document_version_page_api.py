@@ -210,6 +210,26 @@ class DocumentVersionPageAPIViewTestCase(
         self.assertEqual(events[0].target, self.test_document_version_page)
         self.assertEqual(events[0].verb, event_document_version_page_edited.id)
 
+    def test_document_version_page_image_api_view_accept_with_access(self):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_api_view(
+            headers={'HTTP_ACCEPT': 'image/webp,image/*,*/*;q=0.8'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(
+            response['Content-Type'] in ('image/png', 'image/webp')
+        )
+        self.assertTrue('Accept' in response['Vary'])
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_document_version_page_image_api_view_no_permission(self):
         self._clear_events()
 
@@ -233,6 +253,69 @@ class DocumentVersionPageAPIViewTestCase(
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
+    def test_document_version_page_image_tile_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_tile_api_view()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_tile_api_view_with_access(self):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_tile_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_tile_invalid_api_view_with_access(self):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_tile_api_view(
+            level=99
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_tile_info_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_tile_info_api_view()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_document_version_page_image_tile_info_api_view_with_access(self):
+        self.grant_access(
+            obj=self.test_document_version,
+            permission=permission_document_version_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_document_version_page_image_tile_info_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['level_count'] > 0)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
     def test_document_version_page_list_api_view_no_permission(self):
         self._clear_events()
 
@@ -1,12 +1,29 @@
+import mock
+
+from mayan.apps.converter.layers import layer_saved_transformations
 from mayan.apps.converter.transformations import (
     BaseTransformation, TransformationRotate90
 )
 from mayan.apps.converter.models import LayerTransformation
 from mayan.apps.converter.tests.mixins import LayerTestMixin
+from mayan.apps.converter.utils import get_accepted_output_formats
+from mayan.apps.lock_manager.exceptions import LockError
+from mayan.apps.smart_settings.tests.mixins import SmartSettingTestMixin
+
+from ..literals import (
+    DOCUMENT_FILE_ACTION_PAGES_APPEND, DOCUMENT_IMAGE_TASK_TIMEOUT,
+    DOCUMENT_VERSION_PAGE_IMAGE_PREWARM_ACCEPT_HEADERS
+)
+from ..models.document_version_models import DocumentVersion
+from ..settings import (
+    setting_document_version_page_image_prewarm_concurrency,
+    setting_thumbnail_height, setting_thumbnail_width
+)
 
-from ..literals import DOCUMENT_FILE_ACTION_PAGES_APPEND
+from ..tasks import task_document_version_page_images_prewarm
 
 from .base import GenericDocumentTestCase
+from .literals import TEST_MULTI_PAGE_TIFF
 
 
 class DocumentVersionPageTestCase(LayerTestMixin, GenericDocumentTestCase):
@@ -181,3 +198,136 @@ class DocumentVersionPageTestCase(LayerTestMixin, GenericDocumentTestCase):
         self.assertEqual(test_generate_image_1, test_generate_image_5)
         self.assertEqual(test_api_image_url_1, test_api_image_url_5)
         self.assertEqual(test_image_1, test_image_5)
+
+
+class DocumentVersionPageImageTileTestCase(GenericDocumentTestCase):
+    def test_image_tile_source_transformations(self):
+        test_document_version_page = self.test_document_version.pages.first()
+
+        layer_saved_transformations.add_transformation_to(
+            obj=test_document_version_page, arguments={},
+            transformation_class=TransformationRotate90
+        )
+
+        image_tile_info = test_document_version_page.get_image_tile_info()
+
+        # The pyramid uses the native resolution image of the source page
+        # with the stored transformations of the version page.
+        width, height = test_document_version_page.content_object.get_image(
+            _as_image=True
+        ).size
+        self.assertEqual(
+            (image_tile_info['width'], image_tile_info['height']),
+            (height, width)
+        )
+
+
+class DocumentVersionPageImagePrewarmTestCase(
+    SmartSettingTestMixin, GenericDocumentTestCase
+):
+    test_document_filename = TEST_MULTI_PAGE_TIFF
+
+    def _get_test_document_version_page_image_count(
+        self, document_version_page
+    ):
+        return document_version_page.cache_partition.files.exclude(
+            filename__endswith='base_image'
+        ).count()
+
+    def test_page_images_prewarm(self):
+        self.test_document_type.page_image_prewarm_page_count = 1
+        self.test_document_type.save()
+
+        self.test_document_version.page_images_prewarm()
+
+        self.assertNotEqual(
+            self._get_test_document_version_page_image_count(
+                document_version_page=self.test_document_version.pages.first()
+            ), 0
+        )
+        self.assertEqual(
+            self._get_test_document_version_page_image_count(
+                document_version_page=self.test_document_version.pages.last()
+            ), 0
+        )
+
+    def test_page_images_prewarm_browser_request(self):
+        self.test_document_type.page_image_prewarm_page_count = 1
+        self.test_document_type.save()
+
+        self.test_document_version.page_images_prewarm()
+
+        test_document_version_page = self.test_document_version.pages.first()
+
+        # Same arguments used by the thumbnail widget and the image API
+        # view.
+        cache_filename = test_document_version_page.get_combined_cache_filename(
+            height=setting_thumbnail_height.value,
+            output_formats=get_accepted_output_formats(
+                accept=DOCUMENT_VERSION_PAGE_IMAGE_PREWARM_ACCEPT_HEADERS[0]
+            ), user=self._test_case_user, width=setting_thumbnail_width.value
+        )
+
+        self.assertTrue(
+            test_document_version_page.cache_partition.files.filter(
+                filename=cache_filename
+            ).exists()
+        )
+
+    def test_page_images_prewarm_disabled(self):
+        self.test_document_version.page_images_prewarm()
+
+        self.assertEqual(
+            self._get_test_document_version_page_image_count(
+                document_version_page=self.test_document_version.pages.first()
+            ), 0
+        )
+
+    def test_page_images_prewarm_lock_per_page(self):
+        self.test_document_type.page_image_prewarm_page_count = 2
+        self.test_document_type.save()
+
+        with mock.patch.object(
+            attribute='page_images_prewarm_slot_acquire',
+            target=self.test_document_version,
+            wraps=self.test_document_version.page_images_prewarm_slot_acquire
+        ) as mock_slot_acquire:
+            self.test_document_version.page_images_prewarm()
+
+        self.assertEqual(mock_slot_acquire.call_count, 2)
+        for call in mock_slot_acquire.call_args_list:
+            self.assertTrue(
+                call[1]['timeout'] <= DOCUMENT_IMAGE_TASK_TIMEOUT * 2 * len(
+                    DOCUMENT_VERSION_PAGE_IMAGE_PREWARM_ACCEPT_HEADERS
+                )
+            )
+
+    def test_page_images_prewarm_task_slot_busy(self):
+        side_effect = (LockError, None)
+
+        with mock.patch.object(
+            attribute='page_images_prewarm', side_effect=side_effect,
+            target=DocumentVersion
+        ) as mock_page_images_prewarm:
+            # Execute as a retry past the Celery default limit of 3.
+            result = task_document_version_page_images_prewarm.apply(
+                kwargs={'document_version_id': self.test_document_version.pk},
+                retries=5, throw=False
+            )
+
+        self.assertEqual(
+            mock_page_images_prewarm.call_count, len(side_effect)
+        )
+        self.assertTrue(result.successful())
+
+    def test_page_images_prewarm_no_slot_available(self):
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(
+                setting_document_version_page_image_prewarm_concurrency.global_name
+            ), value='0'
+        )
+        self.test_document_type.page_image_prewarm_page_count = 1
+        self.test_document_type.save()
+
+        with self.assertRaises(expected_exception=LockError):
+            self.test_document_version.page_images_prewarm()
@@ -0,0 +1,64 @@
+from io import StringIO
+
+from django.core import management
+from django.core.management.base import CommandError
+
+from .base import GenericDocumentTestCase
+from .literals import TEST_MULTI_PAGE_TIFF
+
+
+class WarmDocumentCacheManagementCommandTestCase(GenericDocumentTestCase):
+    test_document_filename = TEST_MULTI_PAGE_TIFF
+
+    def _get_test_document_version_page_warm_count(self):
+        count = 0
+        for document_version_page in self.test_document_version.pages.all():
+            if document_version_page.cache_partition.files.exclude(filename__endswith='base_image').exists():
+                count += 1
+
+        return count
+
+    def test_warm_document_cache_document_type(self):
+        management.call_command(
+            'warmdocumentcache', document_type_ids=[self.test_document_type.pk]
+        )
+
+        self.assertEqual(
+            self._get_test_document_version_page_warm_count(),
+            self.test_document_version.pages.count()
+        )
+
+    def test_warm_document_cache_page_count(self):
+        management.call_command(
+            'warmdocumentcache', document_type_ids=[self.test_document_type.pk],
+            page_count=1
+        )
+
+        self.assertEqual(self._get_test_document_version_page_warm_count(), 1)
+
+    def test_warm_document_cache_page_count_zero(self):
+        management.call_command(
+            'warmdocumentcache', document_type_ids=[self.test_document_type.pk],
+            page_count=0
+        )
+
+        self.assertEqual(self._get_test_document_version_page_warm_count(), 0)
+
+    def test_warm_document_cache_output(self):
+        stdout = StringIO()
+
+        management.call_command(
+            'warmdocumentcache', document_type_ids=[self.test_document_type.pk],
+            page_count=1, stdout=stdout
+        )
+
+        self.assertTrue(
+            '1 document versions submitted for the cache warming of 1 '
+            'pages.' in stdout.getvalue()
+        )
+
+    def test_warm_document_cache_no_arguments(self):
+        with self.assertRaises(expected_exception=CommandError):
+            management.call_command('warmdocumentcache')
+
+        self.assertEqual(self._get_test_document_version_page_warm_count(), 0)
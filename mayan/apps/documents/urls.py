@@ -7,6 +7,7 @@ from .api_views.document_api_views import (
 from .api_views.document_file_api_views import (
     APIDocumentFileDetailView, APIDocumentFileDownloadView,
     APIDocumentFileListView, APIDocumentFilePageImageView,
+    APIDocumentFilePageImageTileInfoView, APIDocumentFilePageImageTileView,
     APIDocumentFilePageDetailView, APIDocumentFilePageListView
 )
 from .api_views.document_type_api_views import (
@@ -16,7 +17,9 @@ from .api_views.document_type_api_views import (
 from .api_views.document_version_api_views import (
     APIDocumentVersionDetailView, APIDocumentVersionExportView,
     APIDocumentVersionListView, APIDocumentVersionPageDetailView,
-    APIDocumentVersionPageImageView, APIDocumentVersionPageListView
+    APIDocumentVersionPageImageView,
+    APIDocumentVersionPageImageTileInfoView,
+    APIDocumentVersionPageImageTileView, APIDocumentVersionPageListView
 )
 from .api_views.favorite_document_api_views import (
     APIFavoriteDocumentDetailView, APIFavoriteDocumentListView
@@ -586,6 +589,16 @@ api_urls_document_files = [
         regex=r'^documents/(?P<document_id>[0-9]+)/files/(?P<document_file_id>[0-9]+)/pages/(?P<document_file_page_id>[0-9]+)/image/$',
         name='documentfilepage-image',
         view=APIDocumentFilePageImageView.as_view()
+    ),
+    url(
+        regex=r'^documents/(?P<document_id>[0-9]+)/files/(?P<document_file_id>[0-9]+)/pages/(?P<document_file_page_id>[0-9]+)/image/tiles/$',
+        name='documentfilepage-image-tile-info',
+        view=APIDocumentFilePageImageTileInfoView.as_view()
+    ),
+    url(
+        regex=r'^documents/(?P<document_id>[0-9]+)/files/(?P<document_file_id>[0-9]+)/pages/(?P<document_file_page_id>[0-9]+)/image/tiles/(?P<level>[0-9]+)/(?P<column>[0-9]+)/(?P<row>[0-9]+)/$',
+        name='documentfilepage-image-tile',
+        view=APIDocumentFilePageImageTileView.as_view()
     )
 ]
 
@@ -640,6 +653,16 @@ api_urls_document_versions = [
         regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/(?P<document_version_page_id>[0-9]+)/image/$',
         name='documentversionpage-image',
         view=APIDocumentVersionPageImageView.as_view()
+    ),
+    url(
+        regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/(?P<document_version_page_id>[0-9]+)/image/tiles/$',
+        name='documentversionpage-image-tile-info',
+        view=APIDocumentVersionPageImageTileInfoView.as_view()
+    ),
+    url(
+        regex=r'^documents/(?P<document_id>[0-9]+)/versions/(?P<document_version_id>[0-9]+)/pages/(?P<document_version_page_id>[0-9]+)/image/tiles/(?P<level>[0-9]+)/(?P<column>[0-9]+)/(?P<row>[0-9]+)/$',
+        name='documentversionpage-image-tile',
+        view=APIDocumentVersionPageImageTileView.as_view()
     )
 ]
 
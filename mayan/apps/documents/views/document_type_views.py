@@ -116,7 +116,7 @@ class DocumentTypeDeleteView(SingleObjectDeleteView):
 
 
 class DocumentTypeEditView(SingleObjectEditView):
-    fields = ('label',)
+    fields = ('label', 'page_image_prewarm_page_count')
     model = DocumentType
     object_permission = permission_document_type_edit
     pk_url_kwarg = 'document_type_id'
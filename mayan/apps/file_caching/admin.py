@@ -5,4 +5,6 @@ from .models import Cache
 
 @admin.register(Cache)
 class CacheAdmin(admin.ModelAdmin):
-    list_display = ('defined_storage_name', 'maximum_size')
+    list_display = (
+        'defined_storage_name', 'maximum_size', 'eviction_policy'
+    )
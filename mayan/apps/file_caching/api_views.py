@@ -0,0 +1,28 @@
+from mayan.apps.rest_api import generics
+
+from .models import Cache
+from .permissions import permission_cache_view
+from .serializers import CacheSerializer
+
+
+class APICacheListView(generics.ListAPIView):
+    """
+    get: Returns a list of all the file caches and their usage metrics.
+    """
+    mayan_object_permissions = {'GET': (permission_cache_view,)}
+    ordering_fields = (
+        'defined_storage_name', 'id', 'maximum_size', 'metric_evictions',
+        'metric_hits', 'metric_misses', 'total_size'
+    )
+    queryset = Cache.objects.all()
+    serializer_class = CacheSerializer
+
+
+class APICacheView(generics.RetrieveAPIView):
+    """
+    get: Return the details and the usage metrics of the selected file cache.
+    """
+    lookup_url_kwarg = 'cache_id'
+    mayan_object_permissions = {'GET': (permission_cache_view,)}
+    queryset = Cache.objects.all()
+    serializer_class = CacheSerializer
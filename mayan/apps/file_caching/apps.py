@@ -22,6 +22,7 @@ from .permissions import permission_cache_purge, permission_cache_view
 class FileCachingConfig(MayanAppConfig):
     app_namespace = 'file_caching'
     app_url = 'file_caching'
+    has_rest_api = True
     has_tests = True
     name = 'mayan.apps.file_caching'
     verbose_name = _('File caching')
@@ -61,6 +62,14 @@ class FileCachingConfig(MayanAppConfig):
             attribute='get_total_size_display', include_label=True,
             source=Cache
         )
+        SourceColumn(
+            attribute='get_eviction_policy_label', include_label=True,
+            is_sortable=True, sort_field='eviction_policy', source=Cache
+        )
+        SourceColumn(
+            attribute='get_metric_hit_ratio_display', include_label=True,
+            source=Cache
+        )
 
         menu_list_facet.bind_links(
             links=(link_acl_list,), sources=(Cache,)
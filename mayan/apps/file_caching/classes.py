@@ -0,0 +1,379 @@
+from collections import OrderedDict
+import hashlib
+import logging
+import threading
+import time
+
+from django.apps import apps
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import F
+from django.utils.text import format_lazy
+from django.utils.translation import ugettext_lazy as _
+
+from .literals import CACHE_METRICS_MAXIMUM_PENDING_MISSES
+from .settings import (
+    setting_access_log_flush_interval, setting_access_log_flush_size,
+    setting_memory_tier_maximum_file_size, setting_memory_tier_maximum_size,
+    setting_shared_tier_cache_name
+)
+
+__all__ = (
+    'CacheEvictionPolicy', 'CacheEvictionPolicyGDSF',
+    'CacheEvictionPolicyLFUDA', 'CacheEvictionPolicyLRU', 'CacheMetrics',
+    'CachePartitionFileAccessLog', 'CachePartitionFileMemoryTier'
+)
+logger = logging.getLogger(name=__name__)
+
+
+class CacheEvictionPolicy:
+    """
+    Calculate the eviction priority of a cache partition file. When a
+    cache is pruned, the files with the lowest priority are deleted first.
+    The priority is updated when the file is created and every time its
+    access log entries are written to the database.
+    """
+    default = False
+    _registry = {}
+
+    @classmethod
+    def get(cls, name):
+        return cls._registry[name]
+
+    @classmethod
+    def get_choices(cls):
+        choices = []
+
+        for name, klass in cls._registry.items():
+            choices.append(
+                (
+                    name, format_lazy(
+                        '{} - {}', klass.label, klass.description
+                    )
+                )
+            )
+
+        return sorted(choices)
+
+    @classmethod
+    def get_default(cls):
+        for policy in cls._registry.values():
+            if policy.default:
+                return policy.name
+
+    @classmethod
+    def register(cls, klass):
+        cls._registry[klass.name] = klass
+
+    def get_priority(self, cache, file_size, hits, timestamp):
+        raise NotImplementedError
+
+
+class CacheEvictionPolicyGDSF(CacheEvictionPolicy):
+    name = 'gdsf'
+    label = _('GDSF')
+    description = _(
+        'Greedy Dual Size Frequency. Deletes the files with the lowest '
+        'access frequency relative to their size first, favoring keeping '
+        'many small files. Aged by the priority of the last deleted file.'
+    )
+
+    def get_priority(self, cache, file_size, hits, timestamp):
+        return cache.eviction_clock + (hits + 1) / max(file_size, 1)
+
+
+class CacheEvictionPolicyLFUDA(CacheEvictionPolicy):
+    name = 'lfuda'
+    label = _('LFU-DA')
+    description = _(
+        'Least frequently used with dynamic aging. Deletes the least '
+        'accessed files first. Aged by the priority of the last deleted '
+        'file to allow old frequently accessed files to be deleted.'
+    )
+
+    def get_priority(self, cache, file_size, hits, timestamp):
+        return cache.eviction_clock + hits + 1
+
+
+class CacheEvictionPolicyLRU(CacheEvictionPolicy):
+    default = True
+    name = 'lru'
+    label = _('LRU')
+    description = _(
+        'Least recently used. Deletes the files accessed the longest time '
+        'ago first.'
+    )
+
+    def get_priority(self, cache, file_size, hits, timestamp):
+        return timestamp
+
+
+class CacheMetrics:
+    """
+    Accumulate the usage counters of the caches in this process and add
+    them to the counters of the cache database rows in batches. The time
+    between a cache miss and the creation of the missing file in the same
+    process is counted as the generation time of the file.
+    """
+    _entries = {}
+    _flush_timestamp = time.time()
+    _lock = threading.Lock()
+    _pending_misses = OrderedDict()
+
+    @classmethod
+    def add(cls, cache_id, **values):
+        with cls._lock:
+            entry = cls._entries.setdefault(cache_id, {})
+            for name, value in values.items():
+                entry[name] = entry.get(name, 0) + value
+
+            flush = time.time() - cls._flush_timestamp >= setting_access_log_flush_interval.value
+
+        if flush:
+            cls.flush()
+
+    @classmethod
+    def add_eviction(cls, cache_partition_file):
+        cls.add(
+            cache_id=cache_partition_file.partition.cache_id,
+            eviction_age=max(
+                time.time() - cache_partition_file.datetime.timestamp(), 0
+            ), evictions=1
+        )
+
+    @classmethod
+    def add_generation(cls, cache_partition_file, timestamp):
+        """
+        Count a new file. The generation time is measured from the cache
+        miss of the file or from the provided timestamp if the miss was
+        not registered by this process.
+        """
+        key = (cache_partition_file.partition_id, cache_partition_file.filename)
+
+        with cls._lock:
+            timestamp = min(cls._pending_misses.pop(key, timestamp), timestamp)
+
+        cls.add(
+            bytes_written=cache_partition_file.file_size,
+            cache_id=cache_partition_file.partition.cache_id,
+            generation_count=1, generation_time=time.time() - timestamp
+        )
+
+    @classmethod
+    def add_hit(cls, cache_partition):
+        cls.add(cache_id=cache_partition.cache_id, hits=1)
+
+    @classmethod
+    def add_miss(cls, cache_partition, filename):
+        key = (cache_partition.pk, filename)
+
+        with cls._lock:
+            cls._pending_misses.setdefault(key, time.time())
+
+            while len(cls._pending_misses) > CACHE_METRICS_MAXIMUM_PENDING_MISSES:
+                cls._pending_misses.popitem(last=False)
+
+        cls.add(cache_id=cache_partition.cache_id, misses=1)
+
+    @classmethod
+    def flush(cls):
+        Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+
+        with cls._lock:
+            entries = cls._entries
+            cls._entries = {}
+            cls._flush_timestamp = time.time()
+
+        if not entries:
+            return
+
+        with transaction.atomic():
+            for cache_id, values in entries.items():
+                Cache.objects.filter(pk=cache_id).update(
+                    **{
+                        'metric_{}'.format(name): F(
+                            'metric_{}'.format(name)
+                        ) + value for name, value in values.items()
+                    }
+                )
+
+
+class CachePartitionFileAccessLog:
+    """
+    Accumulate the accesses to the cache partition files of this process
+    and write them to the database in batches instead of updating the
+    file row on each access.
+    """
+    _entries = {}
+    _flush_timestamp = time.time()
+    _lock = threading.Lock()
+
+    @classmethod
+    def add(cls, cache_partition_file):
+        timestamp = time.time()
+
+        with cls._lock:
+            entry = cls._entries.setdefault(cache_partition_file.pk, [0, 0])
+            entry[0] += 1
+            entry[1] = timestamp
+
+            flush = (
+                len(cls._entries) >= setting_access_log_flush_size.value
+            ) or (
+                timestamp - cls._flush_timestamp >= setting_access_log_flush_interval.value
+            )
+
+        if flush:
+            cls.flush()
+
+    @classmethod
+    def flush(cls):
+        CachePartitionFile = apps.get_model(
+            app_label='file_caching', model_name='CachePartitionFile'
+        )
+
+        with cls._lock:
+            entries = cls._entries
+            cls._entries = {}
+            cls._flush_timestamp = time.time()
+
+        if not entries:
+            return
+
+        queryset = CachePartitionFile.objects.filter(
+            pk__in=list(entries.keys())
+        ).select_related('partition__cache')
+
+        with transaction.atomic():
+            for cache_partition_file in queryset:
+                hits, timestamp = entries[cache_partition_file.pk]
+                cache = cache_partition_file.partition.cache
+
+                CachePartitionFile.objects.filter(
+                    pk=cache_partition_file.pk
+                ).update(
+                    hits=F('hits') + hits,
+                    priority=cache.get_eviction_policy().get_priority(
+                        cache=cache,
+                        file_size=cache_partition_file.file_size,
+                        hits=cache_partition_file.hits + hits,
+                        timestamp=timestamp
+                    )
+                )
+
+
+class CachePartitionFileMemoryTier:
+    """
+    Keep the content of small cache partition files in memory to avoid
+    locking and opening the storage file on each read. The first tier is
+    a least recently used dictionary local to the process limited by a
+    byte budget. The optional second tier is a Django cache shared by all
+    the processes. Entries are keyed by the partition, the filename, the
+    primary key and the creation date time of the cache partition file so
+    that a file recreated with the same filename never matches an entry of
+    the deleted file.
+    """
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+    _size = 0
+
+    @staticmethod
+    def get_key(cache_partition_file):
+        return (
+            cache_partition_file.partition_id, cache_partition_file.filename,
+            cache_partition_file.pk,
+            cache_partition_file.datetime.timestamp()
+        )
+
+    @staticmethod
+    def get_shared_cache():
+        if setting_shared_tier_cache_name.value:
+            return caches[setting_shared_tier_cache_name.value]
+
+    @staticmethod
+    def get_shared_key(key):
+        return 'file_caching_{}'.format(
+            hashlib.sha256(
+                '{}-{}-{}-{}'.format(*key).encode()
+            ).hexdigest()
+        )
+
+    @classmethod
+    def _local_set(cls, key, content):
+        with cls._lock:
+            if key not in cls._entries:
+                cls._entries[key] = content
+                cls._size += len(content)
+
+                while cls._size > setting_memory_tier_maximum_size.value:
+                    evicted_key, evicted_content = cls._entries.popitem(
+                        last=False
+                    )
+                    cls._size -= len(evicted_content)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+            cls._size = 0
+
+    @classmethod
+    def delete(cls, cache_partition_file):
+        key = cls.get_key(cache_partition_file=cache_partition_file)
+
+        with cls._lock:
+            content = cls._entries.pop(key, None)
+            if content is not None:
+                cls._size -= len(content)
+
+        shared_cache = cls.get_shared_cache()
+        if shared_cache:
+            shared_cache.delete(key=cls.get_shared_key(key=key))
+
+    @classmethod
+    def delete_partition(cls, cache_partition):
+        with cls._lock:
+            for key in list(cls._entries):
+                if key[0] == cache_partition.pk:
+                    cls._size -= len(cls._entries.pop(key))
+
+    @classmethod
+    def get(cls, cache_partition_file):
+        key = cls.get_key(cache_partition_file=cache_partition_file)
+
+        with cls._lock:
+            content = cls._entries.get(key)
+            if content is not None:
+                cls._entries.move_to_end(key)
+                return content
+
+        shared_cache = cls.get_shared_cache()
+        if shared_cache:
+            content = shared_cache.get(key=cls.get_shared_key(key=key))
+            if content is not None:
+                cls._local_set(key=key, content=content)
+                return content
+
+    @classmethod
+    def is_eligible(cls, cache_partition_file):
+        return 0 < cache_partition_file.file_size <= min(
+            setting_memory_tier_maximum_file_size.value,
+            setting_memory_tier_maximum_size.value
+        )
+
+    @classmethod
+    def set(cls, cache_partition_file, content):
+        key = cls.get_key(cache_partition_file=cache_partition_file)
+
+        cls._local_set(key=key, content=content)
+
+        shared_cache = cls.get_shared_cache()
+        if shared_cache:
+            shared_cache.set(
+                key=cls.get_shared_key(key=key), value=content
+            )
+
+
+CacheEvictionPolicy.register(klass=CacheEvictionPolicyGDSF)
+CacheEvictionPolicy.register(klass=CacheEvictionPolicyLFUDA)
+CacheEvictionPolicy.register(klass=CacheEvictionPolicyLRU)
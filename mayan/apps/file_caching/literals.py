@@ -1,2 +1,23 @@
+# Maximum number of cache misses waiting for their file to be created,
+# kept to measure the generation time of the files.
+CACHE_METRICS_MAXIMUM_PENDING_MISSES = 1000
+
+# Number of cache partition files updated per query when the eviction
+# priorities are recalculated.
+CACHE_PRIORITY_UPDATE_BATCH_SIZE = 1000
+
+CACHE_PRUNE_CHECK_INTERVAL = 60 * 5  # 5 minutes
+CACHE_PRUNE_LOCK_TIMEOUT = 60 * 10  # 10 minutes
+CACHE_PRUNE_SCHEDULE_LOCK_TIMEOUT = 30  # 30 seconds
+
+DEFAULT_ACCESS_LOG_FLUSH_INTERVAL = 60
+DEFAULT_ACCESS_LOG_FLUSH_SIZE = 100
 DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS = 100
 DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS = 100
+DEFAULT_MEMORY_TIER_MAXIMUM_FILE_SIZE = 256 * 2 ** 10  # 256 Kilobytes
+DEFAULT_MEMORY_TIER_MAXIMUM_SIZE = 16 * 2 ** 20  # 16 Megabytes
+DEFAULT_PRUNE_HIGH_WATERMARK = 95
+DEFAULT_PRUNE_LOW_WATERMARK = 90
+DEFAULT_PURGE_BATCH_SIZE = 500
+DEFAULT_PURGE_STORAGE_WORKERS = 8
+DEFAULT_SHARED_TIER_CACHE_NAME = None
@@ -0,0 +1,38 @@
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def code_cache_total_size_update(apps, schema_editor):
+    Cache = apps.get_model(app_label='file_caching', model_name='Cache')
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    for cache in Cache.objects.using(alias=schema_editor.connection.alias).all():
+        cache.total_size = CachePartitionFile.objects.using(
+            alias=schema_editor.connection.alias
+        ).filter(partition__cache=cache).aggregate(
+            file_size__sum=Sum('file_size')
+        )['file_size__sum'] or 0
+        cache.save()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0008_auto_20210426_0717'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cache',
+            name='total_size',
+            field=models.BigIntegerField(
+                default=0, help_text='Sum of the size of all the files in '
+                'the cache in bytes.', verbose_name='Total size'
+            ),
+        ),
+        migrations.RunPython(
+            code=code_cache_total_size_update,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
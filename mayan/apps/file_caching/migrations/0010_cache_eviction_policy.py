@@ -0,0 +1,55 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0009_cache_total_size'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cache',
+            name='eviction_clock',
+            field=models.FloatField(
+                default=0, help_text='Highest priority of the files deleted '
+                'during prunes. Used by the eviction policies that age the '
+                'priority of the files.', verbose_name='Eviction clock'
+            ),
+        ),
+        migrations.AddField(
+            model_name='cache',
+            name='eviction_policy',
+            field=models.CharField(
+                choices=[
+                    (
+                        'gdsf', 'GDSF - Greedy Dual Size Frequency. Deletes '
+                        'the files with the lowest access frequency '
+                        'relative to their size first, favoring keeping '
+                        'many small files. Aged by the priority of the last '
+                        'deleted file.'
+                    ), (
+                        'lfuda', 'LFU-DA - Least frequently used with '
+                        'dynamic aging. Deletes the least accessed files '
+                        'first. Aged by the priority of the last deleted '
+                        'file to allow old frequently accessed files to be '
+                        'deleted.'
+                    ), (
+                        'lru', 'LRU - Least recently used. Deletes the files '
+                        'accessed the longest time ago first.'
+                    )
+                ], default='lru', help_text='Policy used to select the '
+                'files to delete when the cache is full.', max_length=32,
+                verbose_name='Eviction policy'
+            ),
+        ),
+        migrations.AddField(
+            model_name='cachepartitionfile',
+            name='priority',
+            field=models.FloatField(
+                db_index=True, default=0, help_text='Eviction priority '
+                'calculated by the eviction policy of the cache. Files with '
+                'a lower priority are deleted first.',
+                verbose_name='Priority'
+            ),
+        ),
+    ]
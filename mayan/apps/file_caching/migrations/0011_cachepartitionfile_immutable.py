@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+
+def code_cache_partition_file_immutable_update(apps, schema_editor):
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    CachePartitionFile.objects.using(
+        alias=schema_editor.connection.alias
+    ).update(immutable=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0010_cache_eviction_policy'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachepartitionfile',
+            name='immutable',
+            field=models.BooleanField(
+                default=False, help_text='The content of the file was '
+                'written completely and will not change. Immutable files '
+                'are read without locking.', verbose_name='Immutable'
+            ),
+        ),
+        migrations.RunPython(
+            code=code_cache_partition_file_immutable_update,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
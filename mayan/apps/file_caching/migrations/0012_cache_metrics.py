@@ -0,0 +1,69 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0011_cachepartitionfile_immutable'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cache',
+            name='metric_bytes_written',
+            field=models.BigIntegerField(
+                default=0, help_text='Sum of the size of all the files '
+                'created in the cache in bytes.',
+                verbose_name='Bytes written'
+            ),
+        ),
+        migrations.AddField(
+            model_name='cache',
+            name='metric_eviction_age',
+            field=models.FloatField(
+                default=0, help_text='Sum of the age in seconds of the '
+                'files deleted to free up space.',
+                verbose_name='Eviction age'
+            ),
+        ),
+        migrations.AddField(
+            model_name='cache',
+            name='metric_evictions',
+            field=models.BigIntegerField(
+                default=0, help_text='Number of files deleted to free up '
+                'space.', verbose_name='Evictions'
+            ),
+        ),
+        migrations.AddField(
+            model_name='cache',
+            name='metric_generation_count',
+            field=models.BigIntegerField(
+                default=0, help_text='Number of files created in the cache.',
+                verbose_name='Generations'
+            ),
+        ),
+        migrations.AddField(
+            model_name='cache',
+            name='metric_generation_time',
+            field=models.FloatField(
+                default=0, help_text='Sum of the time in seconds elapsed '
+                'between the lookup of a missing file and its creation.',
+                verbose_name='Generation time'
+            ),
+        ),
+        migrations.AddField(
+            model_name='cache',
+            name='metric_hits',
+            field=models.BigIntegerField(
+                default=0, help_text='Number of file lookups that found the '
+                'file in the cache.', verbose_name='Hits'
+            ),
+        ),
+        migrations.AddField(
+            model_name='cache',
+            name='metric_misses',
+            field=models.BigIntegerField(
+                default=0, help_text='Number of file lookups that did not '
+                'find the file in the cache.', verbose_name='Misses'
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+def code_cache_partition_file_filename_generation_update(apps, schema_editor):
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+
+    CachePartitionFile.objects.using(
+        alias=schema_editor.connection.alias
+    ).update(filename_generation=False)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('file_caching', '0012_cache_metrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cachepartitionfile',
+            name='filename_generation',
+            field=models.BooleanField(
+                default=True, editable=False, help_text='The storage '
+                'filename includes the primary key of the file. Files '
+                'created before this format keep their previous storage '
+                'filename.', verbose_name='Filename generation'
+            ),
+        ),
+        migrations.RunPython(
+            code=code_cache_partition_file_filename_generation_update,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
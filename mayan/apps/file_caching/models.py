@@ -1,9 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+import io
 import logging
+import time
 
 from django.core import validators
 from django.core.files.base import ContentFile
-from django.db import models
+from django.db import models, transaction
 from django.db.models import F, Sum
 from django.template.defaultfilters import filesizeformat
 from django.urls import reverse
@@ -22,15 +25,25 @@ from mayan.apps.lock_manager.decorators import (
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.apps.storage.classes import DefinedStorage
 
+from .classes import (
+    CacheEvictionPolicy, CacheMetrics, CachePartitionFileAccessLog,
+    CachePartitionFileMemoryTier
+)
 from .events import (
     event_cache_created, event_cache_edited, event_cache_partition_purged,
     event_cache_purged
 )
 from .exceptions import FileCachingException
+from .literals import (
+    CACHE_PRIORITY_UPDATE_BATCH_SIZE, CACHE_PRUNE_SCHEDULE_LOCK_TIMEOUT
+)
 from .settings import (
     setting_maximum_failed_prune_attempts,
-    setting_maximum_normal_prune_attempts
+    setting_maximum_normal_prune_attempts, setting_prune_high_watermark,
+    setting_prune_low_watermark, setting_purge_batch_size,
+    setting_purge_storage_workers
 )
+from .tasks import task_cache_prune
 
 logger = logging.getLogger(name=__name__)
 
@@ -46,6 +59,61 @@ class Cache(ValueChangeModelMixin, models.Model):
             validators.MinValueValidator(limit_value=1)
         ], verbose_name=_('Maximum size')
     )
+    eviction_policy = models.CharField(
+        choices=CacheEvictionPolicy.get_choices(),
+        default=CacheEvictionPolicy.get_default(), help_text=_(
+            'Policy used to select the files to delete when the cache is '
+            'full.'
+        ), max_length=32, verbose_name=_('Eviction policy')
+    )
+    eviction_clock = models.FloatField(
+        default=0, help_text=_(
+            'Highest priority of the files deleted during prunes. Used by '
+            'the eviction policies that age the priority of the files.'
+        ), verbose_name=_('Eviction clock')
+    )
+    total_size = models.BigIntegerField(
+        default=0, help_text=_(
+            'Sum of the size of all the files in the cache in bytes.'
+        ), verbose_name=_('Total size')
+    )
+    metric_bytes_written = models.BigIntegerField(
+        default=0, help_text=_(
+            'Sum of the size of all the files created in the cache in bytes.'
+        ), verbose_name=_('Bytes written')
+    )
+    metric_eviction_age = models.FloatField(
+        default=0, help_text=_(
+            'Sum of the age in seconds of the files deleted to free up '
+            'space.'
+        ), verbose_name=_('Eviction age')
+    )
+    metric_evictions = models.BigIntegerField(
+        default=0, help_text=_(
+            'Number of files deleted to free up space.'
+        ), verbose_name=_('Evictions')
+    )
+    metric_generation_count = models.BigIntegerField(
+        default=0, help_text=_(
+            'Number of files created in the cache.'
+        ), verbose_name=_('Generations')
+    )
+    metric_generation_time = models.FloatField(
+        default=0, help_text=_(
+            'Sum of the time in seconds elapsed between the lookup of a '
+            'missing file and its creation.'
+        ), verbose_name=_('Generation time')
+    )
+    metric_hits = models.BigIntegerField(
+        default=0, help_text=_(
+            'Number of file lookups that found the file in the cache.'
+        ), verbose_name=_('Hits')
+    )
+    metric_misses = models.BigIntegerField(
+        default=0, help_text=_(
+            'Number of file lookups that did not find the file in the cache.'
+        ), verbose_name=_('Misses')
+    )
 
     class Meta:
         verbose_name = _('Cache')
@@ -61,6 +129,111 @@ class Cache(ValueChangeModelMixin, models.Model):
             }
         )
 
+    def delete_files(self, queryset, callback=None):
+        """
+        Delete the files of the queryset in batches. The storage files of
+        each batch are deleted in parallel and the database rows with a
+        single query. Files still being written are deleted one by one
+        after acquiring their lock. The optional callback is called after
+        each batch with the number of files deleted and the total.
+        """
+        for cache_partition_file in queryset.filter(immutable=False):
+            cache_partition_file.delete()
+
+        queryset = queryset.filter(immutable=True).order_by('pk')
+        count = 0
+        total = queryset.count()
+
+        def storage_delete(entry):
+            if entry[3]:
+                generation = entry[0]
+            else:
+                generation = None
+
+            self.storage.delete(
+                name=CachePartition.get_combined_filename(
+                    filename=entry[2], generation=generation, parent=entry[1]
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=setting_purge_storage_workers.value) as executor:
+            while True:
+                batch = list(
+                    queryset.values_list(
+                        'pk', 'partition__name', 'filename',
+                        'filename_generation'
+                    )[:setting_purge_batch_size.value]
+                )
+
+                if not batch:
+                    break
+
+                # Consume the results to raise the storage errors.
+                list(executor.map(storage_delete, batch))
+
+                with transaction.atomic():
+                    batch_queryset = CachePartitionFile.objects.filter(
+                        pk__in=[entry[0] for entry in batch]
+                    )
+                    batch_size = batch_queryset.aggregate(
+                        file_size__sum=Sum('file_size')
+                    )['file_size__sum'] or 0
+
+                    batch_queryset.delete()
+                    Cache.objects.filter(pk=self.pk).update(
+                        total_size=F('total_size') - batch_size
+                    )
+
+                count += len(batch)
+
+                if callback:
+                    callback(count=count, total=total)
+
+    def eviction_priorities_update(self):
+        """
+        Recalculate the priority of all the files using the current
+        eviction policy. The priorities of each policy use different
+        scales, files keeping the priority of the previous policy would be
+        deleted in the wrong order. The eviction clock is restarted and the
+        creation date time of the files is used as their last access time.
+        """
+        # Include the pending accesses of this process in the hits.
+        CachePartitionFileAccessLog.flush()
+
+        self.eviction_clock = 0
+        Cache.objects.filter(pk=self.pk).update(eviction_clock=0)
+
+        eviction_policy = self.get_eviction_policy()
+
+        cache_partition_files = []
+        queryset = self.get_files().only('datetime', 'file_size', 'hits')
+
+        for cache_partition_file in queryset.iterator():
+            cache_partition_file.priority = eviction_policy.get_priority(
+                cache=self, file_size=cache_partition_file.file_size,
+                hits=cache_partition_file.hits,
+                timestamp=cache_partition_file.datetime.timestamp()
+            )
+            cache_partition_files.append(cache_partition_file)
+
+            if len(cache_partition_files) >= CACHE_PRIORITY_UPDATE_BATCH_SIZE:
+                CachePartitionFile.objects.bulk_update(
+                    objs=cache_partition_files, fields=('priority',)
+                )
+                cache_partition_files = []
+
+        CachePartitionFile.objects.bulk_update(
+            objs=cache_partition_files, fields=('priority',)
+        )
+
+    def get_eviction_policy(self):
+        return CacheEvictionPolicy.get(name=self.eviction_policy)()
+
+    def get_eviction_policy_label(self):
+        return self.get_eviction_policy().label
+
+    get_eviction_policy_label.short_description = _('Eviction policy')
+
     def get_files(self):
         return CachePartitionFile.objects.filter(partition__cache__id=self.pk)
 
@@ -80,13 +253,71 @@ class Cache(ValueChangeModelMixin, models.Model):
                 dotted_path='', label=_('Unknown'), name='unknown'
             )
 
+    def get_metric_bytes_written_display(self):
+        return filesizeformat(bytes_=self.metric_bytes_written)
+
+    get_metric_bytes_written_display.short_description = _('Bytes written')
+    get_metric_bytes_written_display.help_text = _(
+        'Sum of the size of all the files created in the cache.'
+    )
+
+    def get_metric_eviction_age_average(self):
+        if self.metric_evictions:
+            return self.metric_eviction_age / self.metric_evictions
+
+    def get_metric_eviction_age_average_display(self):
+        return format_lazy(
+            '{:0.1f} {}', self.get_metric_eviction_age_average() or 0,
+            _('seconds')
+        )
+
+    get_metric_eviction_age_average_display.short_description = _(
+        'Average eviction age'
+    )
+    get_metric_eviction_age_average_display.help_text = _(
+        'Average age of the files deleted to free up space. A low value '
+        'means the maximum size of the cache is too small for its usage.'
+    )
+
+    def get_metric_generation_time_average(self):
+        if self.metric_generation_count:
+            return self.metric_generation_time / self.metric_generation_count
+
+    def get_metric_generation_time_average_display(self):
+        return format_lazy(
+            '{:0.2f} {}', self.get_metric_generation_time_average() or 0,
+            _('seconds')
+        )
+
+    get_metric_generation_time_average_display.short_description = _(
+        'Average generation time'
+    )
+    get_metric_generation_time_average_display.help_text = _(
+        'Average time elapsed between the lookup of a missing file and '
+        'its creation.'
+    )
+
+    def get_metric_hit_ratio(self):
+        lookups = self.metric_hits + self.metric_misses
+
+        if lookups:
+            return self.metric_hits / lookups
+
+    def get_metric_hit_ratio_display(self):
+        return '{:0.1f}%'.format((self.get_metric_hit_ratio() or 0) * 100)
+
+    get_metric_hit_ratio_display.short_description = _('Hit ratio')
+    get_metric_hit_ratio_display.help_text = _(
+        'Percentage of the file lookups that found the file in the cache.'
+    )
+
     def get_total_size(self):
         """
         Return the actual usage of the cache.
         """
-        return self.get_files().aggregate(
-            file_size__sum=Sum('file_size')
-        )['file_size__sum'] or 0
+        return Cache.objects.values_list('total_size', flat=True).get(
+            pk=self.pk
+        )
 
     def get_total_size_display(self):
         return format_lazy(
@@ -101,61 +332,112 @@ class Cache(ValueChangeModelMixin, models.Model):
     def label(self):
         return self.get_defined_storage().label
 
-    def prune(self):
+    def get_high_watermark_size(self):
+        return self.maximum_size * setting_prune_high_watermark.value // 100
+
+    def prune(self, _inline=False):
         """
-        Deletes files until the total size of the cache is below the allowed
-        maximum size of the cache.
+        Deletes the least used files in a single pass once the total size
+        of the cache reaches the high watermark. Enough files are deleted
+        to bring the total size of the cache below the low watermark.
+        Inline prunes, done while a new file is being created, stop after
+        the maximum number of normal prune attempts once the cache is
+        below its maximum size and leave the rest to the background prune.
         """
+        total_size = self.get_total_size()
+
+        if total_size < min(self.get_high_watermark_size(), self.maximum_size):
+            return
+
+        # Include the pending accesses of this process in the priorities.
+        CachePartitionFileAccessLog.flush()
+
+        target_size = total_size - (
+            self.maximum_size * setting_prune_low_watermark.value // 100
+        )
+
+        eviction_clock = self.eviction_clock
         failed_attempts = 0
         normal_attempts = 0
-        file_index = 0
+        pruned_size = 0
 
-        while self.get_total_size() >= self.maximum_size:
-            cache_partition_file_queryset = self.get_files().order_by(
-                'hits', 'datetime'
-            )
+        cache_partition_file_queryset = self.get_files().order_by(
+            'priority', 'datetime'
+        ).select_related('partition__cache')
 
+        for cache_partition_file in cache_partition_file_queryset.iterator():
             try:
-                cache_partition_file = cache_partition_file_queryset[file_index]
-            except IndexError:
-                # Attempted to get a file beyond what the queryset provided.
-                file_index = 0
-            else:
-                try:
-                    cache_partition_file.delete()
-                except CachePartitionFile.DoesNotExist:
-                    # The file selected from deletion was deleted by another
-                    # process before the lock was acquired.
-                    file_index += 1
-                except LockError:
-                    logger.debug(
-                        'Lock error trying to delete file "%s" for prune. '
-                        'Skipping and attempting next file.',
-                        cache_partition_file
+                cache_partition_file.delete()
+            except CachePartitionFile.DoesNotExist:
+                # The file selected from deletion was deleted by another
+                # process before the lock was acquired.
+                """Skip and attempt the next file."""
+            except LockError:
+                logger.debug(
+                    'Lock error trying to delete file "%s" for prune. '
+                    'Skipping and attempting next file.',
+                    cache_partition_file
+                )
+                failed_attempts += 1
+
+                if failed_attempts > setting_maximum_failed_prune_attempts.value:
+                    raise FileCachingException(
+                        'Too many cache prune attempts failed.'
                     )
-                    failed_attempts += 1
-                    file_index += 1
+            else:
+                CacheMetrics.add_eviction(
+                    cache_partition_file=cache_partition_file
+                )
+                eviction_clock = max(
+                    eviction_clock, cache_partition_file.priority
+                )
+                normal_attempts += 1
+                pruned_size += cache_partition_file.file_size
 
-                    if failed_attempts > setting_maximum_failed_prune_attempts.value:
-                        raise FileCachingException(
-                            'Too many cache prune attempts failed.'
-                        )
-                else:
-                    file_index = 0
-                    normal_attempts += 1
+                if pruned_size >= target_size:
+                    break
 
-                    if normal_attempts > setting_maximum_normal_prune_attempts.value:
+                if _inline and normal_attempts >= setting_maximum_normal_prune_attempts.value:
+                    if self.get_total_size() >= self.maximum_size:
                         raise FileCachingException(
                             'Too many cache prunes trying to create a '
                             'single new file.'
                         )
+                    else:
+                        break
+
+        if eviction_clock > self.eviction_clock:
+            self.eviction_clock = eviction_clock
+            Cache.objects.filter(
+                eviction_clock__lt=eviction_clock, pk=self.pk
+            ).update(eviction_clock=eviction_clock)
+
+    def prune_schedule(self):
+        """
+        Queue the pruning of the cache if the total size of the cache
+        reached the high watermark. The scheduling lock is not released
+        and expires by itself. Files created while it is held don't queue
+        more prunes.
+        """
+        if self.get_total_size() >= self.get_high_watermark_size():
+            lock_name = 'file_caching-cache_prune_schedule-{}'.format(
+                self.pk
+            )
+            try:
+                LockingBackend.get_backend().acquire_lock(
+                    name=lock_name, timeout=CACHE_PRUNE_SCHEDULE_LOCK_TIMEOUT
+                )
+            except LockError:
+                logger.debug('Cache id %s prune already queued', self.pk)
+            else:
+                task_cache_prune.apply_async(kwargs={'cache_id': self.pk})
 
     @method_event(
         event=event_cache_purged,
         event_manager_class=EventManagerMethodAfter,
         target='self'
     )
-    def purge(self):
+    def purge(self, _callback=None):
         """
         Deletes the entire cache.
         """
@@ -168,6 +450,10 @@ class Cache(ValueChangeModelMixin, models.Model):
             will remain.
             """
         else:
+            self.delete_files(callback=_callback, queryset=self.get_files())
+            CachePartitionFileMemoryTier.clear()
+
+            # Purge the now empty partitions to commit their events.
             for partition in self.partitions.all():
                 partition._event_actor = getattr(self, '_event_actor', None)
                 partition.purge()
@@ -184,12 +470,19 @@ class Cache(ValueChangeModelMixin, models.Model):
         }
     )
     def save(self, *args, **kwargs):
+        # New caches can be created without specifying the policy.
+        old_eviction_policy = self._values_previous.get(
+            'eviction_policy', self.eviction_policy
+        )
         old_maximum_size = self._get_field_previous_value(
             field='maximum_size'
         )
 
         result = super().save(*args, **kwargs)
 
+        if self.eviction_policy != old_eviction_policy:
+            self.eviction_priorities_update()
+
         if self.maximum_size < old_maximum_size:
             self.prune()
 
@@ -215,36 +508,54 @@ class CachePartition(models.Model):
         verbose_name_plural = _('Cache partitions')
 
     @staticmethod
-    def get_combined_filename(parent, filename):
-        return '{}-{}'.format(parent, filename)
+    def get_combined_filename(parent, filename, generation=None):
+        if generation is None:
+            return '{}-{}'.format(parent, filename)
+        else:
+            return '{}-{}-{}'.format(parent, filename, generation)
 
     def _lock_manager_get_lock_name(self, filename):
         return self.get_file_lock_name(filename=filename)
 
     @contextmanager
     def create_file(self, filename):
+        timestamp = time.time()
         lock_name = self.get_file_lock_name(filename=filename)
         try:
             logger.debug('trying to acquire lock: %s', lock_name)
             lock = LockingBackend.get_backend().acquire_lock(name=lock_name)
             logger.debug('acquired lock: %s', lock_name)
             try:
-                self.cache.prune()
-
-                # Since open "wb+" doesn't create files, force the creation
-                # of an empty file.
-                self.cache.storage.delete(
-                    name=self.get_full_filename(filename=filename)
-                )
-                self.cache.storage.save(
-                    name=self.get_full_filename(filename=filename),
-                    content=ContentFile(content='')
-                )
+                # Pruning is done in the background. Only prune while the
+                # file is being created when the cache is already full.
+                if self.cache.get_total_size() >= self.cache.maximum_size:
+                    try:
+                        self.cache.prune(_inline=True)
+                    except FileCachingException as exception:
+                        logger.warning(
+                            'Unable to free up space for new cache file '
+                            '"%s"; %s', filename, exception
+                        )
 
                 partition_file = None
 
                 try:
+                    # The storage filename includes the primary key of the
+                    # new entry. A file deleted and created again is stored
+                    # under a new name and readers of the deleted entry
+                    # never see the content being written.
                     partition_file = self.files.create(filename=filename)
+
+                    # Since open "wb+" doesn't create files, force the
+                    # creation of an empty file.
+                    self.cache.storage.delete(
+                        name=partition_file.full_filename
+                    )
+                    self.cache.storage.save(
+                        name=partition_file.full_filename,
+                        content=ContentFile(content='')
+                    )
+
                     yield partition_file._open_for_writing(_acquire_lock=False)
                 except Exception as exception:
                     logger.error(
@@ -253,17 +564,15 @@ class CachePartition(models.Model):
                     )
                     if partition_file:
                         partition_file.delete(_acquire_lock=False)
-                    else:
-                        # If the CachePartitionFile entry was not created
-                        # do manual clean up of the empty storage file
-                        # created with the previous`self.cache.storage.save`.
-                        self.cache.storage.delete(
-                            name=self.get_full_filename(filename=filename)
-                        )
                     raise
                 else:
                     partition_file.close(_acquire_lock=False)
                     partition_file._update_size(_acquire_lock=False)
+                    CacheMetrics.add_generation(
+                        cache_partition_file=partition_file,
+                        timestamp=timestamp
+                    )
+                    self.cache.prune_schedule()
             finally:
                 lock.release()
         except LockError:
@@ -275,26 +584,28 @@ class CachePartition(models.Model):
         return super().delete(*args, **kwargs)
 
     def get_file(self, filename):
-        return self.files.get(filename=filename)
+        try:
+            cache_partition_file = self.files.get(filename=filename)
+        except CachePartitionFile.DoesNotExist:
+            CacheMetrics.add_miss(cache_partition=self, filename=filename)
+            raise
+        else:
+            CacheMetrics.add_hit(cache_partition=self)
+            return cache_partition_file
 
     def get_file_lock_name(self, filename):
         return 'cache_partition-file-{}-{}-{}'.format(
             self.cache.pk, self.pk, filename
         )
 
-    def get_full_filename(self, filename):
-        return CachePartition.get_combined_filename(
-            parent=self.name, filename=filename
-        )
-
     @method_event(
         event=event_cache_partition_purged,
         event_manager_class=EventManagerMethodAfter,
         target='self'
     )
-    def purge(self):
-        for parition_file in self.files.all():
-            parition_file.delete()
+    def purge(self, _callback=None):
+        self.cache.delete_files(callback=_callback, queryset=self.files.all())
+        CachePartitionFileMemoryTier.delete_partition(cache_partition=self)
 
 
 class CachePartitionFile(models.Model):
@@ -316,6 +627,25 @@ class CachePartitionFile(models.Model):
             'Times this cache partition file has been accessed.'
         ), verbose_name='Hits'
     )
+    immutable = models.BooleanField(
+        default=False, help_text=_(
+            'The content of the file was written completely and will not '
+            'change. Immutable files are read without locking.'
+        ), verbose_name=_('Immutable')
+    )
+    filename_generation = models.BooleanField(
+        default=True, editable=False, help_text=_(
+            'The storage filename includes the primary key of the file. '
+            'Files created before this format keep their previous storage '
+            'filename.'
+        ), verbose_name=_('Filename generation')
+    )
+    priority = models.FloatField(
+        db_index=True, default=0, help_text=_(
+            'Eviction priority calculated by the eviction policy of the '
+            'cache. Files with a lower priority are deleted first.'
+        ), verbose_name=_('Priority')
+    )
 
     class Meta:
         get_latest_by = 'datetime'
@@ -349,10 +679,21 @@ class CachePartitionFile(models.Model):
         """
         Called after creation and initial write only.
         """
-        self.file_size = self.partition.cache.storage.size(
-            name=self.full_filename
+        cache = self.partition.cache
+        old_file_size = self.file_size
+        self.file_size = cache.storage.size(name=self.full_filename)
+        self.immutable = True
+        self.priority = cache.get_eviction_policy().get_priority(
+            cache=cache, file_size=self.file_size, hits=self.hits,
+            timestamp=time.time()
         )
-        self.save()
+
+        with transaction.atomic():
+            self.save()
+            Cache.objects.filter(pk=self.partition.cache_id).update(
+                total_size=F('total_size') + self.file_size - old_file_size
+            )
+
         if self.file_size > self.partition.cache.maximum_size:
             raise FileCachingException(
                 'Cache partition file %s is bigger than the maximum cache '
@@ -367,25 +708,93 @@ class CachePartitionFile(models.Model):
 
     @locked_class_method
     def delete(self, *args, **kwargs):
+        CachePartitionFileMemoryTier.delete(cache_partition_file=self)
         self.partition.cache.storage.delete(name=self.full_filename)
-        return super().delete(*args, **kwargs)
+
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+
+            # Only update the cache size if this call deleted the row and
+            # not another process.
+            if result[0]:
+                Cache.objects.filter(pk=self.partition.cache_id).update(
+                    total_size=F('total_size') - self.file_size
+                )
+
+        return result
 
     @cached_property
     def full_filename(self):
+        if self.filename_generation:
+            generation = self.pk
+        else:
+            generation = None
+
         return CachePartition.get_combined_filename(
-            parent=self.partition.name, filename=self.filename
+            filename=self.filename, generation=generation,
+            parent=self.partition.name
         )
 
+    def _get_read_file_object(self, storage_object):
+        """
+        Return the file object to read from. Small files are read entirely
+        and added to the memory tier.
+        """
+        if CachePartitionFileMemoryTier.is_eligible(cache_partition_file=self):
+            content = storage_object.read()
+            CachePartitionFileMemoryTier.set(
+                cache_partition_file=self, content=content
+            )
+            return io.BytesIO(content)
+        else:
+            return storage_object
+
     @contextmanager
     def open(self):
         """
-        Open the file for reading only.
+        Open the file for reading only. The content of small files is
+        returned from the memory tier when available. Immutable files are
+        read without acquiring the file lock.
         """
+        content = CachePartitionFileMemoryTier.get(cache_partition_file=self)
+        if content is not None:
+            CachePartitionFileAccessLog.add(cache_partition_file=self)
+            yield io.BytesIO(content)
+            return
+
+        if self.immutable:
+            CachePartitionFileAccessLog.add(cache_partition_file=self)
+            try:
+                storage_object = self.partition.cache.storage.open(
+                    mode='rb', name=self.full_filename
+                )
+            except Exception as exception:
+                if not CachePartitionFile.objects.filter(pk=self.pk).exists():
+                    # The file was deleted by another process after it
+                    # was selected.
+                    raise CachePartitionFile.DoesNotExist
+
+                logger.error(
+                    'Unexpected exception opening the cache file; %s', exception,
+                    exc_info=True
+                )
+                raise
+            else:
+                # An already open storage file remains readable even if
+                # the file is deleted by another process.
+                try:
+                    yield self._get_read_file_object(
+                        storage_object=storage_object
+                    )
+                finally:
+                    storage_object.close()
+            return
+
         lock_name = self._lock_manager_get_lock_name()
         try:
             logger.debug('trying to acquire lock: %s', lock_name)
             self._lock = LockingBackend.get_backend().acquire_lock(name=lock_name)
-            CachePartitionFile.objects.filter(pk=self.pk).update(hits=F('hits') + 1)
+            CachePartitionFileAccessLog.add(cache_partition_file=self)
             logger.debug('acquired lock: %s', lock_name)
             self._storage_object = None
             try:
@@ -399,7 +808,9 @@ class CachePartitionFile(models.Model):
                 )
                 raise
             else:
-                yield self._storage_object
+                yield self._get_read_file_object(
+                    storage_object=self._storage_object
+                )
                 self.close(_acquire_lock=False)
             finally:
                 self.close(_acquire_lock=False)
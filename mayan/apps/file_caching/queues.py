@@ -1,9 +1,13 @@
+from datetime import timedelta
+
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.common.queues import queue_tools
 from mayan.apps.task_manager.classes import CeleryQueue
 from mayan.apps.task_manager.workers import worker_b
 
+from .literals import CACHE_PRUNE_CHECK_INTERVAL
+
 queue_file_caching = CeleryQueue(
     name='file_caching', label=_('File caching'), worker=worker_b
 )
@@ -12,6 +16,16 @@ queue_file_caching.add_task_type(
     dotted_path='mayan.apps.file_caching.tasks.task_cache_partition_purge',
     label=_('Purge a file cache partition')
 )
+queue_file_caching.add_task_type(
+    dotted_path='mayan.apps.file_caching.tasks.task_cache_prune',
+    label=_('Prune a file cache')
+)
+queue_file_caching.add_task_type(
+    dotted_path='mayan.apps.file_caching.tasks.task_cache_prune_check',
+    label=_('Check the size of the file caches'),
+    name='task_cache_prune_check',
+    schedule=timedelta(seconds=CACHE_PRUNE_CHECK_INTERVAL)
+)
 
 queue_tools.add_task_type(
     dotted_path='mayan.apps.file_caching.tasks.task_cache_purge',
@@ -0,0 +1,34 @@
+from rest_framework import serializers
+
+from .models import Cache
+
+
+class CacheSerializer(serializers.HyperlinkedModelSerializer):
+    label = serializers.CharField(read_only=True)
+    metric_eviction_age_average = serializers.FloatField(
+        read_only=True, source='get_metric_eviction_age_average'
+    )
+    metric_generation_time_average = serializers.FloatField(
+        read_only=True, source='get_metric_generation_time_average'
+    )
+    metric_hit_ratio = serializers.FloatField(
+        read_only=True, source='get_metric_hit_ratio'
+    )
+
+    class Meta:
+        extra_kwargs = {
+            'url': {
+                'lookup_url_kwarg': 'cache_id',
+                'view_name': 'rest_api:cache-detail'
+            }
+        }
+        fields = (
+            'defined_storage_name', 'eviction_policy', 'id', 'label',
+            'maximum_size', 'metric_bytes_written',
+            'metric_eviction_age_average', 'metric_evictions',
+            'metric_generation_count', 'metric_generation_time_average',
+            'metric_hit_ratio', 'metric_hits', 'metric_misses',
+            'total_size', 'url'
+        )
+        model = Cache
+        read_only_fields = fields
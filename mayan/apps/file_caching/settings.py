@@ -3,12 +3,33 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
+    DEFAULT_ACCESS_LOG_FLUSH_INTERVAL, DEFAULT_ACCESS_LOG_FLUSH_SIZE,
     DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
-    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS
+    DEFAULT_MAXIMUM_NORMAL_PRUNE_ATTEMPTS,
+    DEFAULT_MEMORY_TIER_MAXIMUM_FILE_SIZE, DEFAULT_MEMORY_TIER_MAXIMUM_SIZE,
+    DEFAULT_PRUNE_HIGH_WATERMARK, DEFAULT_PRUNE_LOW_WATERMARK,
+    DEFAULT_PURGE_BATCH_SIZE, DEFAULT_PURGE_STORAGE_WORKERS,
+    DEFAULT_SHARED_TIER_CACHE_NAME
 )
 
 namespace = SettingNamespace(label=_('File caching'), name='file_caching')
 
+setting_access_log_flush_interval = namespace.add_setting(
+    default=DEFAULT_ACCESS_LOG_FLUSH_INTERVAL,
+    global_name='FILE_CACHING_ACCESS_LOG_FLUSH_INTERVAL', help_text=_(
+        'Maximum time in seconds that the accesses to cache files are kept '
+        'in memory before being written to the database.'
+    )
+)
+setting_access_log_flush_size = namespace.add_setting(
+    default=DEFAULT_ACCESS_LOG_FLUSH_SIZE,
+    global_name='FILE_CACHING_ACCESS_LOG_FLUSH_SIZE', help_text=_(
+        'Number of different cache files accessed after which the accesses '
+        'kept in memory are written to the database. A value of 1 writes '
+        'every access immediately.'
+    )
+)
+
 setting_maximum_failed_prune_attempts = namespace.add_setting(
     default=DEFAULT_MAXIMUM_FAILED_PRUNE_ATTEMPTS,
     global_name='FILE_CACHING_MAXIMUM_FAILED_PRUNE_ATTEMPTS', help_text=_(
@@ -24,3 +45,58 @@ setting_maximum_normal_prune_attempts = namespace.add_setting(
         'space for new a file being requested, before giving up.'
     )
 )
+setting_memory_tier_maximum_file_size = namespace.add_setting(
+    default=DEFAULT_MEMORY_TIER_MAXIMUM_FILE_SIZE,
+    global_name='FILE_CACHING_MEMORY_TIER_MAXIMUM_FILE_SIZE', help_text=_(
+        'Size in bytes of the biggest cache file whose content will be kept '
+        'in memory after being read.'
+    )
+)
+setting_memory_tier_maximum_size = namespace.add_setting(
+    default=DEFAULT_MEMORY_TIER_MAXIMUM_SIZE,
+    global_name='FILE_CACHING_MEMORY_TIER_MAXIMUM_SIZE', help_text=_(
+        'Maximum size in bytes of the content of the cache files kept in '
+        'memory by each process. The least recently read files are '
+        'discarded first. A value of 0 disables the memory tier.'
+    )
+)
+setting_prune_high_watermark = namespace.add_setting(
+    default=DEFAULT_PRUNE_HIGH_WATERMARK,
+    global_name='FILE_CACHING_PRUNE_HIGH_WATERMARK', help_text=_(
+        'Percentage of the maximum size of a cache at which the cache will '
+        'be pruned in the background. Files are only deleted while a new '
+        'file is being created when the cache reaches its maximum size.'
+    )
+)
+setting_prune_low_watermark = namespace.add_setting(
+    default=DEFAULT_PRUNE_LOW_WATERMARK,
+    global_name='FILE_CACHING_PRUNE_LOW_WATERMARK', help_text=_(
+        'Percentage of the maximum size of a cache to which the cache will '
+        'be reduced when it is pruned. Files are deleted in a single pass '
+        'until the total size of the cache is below this value.'
+    )
+)
+setting_purge_batch_size = namespace.add_setting(
+    default=DEFAULT_PURGE_BATCH_SIZE,
+    global_name='FILE_CACHING_PURGE_BATCH_SIZE', help_text=_(
+        'Number of cache files deleted from the database with a single '
+        'query when purging a cache or a cache partition.'
+    )
+)
+setting_purge_storage_workers = namespace.add_setting(
+    default=DEFAULT_PURGE_STORAGE_WORKERS,
+    global_name='FILE_CACHING_PURGE_STORAGE_WORKERS', help_text=_(
+        'Number of threads used to delete the cache files from the storage '
+        'in parallel when purging a cache or a cache partition. Increase '
+        'for storages with a high latency per request like remote object '
+        'storages.'
+    )
+)
+setting_shared_tier_cache_name = namespace.add_setting(
+    default=DEFAULT_SHARED_TIER_CACHE_NAME,
+    global_name='FILE_CACHING_SHARED_TIER_CACHE_NAME', help_text=_(
+        'Name of the Django cache, as defined in the CACHES setting, used '
+        'to share the content of the small cache files between processes. '
+        'Leave empty to disable the shared tier.'
+    )
+)
@@ -1,11 +1,17 @@
 import logging
 
+from celery.backends.base import DisabledBackend
+
 from django.apps import apps
 from django.contrib.auth import get_user_model
 
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
+from .exceptions import FileCachingException
+from .literals import CACHE_PRUNE_LOCK_TIMEOUT
+
 logger = logging.getLogger(name=__name__)
 
 
@@ -47,6 +53,43 @@ def task_cache_partition_purge(
         logger.info('Finished cache partition id %s purge', cache_partition)
 
 
+@app.task(ignore_result=True)
+def task_cache_prune(cache_id):
+    Cache = apps.get_model(
+        app_label='file_caching', model_name='Cache'
+    )
+
+    lock_name = 'file_caching-cache_prune-{}'.format(cache_id)
+    try:
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=lock_name, timeout=CACHE_PRUNE_LOCK_TIMEOUT
+        )
+    except LockError:
+        logger.debug('Cache id %s is already being pruned', cache_id)
+    else:
+        try:
+            cache = Cache.objects.get(pk=cache_id)
+
+            logger.debug('Starting cache id %s prune', cache_id)
+            cache.prune()
+        except FileCachingException as exception:
+            logger.warning('Unable to prune cache id %s; %s', cache_id, exception)
+        else:
+            logger.debug('Finished cache id %s prune', cache_id)
+        finally:
+            lock.release()
+
+
+@app.task(ignore_result=True)
+def task_cache_prune_check():
+    Cache = apps.get_model(
+        app_label='file_caching', model_name='Cache'
+    )
+
+    for cache in Cache.objects.all():
+        cache.prune_schedule()
+
+
 @app.task(bind=True, ignore_result=True)
 def task_cache_purge(self, cache_id, user_id=None):
     Cache = apps.get_model(
@@ -60,11 +103,22 @@ def task_cache_purge(self, cache_id, user_id=None):
     else:
         user = None
 
+    def progress_callback(count, total):
+        logger.info(
+            'Cache id %s purge progress: %d of %d files', cache_id, count,
+            total
+        )
+        # Report the progress to the result backend, if there is one.
+        if not isinstance(self.backend, DisabledBackend):
+            self.update_state(
+                meta={'count': count, 'total': total}, state='PROGRESS'
+            )
+
     logger.info('Starting cache id %s purge', cache)
     try:
         cache._event_actor = user
         cache._event_keep_attributes = ('_event_actor',)
-        cache.purge()
+        cache.purge(_callback=progress_callback)
     except LockError as exception:
         raise self.retry(exc=exception)
     else:
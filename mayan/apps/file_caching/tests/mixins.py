@@ -1,10 +1,13 @@
 from django.utils.encoding import force_bytes
 
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.storage.classes import DefinedStorage
 from mayan.apps.storage.utils import fs_cleanup, mkdtemp
 
 from ..models import Cache
-from ..tasks import task_cache_partition_purge, task_cache_purge
+from ..tasks import (
+    task_cache_partition_purge, task_cache_prune, task_cache_purge
+)
 
 from .literals import (
     TEST_CACHE_MAXIMUM_SIZE, TEST_CACHE_PARTITION_FILE_FILENAME,
@@ -13,6 +16,18 @@ from .literals import (
 )
 
 
+class CacheAPIViewTestMixin:
+    def _request_test_cache_detail_api_view(self):
+        return self.get(
+            viewname='rest_api:cache-detail', kwargs={
+                'cache_id': self.test_cache.pk
+            }
+        )
+
+    def _request_test_cache_list_api_view(self):
+        return self.get(viewname='rest_api:cache-list')
+
+
 class CachePartitionViewTestMixin:
     def _request_test_object_file_cache_partition_purge_view(self):
         return self.post(
@@ -35,6 +50,8 @@ class CacheTestMixin:
 
     def tearDown(self):
         fs_cleanup(filename=self.temporary_directory)
+        # Remove the cache prune scheduling locks, which are not released.
+        LockingBackend.get_backend().purge_locks()
         super().tearDown()
 
     def _create_test_cache(self, extra_data=None):
@@ -107,6 +124,13 @@ class FileCachingTaskTestMixin:
             }
         ).get()
 
+    def _execute_task_cache_prune(self):
+        task_cache_prune.apply_async(
+            kwargs={
+                'cache_id': self.test_cache.pk
+            }
+        ).get()
+
     def _execute_task_cache_purge(self):
         task_cache_purge.apply_async(
             kwargs={
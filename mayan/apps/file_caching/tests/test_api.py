@@ -0,0 +1,66 @@
+from rest_framework import status
+
+from mayan.apps.rest_api.tests.base import BaseAPITestCase
+
+from ..permissions import permission_cache_view
+
+from .mixins import CacheAPIViewTestMixin, CacheTestMixin
+
+
+class CacheAPIViewTestCase(
+    CacheAPIViewTestMixin, CacheTestMixin, BaseAPITestCase
+):
+    def setUp(self):
+        super().setUp()
+        self._create_test_cache()
+
+    def test_cache_detail_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_cache_detail_api_view()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_cache_detail_api_view_with_access(self):
+        self.grant_access(
+            obj=self.test_cache, permission=permission_cache_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_cache_detail_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['id'], self.test_cache.pk)
+        self.assertEqual(response.data['metric_hit_ratio'], None)
+        self.assertEqual(response.data['metric_hits'], 0)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_cache_list_api_view_no_permission(self):
+        self._clear_events()
+
+        response = self._request_test_cache_list_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 0)
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
+
+    def test_cache_list_api_view_with_access(self):
+        self.grant_access(
+            obj=self.test_cache, permission=permission_cache_view
+        )
+
+        self._clear_events()
+
+        response = self._request_test_cache_list_api_view()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['results'][0]['id'], self.test_cache.pk
+        )
+
+        events = self._get_test_events()
+        self.assertEqual(events.count(), 0)
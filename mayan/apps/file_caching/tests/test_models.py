@@ -1,15 +1,31 @@
 import mock
 
+from django.core.files.base import ContentFile
+from django.db.models import Sum
+
+from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.lock_manager.exceptions import LockError
+from mayan.apps.smart_settings.tests.mixins import SmartSettingTestMixin
 from mayan.apps.testing.tests.base import BaseTestCase
 
+from ..classes import (
+    CacheMetrics, CachePartitionFileAccessLog, CachePartitionFileMemoryTier
+)
 from ..exceptions import FileCachingException
-from ..models import CachePartitionFile
+from ..models import CachePartition, CachePartitionFile
+from ..settings import (
+    setting_maximum_normal_prune_attempts, setting_memory_tier_maximum_size,
+    setting_prune_low_watermark, setting_purge_batch_size
+)
+from ..tasks import task_cache_prune
 
 from .literals import TEST_CACHE_PARTITION_FILE_FILENAME
 from .mixins import CacheTestMixin
 
 
-class CacheModelTestCase(CacheTestMixin, BaseTestCase):
+class CacheModelTestCase(
+    CacheTestMixin, SmartSettingTestMixin, BaseTestCase
+):
     class FakeException(Exception):
         """
         Exception to force the cache file creation to fail but not the
@@ -32,6 +48,146 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
 
         self.assertNotEqual(cache_total_size, self.test_cache.get_total_size())
 
+    def test_cache_purge_batches(self):
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_purge_batch_size.global_name),
+            value='2'
+        )
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        for index in range(5):
+            self._create_test_cache_partition_file(file_size=1)
+
+        progress = []
+
+        def callback(count, total):
+            progress.append((count, total))
+
+        self.test_cache.purge(_callback=callback)
+
+        self.assertEqual(progress, [(2, 5), (4, 5), (5, 5)])
+        self.assertEqual(self.test_cache.get_files().count(), 0)
+        self.assertEqual(self.test_cache.get_total_size(), 0)
+
+        for cache_partition_file in self.test_cache_partition_files:
+            self.assertFalse(
+                self.test_cache.storage.exists(
+                    name=cache_partition_file.full_filename
+                )
+            )
+
+    def test_cache_partition_purge_file_being_written(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        self.test_cache_partition_file.immutable = False
+        self.test_cache_partition_file.save()
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.test_cache_partition_file._lock_manager_get_lock_name()
+        )
+
+        with self.assertRaises(expected_exception=LockError):
+            self.test_cache_partition.purge()
+
+        lock.release()
+
+        self.assertEqual(self.test_cache_partition.files.count(), 1)
+
+    def test_cache_partition_file_immutable_read(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        self.assertTrue(self.test_cache_partition_file.immutable)
+
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.test_cache_partition_file._lock_manager_get_lock_name()
+        )
+
+        with self.test_cache_partition_file.open() as file_object:
+            file_object.read()
+
+        self.test_cache_partition_file.immutable = False
+
+        with self.assertRaises(expected_exception=LockError):
+            with self.test_cache_partition_file.open():
+                """Do nothing"""
+
+        lock.release()
+
+    def test_cache_partition_file_immutable_read_deleted(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        CachePartitionFile.objects.get(
+            pk=self.test_cache_partition_file.pk
+        ).delete()
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            with self.test_cache_partition_file.open():
+                """Do nothing"""
+
+    def test_cache_partition_file_immutable_read_deleted_recreated(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        CachePartitionFile.objects.get(
+            pk=self.test_cache_partition_file.pk
+        ).delete()
+
+        with self.test_cache_partition.create_file(filename=self.test_cache_partition_file.filename) as file_object:
+            file_object.write(b'partial')
+
+            # The reader of the deleted entry must not see the content of
+            # the new file being written.
+            with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+                with self.test_cache_partition_file.open():
+                    """Do nothing"""
+
+    def test_cache_partition_file_legacy_filename(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        # Store the file like the files created before the filename
+        # generation.
+        legacy_filename = CachePartition.get_combined_filename(
+            filename=self.test_cache_partition_file.filename,
+            parent=self.test_cache_partition.name
+        )
+        with self.test_cache.storage.open(name=self.test_cache_partition_file.full_filename) as file_object:
+            content = file_object.read()
+
+        self.test_cache.storage.delete(
+            name=self.test_cache_partition_file.full_filename
+        )
+        self.test_cache.storage.save(
+            name=legacy_filename, content=ContentFile(content=content)
+        )
+        CachePartitionFile.objects.filter(
+            pk=self.test_cache_partition_file.pk
+        ).update(filename_generation=False)
+
+        test_cache_partition_file = CachePartitionFile.objects.get(
+            pk=self.test_cache_partition_file.pk
+        )
+        self.assertEqual(
+            test_cache_partition_file.full_filename, legacy_filename
+        )
+
+        with test_cache_partition_file.open() as file_object:
+            self.assertEqual(file_object.read(), content)
+
+        self.test_cache_partition.purge()
+
+        self.assertFalse(
+            self.test_cache.storage.exists(name=legacy_filename)
+        )
+
     @mock.patch('django.core.files.File.close')
     def test_storage_file_close(self, mock_storage_file_close_method):
         self._create_test_cache()
@@ -56,12 +212,8 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
             self.test_cache_partition.files.count(),
             cache_parition_file_count
         )
-        self.assertFalse(
-            self.test_cache_partition.cache.storage.exists(
-                name=self.test_cache_partition.get_full_filename(
-                    filename=TEST_CACHE_PARTITION_FILE_FILENAME
-                )
-            )
+        self.assertEqual(
+            self.test_cache_partition.cache.storage.listdir(path='')[1], []
         )
 
     @mock.patch('mayan.apps.file_caching.models.CachePartitionFile.save')
@@ -83,12 +235,8 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
             self.test_cache_partition.files.count(),
             cache_parition_file_count
         )
-        self.assertFalse(
-            self.test_cache_partition.cache.storage.exists(
-                name=self.test_cache_partition.get_full_filename(
-                    filename=TEST_CACHE_PARTITION_FILE_FILENAME
-                )
-            )
+        self.assertEqual(
+            self.test_cache_partition.cache.storage.listdir(path='')[1], []
         )
 
     def test_cache_partition_file_hits(self):
@@ -101,13 +249,38 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         with self.test_cache_partition_file.open():
             """Do nothing"""
 
+        CachePartitionFileAccessLog.flush()
         self.test_cache_partition_file.refresh_from_db()
 
         self.assertEqual(
             self.test_cache_partition_file.hits, cache_partition_file_hits + 1
         )
 
-    def test_cache_partition_file_lru_eviction(self):
+    def test_cache_partition_file_hits_batched(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file()
+
+        CachePartitionFileAccessLog.flush()
+        cache_partition_file_hits = self.test_cache_partition_file.hits
+
+        for index in range(3):
+            with self.test_cache_partition_file.open():
+                """Do nothing"""
+
+        self.test_cache_partition_file.refresh_from_db()
+        self.assertEqual(
+            self.test_cache_partition_file.hits, cache_partition_file_hits
+        )
+
+        CachePartitionFileAccessLog.flush()
+        self.test_cache_partition_file.refresh_from_db()
+        self.assertEqual(
+            self.test_cache_partition_file.hits, cache_partition_file_hits + 3
+        )
+
+    @mock.patch('mayan.apps.file_caching.models.Cache.prune_schedule')
+    def test_cache_partition_file_lru_eviction(self, mock_cache_prune_schedule_method):
         self._create_test_cache(
             extra_data={
                 'maximum_size': 2
@@ -160,7 +333,8 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         self.test_cache.save()
         self.assertTrue(mock_cache_prune_method.called)
 
-    def test_incremental_file_index_cache_prune(self):
+    @mock.patch('mayan.apps.file_caching.models.Cache.prune_schedule')
+    def test_incremental_file_index_cache_prune(self, mock_cache_prune_schedule_method):
         self._create_test_cache(
             extra_data={
                 'maximum_size': 2
@@ -174,9 +348,12 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         with self.test_cache_partition_files[1].open():
             """Increase hits of file #1"""
 
-        with self.test_cache_partition_files[0].open():
-            """Lock and increase hits of file #0"""
-            self._create_test_cache_partition_file(file_size=1)
+        # Lock file #0 as if it was being written.
+        lock = LockingBackend.get_backend().acquire_lock(
+            name=self.test_cache_partition_files[0]._lock_manager_get_lock_name()
+        )
+        self._create_test_cache_partition_file(file_size=1)
+        lock.release()
 
         self.assertTrue(
             self.test_cache_partition_files[0] in CachePartitionFile.objects.all()
@@ -187,3 +364,329 @@ class CacheModelTestCase(CacheTestMixin, BaseTestCase):
         self.assertTrue(
             self.test_cache_partition_files[2] in CachePartitionFile.objects.all()
         )
+
+    @mock.patch('mayan.apps.file_caching.models.Cache.prune_schedule')
+    def test_cache_prune_low_watermark(self, mock_cache_prune_schedule_method):
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_prune_low_watermark.global_name),
+            value='50'
+        )
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 10
+            }
+        )
+
+        self._create_test_cache_partition()
+        for index in range(11):
+            self._create_test_cache_partition_file(file_size=1)
+
+        self.assertEqual(self.test_cache.get_files().count(), 6)
+        self.assertEqual(
+            list(self.test_cache.get_files().order_by('datetime', 'pk')),
+            self.test_cache_partition_files[5:]
+        )
+        self.assertEqual(self.test_cache.get_total_size(), 6)
+
+    def test_cache_prune_background(self):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 100
+            }
+        )
+
+        self._create_test_cache_partition()
+        for index in range(5):
+            self._create_test_cache_partition_file(file_size=20)
+
+        # Reaching the high watermark after the fifth file queued a prune
+        # down to the low watermark.
+        self.assertEqual(
+            list(self.test_cache.get_files().order_by('datetime', 'pk')),
+            self.test_cache_partition_files[1:]
+        )
+        self.assertEqual(self.test_cache.get_total_size(), 80)
+
+    @mock.patch.object(target=task_cache_prune, attribute='apply_async')
+    def test_cache_prune_schedule_once(self, mock_task_cache_prune_apply_async):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 50
+            }
+        )
+
+        self._create_test_cache_partition()
+        for index in range(8):
+            self._create_test_cache_partition_file(file_size=10)
+
+        # Files created above the high watermark while the prune is
+        # queued don't queue more prunes.
+        self.assertEqual(mock_task_cache_prune_apply_async.call_count, 1)
+
+    @mock.patch('mayan.apps.file_caching.models.Cache.prune_schedule')
+    def test_cache_prune_background_many_files(
+        self, mock_cache_prune_schedule_method
+    ):
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(
+                setting_maximum_normal_prune_attempts.global_name
+            ), value='2'
+        )
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_prune_low_watermark.global_name),
+            value='50'
+        )
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 100
+            }
+        )
+
+        self._create_test_cache_partition()
+        for index in range(10):
+            self._create_test_cache_partition_file(file_size=10)
+
+        self.test_cache.prune()
+
+        # More files than the maximum normal prune attempts are deleted to
+        # reach the low watermark.
+        self.assertEqual(self.test_cache.get_total_size(), 50)
+
+    @mock.patch('mayan.apps.file_caching.models.Cache.prune_schedule')
+    def test_cache_prune_inline_error(self, mock_cache_prune_schedule_method):
+        self._create_test_cache(
+            extra_data={
+                'maximum_size': 1
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+
+        with mock.patch(
+            'mayan.apps.file_caching.models.Cache.prune',
+            side_effect=FileCachingException
+        ) as mock_cache_prune_method:
+            self._create_test_cache_partition_file(file_size=1)
+
+        self.assertTrue(mock_cache_prune_method.called)
+        self.assertEqual(self.test_cache.get_files().count(), 2)
+
+    def test_cache_total_size(self):
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=2)
+
+        self.assertEqual(self.test_cache.get_total_size(), 3)
+
+        self.test_cache_partition_files[0].delete()
+
+        self.assertEqual(self.test_cache.get_total_size(), 2)
+        self.assertEqual(
+            self.test_cache.get_files().aggregate(
+                file_size__sum=Sum('file_size')
+            )['file_size__sum'], self.test_cache.get_total_size()
+        )
+
+    def test_cache_metrics(self):
+        # Discard the counters of previous tests.
+        CacheMetrics.flush()
+
+        self._create_test_cache()
+        self._create_test_cache_partition()
+
+        with self.assertRaises(expected_exception=CachePartitionFile.DoesNotExist):
+            self.test_cache_partition.get_file(
+                filename=TEST_CACHE_PARTITION_FILE_FILENAME
+            )
+
+        self._create_test_cache_partition_file(
+            file_size=2, filename=TEST_CACHE_PARTITION_FILE_FILENAME
+        )
+        self.test_cache_partition.get_file(
+            filename=TEST_CACHE_PARTITION_FILE_FILENAME
+        )
+        self.test_cache_partition.get_file(
+            filename=TEST_CACHE_PARTITION_FILE_FILENAME
+        )
+
+        CacheMetrics.flush()
+        self.test_cache.refresh_from_db()
+
+        self.assertEqual(self.test_cache.metric_bytes_written, 2)
+        self.assertEqual(self.test_cache.metric_generation_count, 1)
+        self.assertEqual(self.test_cache.metric_hits, 2)
+        self.assertEqual(self.test_cache.metric_misses, 1)
+        self.assertAlmostEqual(self.test_cache.get_metric_hit_ratio(), 2 / 3)
+        self.assertTrue(self.test_cache.metric_generation_time > 0)
+
+    @mock.patch('mayan.apps.file_caching.models.Cache.prune_schedule')
+    def test_cache_metrics_eviction(self, mock_cache_prune_schedule_method):
+        CacheMetrics.flush()
+
+        self._create_test_cache(extra_data={'maximum_size': 2})
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        CacheMetrics.flush()
+        self.test_cache.refresh_from_db()
+
+        self.assertEqual(self.test_cache.metric_evictions, 1)
+        self.assertTrue(
+            self.test_cache.get_metric_eviction_age_average() >= 0
+        )
+
+    @mock.patch('mayan.apps.file_caching.models.Cache.prune_schedule')
+    def test_cache_prune_eviction_policy_change(
+        self, mock_cache_prune_schedule_method
+    ):
+        self._create_test_cache(
+            extra_data={
+                'eviction_policy': 'lru', 'maximum_size': 3
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        self.test_cache.refresh_from_db()
+        self.test_cache.eviction_policy = 'lfuda'
+        self.test_cache.save()
+        self.assertEqual(self.test_cache.eviction_clock, 0)
+
+        # The timestamp priorities of the LRU policy were recalculated.
+        self.assertEqual(
+            list(
+                self.test_cache.get_files().values_list('priority', flat=True)
+            ), [1, 1]
+        )
+
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        # The oldest file was deleted instead of the new one.
+        self.assertTrue(
+            self.test_cache_partition_files[0] not in CachePartitionFile.objects.all()
+        )
+        self.assertTrue(
+            self.test_cache_partition_files[2] in CachePartitionFile.objects.all()
+        )
+
+    @mock.patch('mayan.apps.file_caching.models.Cache.prune_schedule')
+    def test_cache_prune_gdsf(self, mock_cache_prune_schedule_method):
+        self._create_test_cache(
+            extra_data={
+                'eviction_policy': 'gdsf', 'maximum_size': 3
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=2)
+        self._create_test_cache_partition_file(file_size=1)
+
+        # The bigger file was deleted even if it is newer.
+        self.assertTrue(
+            self.test_cache_partition_files[0] in CachePartitionFile.objects.all()
+        )
+        self.assertTrue(
+            self.test_cache_partition_files[1] not in CachePartitionFile.objects.all()
+        )
+        self.test_cache.refresh_from_db()
+        self.assertEqual(self.test_cache.eviction_clock, 0.5)
+
+    @mock.patch('mayan.apps.file_caching.models.Cache.prune_schedule')
+    def test_cache_prune_lfuda(self, mock_cache_prune_schedule_method):
+        self._create_test_cache(
+            extra_data={
+                'eviction_policy': 'lfuda', 'maximum_size': 2
+            }
+        )
+
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+        self._create_test_cache_partition_file(file_size=1)
+
+        for index in range(2):
+            with self.test_cache_partition_files[1].open():
+                """Increase hits of file #1"""
+
+        self._create_test_cache_partition_file(file_size=1)
+
+        # Older and less accessed file was deleted.
+        self.assertTrue(
+            self.test_cache_partition_files[0] not in CachePartitionFile.objects.all()
+        )
+        self.assertTrue(
+            self.test_cache_partition_files[1] in CachePartitionFile.objects.all()
+        )
+        self.test_cache.refresh_from_db()
+        self.assertEqual(self.test_cache.eviction_clock, 1)
+
+        # New files are aged by the eviction clock.
+        self.assertEqual(self.test_cache_partition_files[2].priority, 2)
+
+
+class CachePartitionFileMemoryTierTestCase(
+    CacheTestMixin, SmartSettingTestMixin, BaseTestCase
+):
+    def setUp(self):
+        super().setUp()
+        self._create_test_cache()
+        self._create_test_cache_partition()
+        self._create_test_cache_partition_file(file_size=1)
+
+    def _read_test_cache_partition_file(self):
+        with self.test_cache_partition_file.open() as file_object:
+            return file_object.read()
+
+    def test_memory_tier_disabled(self):
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(
+                setting_memory_tier_maximum_size.global_name
+            ), value='0'
+        )
+
+        self._read_test_cache_partition_file()
+
+        self.assertEqual(
+            CachePartitionFileMemoryTier.get(
+                cache_partition_file=self.test_cache_partition_file
+            ), None
+        )
+
+    def test_memory_tier_read(self):
+        content = self._read_test_cache_partition_file()
+
+        # Remove the storage file to ensure the memory tier is used.
+        self.test_cache.storage.delete(
+            name=self.test_cache_partition_file.full_filename
+        )
+
+        self.assertEqual(self._read_test_cache_partition_file(), content)
+
+    def test_memory_tier_invalidation_on_file_delete(self):
+        self._read_test_cache_partition_file()
+
+        self.test_cache_partition_file.delete()
+
+        self.assertEqual(
+            CachePartitionFileMemoryTier.get(
+                cache_partition_file=self.test_cache_partition_file
+            ), None
+        )
+
+    def test_memory_tier_invalidation_on_partition_purge(self):
+        self._read_test_cache_partition_file()
+
+        self.test_cache_partition.purge()
+
+        self.assertEqual(
+            CachePartitionFileMemoryTier.get(
+                cache_partition_file=self.test_cache_partition_file
+            ), None
+        )
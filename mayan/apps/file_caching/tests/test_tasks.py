@@ -1,3 +1,6 @@
+import mock
+
+from mayan.apps.lock_manager.backends.base import LockingBackend
 from mayan.apps.testing.tests.base import BaseTestCase
 
 from ..events import event_cache_partition_purged, event_cache_purged
@@ -29,6 +32,29 @@ class FileCachingTaskTestCase(
         self.assertEqual(events[0].target, self.test_cache_partition)
         self.assertEqual(events[0].verb, event_cache_partition_purged.id)
 
+    @mock.patch('mayan.apps.file_caching.models.Cache.prune_schedule')
+    def test_task_cache_prune(self, mock_cache_prune_schedule_method):
+        self.test_cache.maximum_size = self.test_cache.get_total_size()
+        self.test_cache.save()
+        self._create_test_cache_partition_file()
+
+        self._execute_task_cache_prune()
+
+        self.assertTrue(
+            self.test_cache.get_total_size() < self.test_cache.get_high_watermark_size()
+        )
+
+    @mock.patch('mayan.apps.file_caching.models.Cache.prune')
+    def test_task_cache_prune_in_progress(self, mock_cache_prune_method):
+        lock = LockingBackend.get_backend().acquire_lock(
+            name='file_caching-cache_prune-{}'.format(self.test_cache.pk)
+        )
+
+        self._execute_task_cache_prune()
+        lock.release()
+
+        self.assertFalse(mock_cache_prune_method.called)
+
     def test_task_cache_purge(self):
         self._clear_events()
 
@@ -1,5 +1,6 @@
 from django.conf.urls import url
 
+from .api_views import APICacheListView, APICacheView
 from .views import (
     CacheDetailView, CacheListView, CachePartitionPurgeView, CachePurgeView
 )
@@ -25,3 +26,14 @@ urlpatterns = [
         name='cache_partitions_purge', view=CachePartitionPurgeView.as_view()
     ),
 ]
+
+api_urls = [
+    url(
+        regex=r'^caches/$', name='cache-list',
+        view=APICacheListView.as_view()
+    ),
+    url(
+        regex=r'^caches/(?P<cache_id>[0-9]+)/$', name='cache-detail',
+        view=APICacheView.as_view()
+    ),
+]
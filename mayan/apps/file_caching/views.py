@@ -31,6 +31,27 @@ class CacheDetailView(SingleObjectDetailView):
             {
                 'field': 'get_total_size_display',
             },
+            {
+                'field': 'metric_hits',
+            },
+            {
+                'field': 'metric_misses',
+            },
+            {
+                'field': 'get_metric_hit_ratio_display',
+            },
+            {
+                'field': 'metric_evictions',
+            },
+            {
+                'field': 'get_metric_eviction_age_average_display',
+            },
+            {
+                'field': 'get_metric_bytes_written_display',
+            },
+            {
+                'field': 'get_metric_generation_time_average_display',
+            },
         ]
     }
     model = Cache
@@ -2,7 +2,7 @@ from django.contrib import admin
 
 from .models import (
     DocumentTypeOCRSettings, DocumentVersionOCRError,
-    DocumentVersionPageOCRContent
+    DocumentVersionPageOCRContent, SourcePageOCRContent
 )
 
 
@@ -20,3 +20,8 @@ class DocumentVersionOCRErrorAdmin(admin.ModelAdmin):
 @admin.register(DocumentVersionPageOCRContent)
 class DocumentVersionPageOCRContentAdmin(admin.ModelAdmin):
     list_display = ('document_version_page',)
+
+
+@admin.register(SourcePageOCRContent)
+class SourcePageOCRContentAdmin(admin.ModelAdmin):
+    list_display = ('content_object', 'transformation_hash')
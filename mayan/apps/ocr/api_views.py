@@ -7,6 +7,7 @@ from mayan.apps.documents.models.document_models import Document
 from mayan.apps.documents.models.document_version_models import DocumentVersion
 from mayan.apps.rest_api import generics
 
+from .literals import OCR_PRIORITY_REPROCESS
 from .models import DocumentVersionPageOCRContent, DocumentTypeOCRSettings
 from .permissions import (
     permission_document_type_ocr_setup, permission_document_version_ocr_content_view,
@@ -51,7 +52,7 @@ class APIDocumentOCRSubmitView(generics.GenericAPIView):
         return None
 
     def post(self, request, *args, **kwargs):
-        self.get_object().submit_for_ocr()
+        self.get_object().submit_for_ocr(_priority=OCR_PRIORITY_REPROCESS)
         return Response(status=status.HTTP_202_ACCEPTED)
 
 
@@ -112,5 +113,5 @@ class APIDocumentVersionOCRContentView(generics.GenericAPIView):
         return None
 
     def post(self, request, *args, **kwargs):
-        self.get_object().submit_for_ocr()
+        self.get_object().submit_for_ocr(_priority=OCR_PRIORITY_REPROCESS)
         return Response(status=status.HTTP_202_ACCEPTED)
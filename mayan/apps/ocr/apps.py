@@ -1,7 +1,7 @@
 import logging
 
 from django.apps import apps
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.acls.classes import ModelPermission
@@ -19,8 +19,8 @@ from .events import (
     event_ocr_document_version_submit
 )
 from .handlers import (
-    handler_index_document_version, handler_initialize_new_ocr_settings,
-    handler_ocr_document_version,
+    handler_delete_source_page_ocr_content, handler_index_document_version,
+    handler_initialize_new_ocr_settings, handler_ocr_document_version,
 )
 from .links import (
     link_document_version_page_ocr_content_view, link_document_version_ocr_content_view,
@@ -57,6 +57,9 @@ class OCRApp(MayanAppConfig):
         Document = apps.get_model(
             app_label='documents', model_name='Document'
         )
+        DocumentFilePage = apps.get_model(
+            app_label='documents', model_name='DocumentFilePage'
+        )
         DocumentType = apps.get_model(
             app_label='documents', model_name='DocumentType'
         )
@@ -179,6 +182,11 @@ class OCRApp(MayanAppConfig):
             )
         )
 
+        post_delete.connect(
+            dispatch_uid='ocr_handler_delete_source_page_ocr_content',
+            receiver=handler_delete_source_page_ocr_content,
+            sender=DocumentFilePage
+        )
         post_save.connect(
             dispatch_uid='ocr_handler_initialize_new_ocr_settings',
             receiver=handler_initialize_new_ocr_settings,
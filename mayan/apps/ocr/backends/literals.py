@@ -6,3 +6,8 @@ else:
     DEFAULT_TESSERACT_BINARY_PATH = '/usr/bin/tesseract'
 
 DEFAULT_TESSERACT_TIMEOUT = 600  # 600 seconds, 10 minutes
+
+DEFAULT_TESSERACT_API_LANGUAGE = 'eng'
+DEFAULT_TESSERACT_API_MAXIMUM_HANDLES = 4
+
+TESSERACT_PAGE_SEPARATOR = '\f'
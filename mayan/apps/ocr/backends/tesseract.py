@@ -7,12 +7,15 @@ import sh
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
-from mayan.apps.storage.utils import TemporaryFile
+from mayan.apps.storage.utils import TemporaryFile, mkdtemp
 
 from ..classes import OCRBackendBase
 from ..exceptions import OCRError
 
-from .literals import DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_TIMEOUT
+from .literals import (
+    DEFAULT_TESSERACT_BINARY_PATH, DEFAULT_TESSERACT_TIMEOUT,
+    TESSERACT_PAGE_SEPARATOR
+)
 
 logger = logging.getLogger(name=__name__)
 
@@ -25,6 +28,37 @@ class Tesseract(OCRBackendBase):
         if kwargs.get('auto_initialize', True):
             self.initialize()
 
+    def _execute_command(self, *arguments, **keyword_arguments):
+        keyword_arguments.setdefault('_timeout', self.command_timeout)
+
+        if self.language:
+            keyword_arguments['l'] = self.language
+
+        environment = os.environ.copy()
+        environment.update(self.environment)
+        keyword_arguments['_env'] = environment
+
+        try:
+            result = self.command_tesseract(
+                *arguments, **keyword_arguments
+            )
+            return force_text(s=result.stdout)
+        except Exception as exception:
+            error_message = (
+                'Exception calling Tesseract with language option: {}; {}'
+            ).format(self.language, exception)
+
+            if self.language not in self.languages:
+                error_message = (
+                    '{}\nThe requested OCR language "{}" is not '
+                    'available and needs to be installed.\n'
+                ).format(
+                    error_message, self.language
+                )
+
+            logger.error(error_message, exc_info=True)
+            raise OCRError(error_message)
+
     def execute(self, *args, **kwargs):
         """
         Execute the command line binary of tesseract
@@ -39,45 +73,77 @@ class Tesseract(OCRBackendBase):
                 shutil.copyfileobj(fsrc=image, fdst=temporary_image_file)
                 temporary_image_file.seek(0)
 
-                arguments = ['-', '-']
-
-                keyword_arguments = {
-                    '_in': temporary_image_file,
-                    '_timeout': self.command_timeout
-                }
-
-                if self.language:
-                    keyword_arguments['l'] = self.language
-
-                environment = os.environ.copy()
-                environment.update(self.environment)
-                keyword_arguments['_env'] = environment
-
-                try:
-                    result = self.command_tesseract(
-                        *arguments, **keyword_arguments
-                    )
-                    return force_text(s=result.stdout)
-                except Exception as exception:
-                    error_message = (
-                        'Exception calling Tesseract with language option: {}; {}'
-                    ).format(self.language, exception)
-
-                    if self.language not in self.languages:
-                        error_message = (
-                            '{}\nThe requested OCR language "{}" is not '
-                            'available and needs to be installed.\n'
-                        ).format(
-                            error_message, self.language
-                        )
-
-                    logger.error(error_message, exc_info=True)
-                    raise OCRError(error_message)
-                else:
-                    return result
+                return self._execute_command(
+                    '-', '-', _in=temporary_image_file
+                )
             finally:
                 temporary_image_file.close()
 
+    def execute_image(self, image, language=None):
+        """
+        Encode the image directly to the input of the tesseract binary.
+        """
+        if not self.command_tesseract:
+            return
+
+        self.language = language
+
+        try:
+            temporary_image_file = TemporaryFile()
+            image.save(temporary_image_file, format='PNG')
+            temporary_image_file.seek(0)
+
+            return self._execute_command('-', '-', _in=temporary_image_file)
+        finally:
+            temporary_image_file.close()
+
+    def execute_many(self, images, language=None):
+        """
+        Execute the command line binary of tesseract once for all the
+        images using a file with the list of the image paths. Tesseract
+        separates the text of each image with a form feed character.
+        """
+        if len(images) < 2 or not self.command_tesseract:
+            return super().execute_many(images=images, language=language)
+
+        self.language = language
+        temporary_directory = mkdtemp()
+
+        try:
+            image_paths = []
+            for index, image in enumerate(images):
+                image_path = os.path.join(
+                    temporary_directory, '{}.png'.format(index)
+                )
+                image.save(image_path, format='PNG')
+                image_paths.append(image_path)
+
+            image_list_path = os.path.join(temporary_directory, 'images.txt')
+            with open(file=image_list_path, mode='w') as image_list_file:
+                image_list_file.write('\n'.join(image_paths))
+
+            result = self._execute_command(
+                image_list_path, '-',
+                _timeout=self.command_timeout * len(images)
+            )
+        finally:
+            shutil.rmtree(path=temporary_directory, ignore_errors=True)
+
+        results = result.split(TESSERACT_PAGE_SEPARATOR)
+
+        # Some versions add the separator after the last page too.
+        if len(results) == len(images) + 1 and not results[-1].strip():
+            results.pop()
+
+        if len(results) != len(images):
+            logger.warning(
+                'Tesseract returned %d pages for %d images. Processing the '
+                'images individually.', len(results), len(images)
+            )
+            return super().execute_many(images=images, language=language)
+
+        return results
+
     def initialize(self):
         self.languages = ()
 
@@ -0,0 +1,100 @@
+from collections import OrderedDict
+import logging
+
+try:
+    import tesserocr
+except ImportError:
+    print('ERROR: This OCR backend requires tesserocr.')
+    raise
+
+from django.utils.encoding import force_text
+from django.utils.translation import ugettext_lazy as _
+
+from ..classes import OCRBackendBase
+from ..exceptions import OCRError
+
+from .literals import (
+    DEFAULT_TESSERACT_API_LANGUAGE, DEFAULT_TESSERACT_API_MAXIMUM_HANDLES
+)
+
+logger = logging.getLogger(name=__name__)
+
+
+class TesseractAPI(OCRBackendBase):
+    """
+    Tesseract backend that runs in process using the tesserocr bindings
+    of the Tesseract C API. An API handle is kept per language and reused
+    for every page, so that the language data is loaded from disk only
+    once. The page image is passed directly without temporary files.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.handles = OrderedDict()
+        self.read_settings()
+
+    def execute(self, *args, **kwargs):
+        super().execute(*args, **kwargs)
+
+        return self.execute_image(
+            image=self.converter.image, language=self.language
+        )
+
+    def execute_image(self, image, language=None):
+        self.language = language
+
+        handle = self.get_handle(
+            language=self.language or DEFAULT_TESSERACT_API_LANGUAGE
+        )
+
+        try:
+            handle.SetImage(image)
+            return force_text(s=handle.GetUTF8Text())
+        except RuntimeError as exception:
+            error_message = (
+                'Exception calling Tesseract API with language option: {}; {}'
+            ).format(self.language, exception)
+            logger.error(error_message, exc_info=True)
+            raise OCRError(error_message)
+        finally:
+            handle.Clear()
+
+    def get_handle(self, language):
+        """
+        Return the API handle of the language. The least recently used
+        handle is closed when the maximum number of handles is reached.
+        """
+        try:
+            self.handles.move_to_end(key=language)
+        except KeyError:
+            handle_kwargs = {'lang': language}
+            if self.tessdata_path:
+                handle_kwargs['path'] = self.tessdata_path
+
+            try:
+                handle = tesserocr.PyTessBaseAPI(**handle_kwargs)
+            except RuntimeError as exception:
+                raise OCRError(
+                    _(
+                        'Unable to initialize Tesseract with language "%(language)s". '
+                        'The language data might need to be installed; '
+                        '%(exception)s'
+                    ) % {'exception': exception, 'language': language}
+                )
+
+            logger.debug('Initialized Tesseract API for language: %s', language)
+
+            self.handles[language] = handle
+
+            while len(self.handles) > self.maximum_handles:
+                evicted_language, evicted_handle = self.handles.popitem(
+                    last=False
+                )
+                evicted_handle.End()
+
+        return self.handles[language]
+
+    def read_settings(self):
+        self.maximum_handles = self.kwargs.get(
+            'maximum_handles', DEFAULT_TESSERACT_API_MAXIMUM_HANDLES
+        )
+        self.tessdata_path = self.kwargs.get('tessdata_path')
@@ -1,16 +1,40 @@
+import copy
+from io import BytesIO
+import logging
+import threading
+
 from django.utils.module_loading import import_string
 
 from mayan.apps.converter.classes import ConverterBase
 
 from .settings import setting_ocr_backend, setting_ocr_backend_arguments
 
+logger = logging.getLogger(name=__name__)
+
 
 class OCRBackendBase:
-    @staticmethod
-    def get_instance():
-        return import_string(
-            dotted_path=setting_ocr_backend.value
-        )(**setting_ocr_backend_arguments.value)
+    _instances = threading.local()
+
+    @classmethod
+    def get_instance(cls):
+        """
+        Return the configured OCR backend. Initializing a backend can be
+        expensive, so the instance is created once per thread and reused
+        until the OCR backend settings change.
+        """
+        key = (
+            setting_ocr_backend.value, setting_ocr_backend_arguments.value
+        )
+
+        if getattr(cls._instances, 'key', None) != key:
+            logger.debug('Initializing OCR backend: %s', key[0])
+
+            cls._instances.instance = import_string(
+                dotted_path=key[0]
+            )(**key[1])
+            cls._instances.key = copy.deepcopy(key)
+
+        return cls._instances.instance
 
     def __init__(self, *args, **kwargs):
         self.args = args
@@ -26,5 +50,26 @@ class OCRBackendBase:
             file_object=file_object
         )
 
-        for transformation in transformations:
-            self.converter.transform(transformation=transformation)
+        self.converter.transform_many(transformations=transformations)
+
+    def execute_image(self, image, language=None):
+        """
+        Return the text of a Pillow image. Backends able to use the image
+        directly override this method, by default the image is encoded
+        and passed to execute().
+        """
+        image_buffer = BytesIO()
+        image.save(image_buffer, format='PNG')
+        image_buffer.seek(0)
+
+        return self.execute(file_object=image_buffer, language=language)
+
+    def execute_many(self, images, language=None):
+        """
+        Return the text of several Pillow images in the same order.
+        Backends that can recognize several images with a single call
+        override this method to avoid the per image overhead.
+        """
+        return [
+            self.execute_image(image=image, language=language) for image in images
+        ]
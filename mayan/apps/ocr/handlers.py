@@ -9,6 +9,20 @@ from .settings import setting_auto_ocr
 logger = logging.getLogger(name=__name__)
 
 
+def handler_delete_source_page_ocr_content(sender, instance, **kwargs):
+    ContentType = apps.get_model(
+        app_label='contenttypes', model_name='ContentType'
+    )
+    SourcePageOCRContent = apps.get_model(
+        app_label='ocr', model_name='SourcePageOCRContent'
+    )
+
+    SourcePageOCRContent.objects.filter(
+        content_type=ContentType.objects.get_for_model(model=instance),
+        object_id=instance.pk
+    ).delete()
+
+
 def handler_index_document_version(sender, **kwargs):
     task_index_document.apply_async(
         kwargs=dict(document_id=kwargs['instance'].document_id)
@@ -1,6 +1,37 @@
+from django.utils.translation import ugettext_lazy as _
+
 DEFAULT_OCR_AUTO_OCR = True
 DEFAULT_OCR_BACKEND = 'mayan.apps.ocr.backends.tesseract.Tesseract'
 DEFAULT_OCR_BACKEND_ARGUMENTS = {'environment': {'OMP_THREAD_LIMIT': '1'}}
+DEFAULT_OCR_IMAGE_PROFILE = {
+    'binarize': False, 'border_removal': False, 'deskew': False, 'dpi': 300,
+    'grayscale': True
+}
+DEFAULT_OCR_PAGE_BATCH_SIZE = 1
+DEFAULT_OCR_SCHEDULING_ROUND_SIZE = 50
+DEFAULT_OCR_TEXT_LAYER_THRESHOLD = 0
+
+OCR_CONTENT_SOURCE_OCR = 1
+OCR_CONTENT_SOURCE_TEXT_LAYER = 2
+OCR_CONTENT_SOURCE_CHOICES = (
+    (OCR_CONTENT_SOURCE_OCR, _('OCR')),
+    (OCR_CONTENT_SOURCE_TEXT_LAYER, _('Text layer')),
+)
+
+OCR_PRIORITY_BULK = 'bulk'
+OCR_PRIORITY_INTERACTIVE = 'interactive'
+OCR_PRIORITY_REPROCESS = 'reprocess'
+OCR_PRIORITY_QUEUE_NAMES = {
+    OCR_PRIORITY_BULK: 'ocr_bulk',
+    OCR_PRIORITY_INTERACTIVE: 'ocr',
+    OCR_PRIORITY_REPROCESS: 'ocr_reprocess'
+}
+
+# Average brightness below which an edge row or column is a scan border.
+OCR_IMAGE_BORDER_THRESHOLD = 64
+OCR_IMAGE_DESKEW_MAXIMUM_ANGLE = 5  # Degrees
+OCR_IMAGE_DESKEW_SAMPLE_WIDTH = 800
+OCR_IMAGE_DESKEW_STEP = 0.5  # Degrees
 
 TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY = 10
 TASK_DOCUMENT_VERSION_PAGE_OCR_TIMEOUT = 10 * 60  # 10 Minutes per page
@@ -1,82 +1,333 @@
+import hashlib
+import json
 import logging
 
 from django.apps import apps
-from django.db import models, transaction
+from django.db import IntegrityError, models, transaction
+from django.utils.encoding import force_bytes
 
-from mayan.apps.documents.literals import DOCUMENT_IMAGE_TASK_TIMEOUT
-from mayan.apps.lock_manager.backends.base import LockingBackend
+from mayan.apps.converter.transformations import BaseTransformation
 
 from .classes import OCRBackendBase
 from .events import event_ocr_document_version_content_deleted
+from .literals import OCR_CONTENT_SOURCE_OCR, OCR_CONTENT_SOURCE_TEXT_LAYER
+from .settings import (
+    setting_ocr_backend, setting_ocr_backend_arguments,
+    setting_ocr_text_layer_threshold
+)
+from .utils import get_ocr_image_transformations
 
 logger = logging.getLogger(name=__name__)
 
 
 class DocumentVersionPageOCRContentManager(models.Manager):
     def delete_content_for(self, document_version, user=None):
+        SourcePageOCRContent = apps.get_model(
+            app_label='ocr', model_name='SourcePageOCRContent'
+        )
+
         with transaction.atomic():
             for document_version_page in document_version.pages.all():
                 self.filter(
                     document_version_page=document_version_page
                 ).delete()
 
+            # Delete the stored results of the source too, to have the
+            # pages processed again by the next OCR.
+            SourcePageOCRContent.objects.delete_content_for(
+                document_version=document_version
+            )
+
             event_ocr_document_version_content_deleted.commit(
                 actor=user, action_object=document_version.document,
                 target=document_version
             )
 
+    def get_ocr_image(
+        self, document_version_page, transformations=None, user=None
+    ):
+        """
+        Render the image of a document version page for OCR. The image is
+        produced from the native resolution base image of the source page
+        with the stored transformations of both pages and the OCR image
+        profile, without using the display images of the cache.
+        """
+        if transformations is None:
+            transformations = self.get_ocr_transformation_list(
+                document_version_page=document_version_page, user=user
+            )
+
+        return document_version_page.content_object.get_image(
+            transformations=transformations, _as_image=True
+        )
+
+    def get_ocr_transformation_hash(self, transformations, language=None):
+        result = hashlib.sha256(
+            force_bytes(
+                s=BaseTransformation.combine(transformations=transformations)
+            )
+        )
+        result.update(force_bytes(s=language or ''))
+        result.update(force_bytes(s=setting_ocr_backend.value))
+        result.update(
+            force_bytes(
+                s=json.dumps(
+                    obj=setting_ocr_backend_arguments.value, sort_keys=True
+                )
+            )
+        )
+
+        return result.hexdigest()
+
+    def get_ocr_transformation_list(self, document_version_page, user=None):
+        LayerTransformation = apps.get_model(
+            app_label='converter', model_name='LayerTransformation'
+        )
+
+        transformations = LayerTransformation.objects.get_for_object(
+            obj=document_version_page.content_object, as_classes=True,
+            user=user
+        )
+        transformations.extend(
+            LayerTransformation.objects.get_for_object(
+                obj=document_version_page, as_classes=True, user=user
+            )
+        )
+        transformations.extend(get_ocr_image_transformations())
+
+        return transformations
+
+    def get_text_layer_content(self, document_version_page):
+        """
+        Return the parsed text of the document file page source of the
+        document version page if it has enough characters to make the OCR
+        of the page unnecessary. Source files not parsed yet are parsed
+        first when the parsing is enabled for their document type.
+        """
+        threshold = setting_ocr_text_layer_threshold.value
+
+        if not threshold:
+            return
+
+        DocumentFilePage = apps.get_model(
+            app_label='documents', model_name='DocumentFilePage'
+        )
+        DocumentFilePageContent = apps.get_model(
+            app_label='document_parsing', model_name='DocumentFilePageContent'
+        )
+
+        if document_version_page.content_type.model_class() != DocumentFilePage:
+            return
+
+        queryset = DocumentFilePageContent.objects.filter(
+            document_file_page_id=document_version_page.object_id
+        )
+
+        if not queryset.exists():
+            document_file = document_version_page.content_object.document_file
+
+            if not document_file.document.document_type.parsing_settings.auto_parsing:
+                return
+
+            # The OCR of a new document can start before the parsing of
+            # its file. Parse the source file now to not miss its text
+            # layer.
+            DocumentFilePageContent.objects.process_document_file(
+                document_file=document_file
+            )
+
+        content = queryset.values_list('content', flat=True).first()
+
+        if content and len(''.join(content.split())) >= threshold:
+            return content
+
     def process_document_version_page(
         self, document_version_page, user=None
     ):
+        self.process_document_version_pages(
+            document_version_pages=(document_version_page,), user=user
+        )
+
+    def process_document_version_pages(
+        self, document_version_pages, user=None
+    ):
+        """
+        OCR several pages of a document version with a single call to the
+        OCR backend and store the results with bulk queries. Pages with a
+        text layer are not sent to the OCR backend.
+        """
+        document_version_pages = list(document_version_pages)
+
+        if not document_version_pages:
+            return
+
+        document_version = document_version_pages[0].document_version
+
         logger.info(
-            'Processing page: %d of document version: %s',
-            document_version_page.page_number,
-            document_version_page.document_version
+            'Processing pages: %s of document version: %s',
+            ', '.join(
+                str(document_version_page.page_number) for document_version_page in document_version_pages
+            ), document_version
         )
 
-        DocumentVersionPageOCRContent = apps.get_model(
-            app_label='ocr', model_name='DocumentVersionPageOCRContent'
+        contents = {}
+        document_version_pages_ocr = []
+
+        for document_version_page in document_version_pages:
+            content = self.get_text_layer_content(
+                document_version_page=document_version_page
+            )
+
+            if content is None:
+                document_version_pages_ocr.append(document_version_page)
+            else:
+                logger.info(
+                    'Using the text layer for page: %d of document '
+                    'version: %s', document_version_page.page_number,
+                    document_version
+                )
+                contents[document_version_page.pk] = {
+                    'content': content,
+                    'source': OCR_CONTENT_SOURCE_TEXT_LAYER
+                }
+
+        SourcePageOCRContent = apps.get_model(
+            app_label='ocr', model_name='SourcePageOCRContent'
         )
 
-        lock_name = document_version_page.get_lock_name(user=user)
+        language = document_version.document.language
 
         try:
-            document_version_page_lock = LockingBackend.get_backend().acquire_lock(
-                name=lock_name, timeout=DOCUMENT_IMAGE_TASK_TIMEOUT * 2
+            pending = []
+            for document_version_page in document_version_pages_ocr:
+                transformations = self.get_ocr_transformation_list(
+                    document_version_page=document_version_page, user=user
+                )
+                transformation_hash = self.get_ocr_transformation_hash(
+                    language=language, transformations=transformations
+                )
 
+                content = SourcePageOCRContent.objects.filter(
+                    content_type_id=document_version_page.content_type_id,
+                    object_id=document_version_page.object_id,
+                    transformation_hash=transformation_hash
+                ).values_list('content', flat=True).first()
+
+                if content is None:
+                    pending.append(
+                        (
+                            document_version_page, transformations,
+                            transformation_hash
+                        )
+                    )
+                else:
+                    logger.info(
+                        'Reusing the OCR content of the source of page: %d '
+                        'of document version: %s',
+                        document_version_page.page_number, document_version
+                    )
+                    contents[document_version_page.pk] = {
+                        'content': content, 'source': OCR_CONTENT_SOURCE_OCR
+                    }
+
+            if pending:
+                images = [
+                    self.get_ocr_image(
+                        document_version_page=document_version_page,
+                        transformations=transformations
+                    ) for document_version_page, transformations, transformation_hash in pending
+                ]
+
+                ocr_contents = OCRBackendBase.get_instance().execute_many(
+                    images=images, language=language
+                )
+
+                source_page_ocr_contents = []
+                for (document_version_page, transformations, transformation_hash), content in zip(pending, ocr_contents):
+                    contents[document_version_page.pk] = {
+                        'content': content, 'source': OCR_CONTENT_SOURCE_OCR
+                    }
+                    source_page_ocr_contents.append(
+                        SourcePageOCRContent(
+                            content=content,
+                            content_type_id=document_version_page.content_type_id,
+                            object_id=document_version_page.object_id,
+                            transformation_hash=transformation_hash
+                        )
+                    )
+
+                SourcePageOCRContent.objects.bulk_create(
+                    ignore_conflicts=True, objs=source_page_ocr_contents
+                )
+
+            self._bulk_update_or_create(contents=contents)
+        except Exception as exception:
+            logger.error(
+                'OCR error for document version pages: %s; %s',
+                ', '.join(
+                    str(document_version_page.pk) for document_version_page in document_version_pages
+                ), exception, exc_info=True
             )
-        except Exception:
             raise
         else:
-            try:
-                cache_filename = document_version_page.generate_image(
-                    _acquire_lock=False, user=user
-                )
+            logger.info(
+                'Finished processing %d pages of document version: %s',
+                len(document_version_pages), document_version
+            )
+
+    def _bulk_update_or_create(self, contents):
+        """
+        Store the OCR content of several document version pages. The
+        argument is a dictionary of the field values keyed by the document
+        version page ID. Content created concurrently by another OCR
+        process is updated instead.
+        """
+        with transaction.atomic():
+            existing = self.select_for_update().filter(
+                document_version_page_id__in=contents.keys()
+            )
+
+            updated = []
+            for ocr_content in existing:
+                for name, value in contents.pop(ocr_content.document_version_page_id).items():
+                    setattr(ocr_content, name, value)
+                updated.append(ocr_content)
 
-                with document_version_page.cache_partition.get_file(filename=cache_filename).open() as file_object:
-                    ocr_content = OCRBackendBase.get_instance().execute(
-                        file_object=file_object,
-                        language=document_version_page.document_version.document.language
+            self.bulk_update(objs=updated, fields=('content', 'source'))
+
+            try:
+                # Savepoint to be able to continue the transaction if a
+                # concurrent OCR of the same pages created their content
+                # after the query of the existing ones.
+                with transaction.atomic():
+                    self.bulk_create(
+                        objs=[
+                            self.model(
+                                document_version_page_id=document_version_page_id,
+                                **values
+                            ) for document_version_page_id, values in contents.items()
+                        ]
                     )
-                    DocumentVersionPageOCRContent.objects.update_or_create(
-                        document_version_page=document_version_page, defaults={
-                            'content': ocr_content
-                        }
+            except IntegrityError:
+                for document_version_page_id, values in contents.items():
+                    self.update_or_create(
+                        defaults=values,
+                        document_version_page_id=document_version_page_id
                     )
-            except Exception as exception:
-                logger.error(
-                    'OCR error for document version page: %d; %s',
-                    document_version_page.pk, exception, exc_info=True
-                )
-                raise
-            else:
-                logger.info(
-                    'Finished processing page: %d of document version: %s',
-                    document_version_page.page_number,
-                    document_version_page.document_version
-                )
-            finally:
-                document_version_page_lock.release()
+
+
+class SourcePageOCRContentManager(models.Manager):
+    def delete_content_for(self, document_version):
+        """
+        Delete the stored OCR results of the source objects of the pages
+        of a document version.
+        """
+        with transaction.atomic():
+            for document_version_page in document_version.pages.all():
+                self.filter(
+                    content_type_id=document_version_page.content_type_id,
+                    object_id=document_version_page.object_id
+                ).delete()
 
 
 class DocumentTypeSettingsManager(models.Manager):
@@ -1,23 +1,27 @@
 from datetime import timedelta
 
+from django.apps import apps
 from django.utils.timezone import now
 
 from mayan.apps.common.settings import settings_db_sync_task_delay
 from mayan.apps.documents.literals import DOCUMENT_IMAGE_TASK_TIMEOUT
 
 from .events import event_ocr_document_version_submit
-from .literals import TASK_DOCUMENT_VERSION_PAGE_OCR_TIMEOUT
+from .literals import (
+    OCR_PRIORITY_INTERACTIVE, OCR_PRIORITY_QUEUE_NAMES,
+    TASK_DOCUMENT_VERSION_PAGE_OCR_TIMEOUT
+)
 from .tasks import task_document_version_ocr_process
 
 
-def method_document_ocr_submit(self, _user=None):
+def method_document_ocr_submit(self, _priority=None, _user=None):
     version_active = self.version_active
     # Don't error out if document has no version
     if version_active:
-        version_active.submit_for_ocr(_user=_user)
+        version_active.submit_for_ocr(_priority=_priority, _user=_user)
 
 
-def method_document_version_ocr_submit(self, _user=None):
+def method_document_version_ocr_submit(self, _priority=None, _user=None):
     event_ocr_document_version_submit.commit(
         action_object=self.document, actor=_user, target=self
     )
@@ -27,6 +31,16 @@ def method_document_version_ocr_submit(self, _user=None):
     else:
         user_id = None
 
+    priority = _priority or OCR_PRIORITY_INTERACTIVE
+
+    if priority != OCR_PRIORITY_INTERACTIVE:
+        # Explicit submissions run the OCR backend again instead of reusing
+        # the stored results of the source pages.
+        SourcePageOCRContent = apps.get_model(
+            app_label='ocr', model_name='SourcePageOCRContent'
+        )
+        SourcePageOCRContent.objects.delete_content_for(document_version=self)
+
     # Timeout calculation logic:
     # Total timeout for the document version task should be the
     # file page render timeout + the version page timeout + version page OCR
@@ -37,8 +51,9 @@ def method_document_version_ocr_submit(self, _user=None):
     task_document_version_ocr_process.apply_async(
         eta=now() + timedelta(seconds=settings_db_sync_task_delay.value),
         kwargs={
-            'document_version_id': self.pk, 'user_id': user_id
-        }, timeout=(
+            'document_version_id': self.pk, 'priority': priority,
+            'user_id': user_id
+        }, queue=OCR_PRIORITY_QUEUE_NAMES[priority], timeout=(
             TASK_DOCUMENT_VERSION_PAGE_OCR_TIMEOUT + DOCUMENT_IMAGE_TASK_TIMEOUT * 2
         ) * self.pages.count()
     )
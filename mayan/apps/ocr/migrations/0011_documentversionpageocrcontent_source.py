@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('ocr', '0010_auto_20210304_1215'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documentversionpageocrcontent',
+            name='source',
+            field=models.PositiveIntegerField(
+                choices=[(1, 'OCR'), (2, 'Text layer')], default=1,
+                help_text='Origin of the content. Pages with enough parsed '
+                'text are not processed by the OCR backend and use the text '
+                'layer of the document file page instead.',
+                verbose_name='Source'
+            ),
+        ),
+    ]
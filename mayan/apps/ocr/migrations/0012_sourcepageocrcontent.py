@@ -0,0 +1,58 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('ocr', '0011_documentversionpageocrcontent_source'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SourcePageOCRContent',
+            fields=[
+                (
+                    'id', models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False,
+                        verbose_name='ID'
+                    )
+                ),
+                (
+                    'object_id', models.PositiveIntegerField(
+                        help_text='ID for the source object of the page.'
+                    )
+                ),
+                (
+                    'transformation_hash', models.CharField(
+                        help_text='Hash of the transformations, the '
+                        'language and the OCR backend used to produce the '
+                        'content.', max_length=64,
+                        verbose_name='Transformation hash'
+                    )
+                ),
+                (
+                    'content', models.TextField(
+                        blank=True, help_text='The actual text content '
+                        'extracted by the OCR backend.',
+                        verbose_name='Content'
+                    )
+                ),
+                (
+                    'content_type', models.ForeignKey(
+                        help_text='Content type for the source object of '
+                        'the page.',
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to='contenttypes.ContentType'
+                    )
+                ),
+            ],
+            options={
+                'verbose_name': 'Source page OCR content',
+                'verbose_name_plural': 'Source pages OCR contents',
+                'unique_together': {
+                    ('content_type', 'object_id', 'transformation_hash')
+                },
+            },
+        ),
+    ]
@@ -1,3 +1,5 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
@@ -6,8 +8,10 @@ from mayan.apps.documents.models.document_type_models import DocumentType
 from mayan.apps.documents.models.document_version_models import DocumentVersion
 from mayan.apps.documents.models.document_version_page_models import DocumentVersionPage
 
+from .literals import OCR_CONTENT_SOURCE_CHOICES, OCR_CONTENT_SOURCE_OCR
 from .managers import (
-    DocumentVersionPageOCRContentManager, DocumentTypeSettingsManager
+    DocumentVersionPageOCRContentManager, DocumentTypeSettingsManager,
+    SourcePageOCRContentManager
 )
 
 
@@ -71,6 +75,14 @@ class DocumentVersionPageOCRContent(models.Model):
             'The actual text content extracted by the OCR backend.'
         ), verbose_name=_('Content')
     )
+    source = models.PositiveIntegerField(
+        choices=OCR_CONTENT_SOURCE_CHOICES, default=OCR_CONTENT_SOURCE_OCR,
+        help_text=_(
+            'Origin of the content. Pages with enough parsed text are not '
+            'processed by the OCR backend and use the text layer of the '
+            'document file page instead.'
+        ), verbose_name=_('Source')
+    )
 
     objects = DocumentVersionPageOCRContentManager()
 
@@ -80,3 +92,42 @@ class DocumentVersionPageOCRContent(models.Model):
 
     def __str__(self):
         return force_text(s=self.document_version_page)
+
+
+class SourcePageOCRContent(models.Model):
+    """
+    This model stores the OCR results of the source object of the document
+    version pages to allow reusing them when the pages of a document
+    version are remapped.
+    """
+    content_type = models.ForeignKey(
+        help_text=_('Content type for the source object of the page.'),
+        on_delete=models.CASCADE, to=ContentType
+    )
+    object_id = models.PositiveIntegerField(
+        help_text=_('ID for the source object of the page.')
+    )
+    content_object = GenericForeignKey(
+        ct_field='content_type', fk_field='object_id'
+    )
+    transformation_hash = models.CharField(
+        help_text=_(
+            'Hash of the transformations, the language and the OCR backend '
+            'used to produce the content.'
+        ), max_length=64, verbose_name=_('Transformation hash')
+    )
+    content = models.TextField(
+        blank=True, help_text=_(
+            'The actual text content extracted by the OCR backend.'
+        ), verbose_name=_('Content')
+    )
+
+    objects = SourcePageOCRContentManager()
+
+    class Meta:
+        unique_together = ('content_type', 'object_id', 'transformation_hash')
+        verbose_name = _('Source page OCR content')
+        verbose_name_plural = _('Source pages OCR contents')
+
+    def __str__(self):
+        return force_text(s=self.content_object)
@@ -1,9 +1,28 @@
 from django.utils.translation import ugettext_lazy as _
 
 from mayan.apps.task_manager.classes import CeleryQueue
-from mayan.apps.task_manager.workers import worker_d
+from mayan.apps.task_manager.workers import worker_d, worker_e
 
-queue_ocr = CeleryQueue(name='ocr', label=_('OCR'), worker=worker_d)
+from .literals import (
+    OCR_PRIORITY_BULK, OCR_PRIORITY_INTERACTIVE, OCR_PRIORITY_QUEUE_NAMES,
+    OCR_PRIORITY_REPROCESS
+)
+
+# Each priority class has its own queue. The bulk and reprocess queues are
+# consumed by a separate worker with a lower CPU priority to keep them from
+# delaying the OCR of new documents.
+queue_ocr = CeleryQueue(
+    name=OCR_PRIORITY_QUEUE_NAMES[OCR_PRIORITY_INTERACTIVE], label=_('OCR'),
+    worker=worker_d
+)
+queue_ocr_bulk = CeleryQueue(
+    name=OCR_PRIORITY_QUEUE_NAMES[OCR_PRIORITY_BULK], label=_('OCR bulk'),
+    worker=worker_e
+)
+queue_ocr_reprocess = CeleryQueue(
+    name=OCR_PRIORITY_QUEUE_NAMES[OCR_PRIORITY_REPROCESS],
+    label=_('OCR reprocess'), worker=worker_e
+)
 
 queue_ocr.add_task_type(
     dotted_path='mayan.apps.ocr.tasks.task_document_version_ocr_finished',
@@ -13,7 +32,15 @@ queue_ocr.add_task_type(
     dotted_path='mayan.apps.ocr.tasks.task_document_version_page_ocr_process',
     label=_('Document file page OCR')
 )
+queue_ocr.add_task_type(
+    dotted_path='mayan.apps.ocr.tasks.task_document_version_page_ocr_process_batch',
+    label=_('Document file page batch OCR')
+)
 queue_ocr.add_task_type(
     dotted_path='mayan.apps.ocr.tasks.task_document_version_ocr_process',
     label=_('Document file OCR')
 )
+queue_ocr.add_task_type(
+    dotted_path='mayan.apps.ocr.tasks.task_document_version_ocr_process_next',
+    label=_('Document file OCR next pages')
+)
@@ -5,7 +5,7 @@ from .models import DocumentVersionPageOCRContent, DocumentTypeOCRSettings
 
 class DocumentVersionPageOCRContentSerializer(serializers.ModelSerializer):
     class Meta:
-        fields = ('content',)
+        fields = ('content', 'source')
         model = DocumentVersionPageOCRContent
 
 
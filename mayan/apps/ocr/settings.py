@@ -3,7 +3,9 @@ from django.utils.translation import ugettext_lazy as _
 from mayan.apps.smart_settings.classes import SettingNamespace
 
 from .literals import (
-    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS
+    DEFAULT_OCR_AUTO_OCR, DEFAULT_OCR_BACKEND, DEFAULT_OCR_BACKEND_ARGUMENTS,
+    DEFAULT_OCR_IMAGE_PROFILE, DEFAULT_OCR_PAGE_BATCH_SIZE,
+    DEFAULT_OCR_SCHEDULING_ROUND_SIZE, DEFAULT_OCR_TEXT_LAYER_THRESHOLD
 )
 from .setting_migrations import OCRSettingMigration
 
@@ -26,3 +28,45 @@ setting_ocr_backend_arguments = namespace.add_setting(
     default=DEFAULT_OCR_BACKEND_ARGUMENTS,
     global_name='OCR_BACKEND_ARGUMENTS'
 )
+setting_ocr_image_profile = namespace.add_setting(
+    default=DEFAULT_OCR_IMAGE_PROFILE, global_name='OCR_IMAGE_PROFILE',
+    help_text=_(
+        'Preparation of the page images sent to the OCR backend. The '
+        'images are rendered from the native resolution page image '
+        'independently of the display settings. Options: "dpi", the '
+        'resolution of the image; "grayscale", remove the color; '
+        '"binarize", convert to black and white; "deskew", straighten '
+        'the text lines; "border_removal", crop the dark borders of '
+        'scanned pages.'
+    )
+)
+setting_ocr_page_batch_size = namespace.add_setting(
+    default=DEFAULT_OCR_PAGE_BATCH_SIZE, global_name='OCR_PAGE_BATCH_SIZE',
+    help_text=_(
+        'Number of document version pages processed by each OCR task. '
+        'The pages of a batch are sent to the OCR backend in a single call '
+        'and their content is saved with bulk queries, reducing the task '
+        'overhead of documents with many pages. A value of 1 processes '
+        'each page in its own task.'
+    )
+)
+setting_ocr_scheduling_round_size = namespace.add_setting(
+    default=DEFAULT_OCR_SCHEDULING_ROUND_SIZE,
+    global_name='OCR_SCHEDULING_ROUND_SIZE', help_text=_(
+        'Maximum number of pages of a document version queued for OCR at '
+        'the same time. The next pages are queued when these finish, '
+        'behind the pages of the documents submitted in the meantime, to '
+        'avoid large documents delaying the OCR of the rest. Use 0 to '
+        'queue all the pages at once.'
+    )
+)
+setting_ocr_text_layer_threshold = namespace.add_setting(
+    default=DEFAULT_OCR_TEXT_LAYER_THRESHOLD,
+    global_name='OCR_TEXT_LAYER_THRESHOLD', help_text=_(
+        'Minimum number of non whitespace characters of the parsed text '
+        'of the source document file page required to skip the OCR of a '
+        'document version page. The parsed text is used as the OCR '
+        'content of the page instead. Pages without parsed text are '
+        'always processed. Use 0 to disable.'
+    )
+)
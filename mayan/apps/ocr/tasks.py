@@ -10,16 +10,26 @@ from mayan.apps.lock_manager.exceptions import LockError
 from mayan.celery import app
 
 from .events import event_ocr_document_version_finish
-from .literals import TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY
+from .literals import (
+    OCR_PRIORITY_INTERACTIVE, OCR_PRIORITY_QUEUE_NAMES,
+    TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY
+)
+from .settings import (
+    setting_ocr_page_batch_size, setting_ocr_scheduling_round_size
+)
 from .signals import signal_post_document_version_ocr
 
 logger = logging.getLogger(name=__name__)
 
 
 @app.task(bind=True, ignore_result=True)
-def task_document_version_ocr_process(self, document_version_id, user_id=None):
+def task_document_version_ocr_process(
+    self, document_version_id, page_offset=0,
+    priority=OCR_PRIORITY_INTERACTIVE, user_id=None
+):
     logger.info(
-        'Starting OCR for document version page ID: %s', document_version_id
+        'Starting OCR for document version ID: %s, page offset: %d',
+        document_version_id, page_offset
     )
     DocumentVersion = apps.get_model(
         app_label='documents', model_name='DocumentVersion'
@@ -29,25 +39,79 @@ def task_document_version_ocr_process(self, document_version_id, user_id=None):
         pk=document_version_id
     )
 
+    queue = OCR_PRIORITY_QUEUE_NAMES[priority]
+
     try:
+        document_version_page_ids = list(
+            document_version.pages.values_list('pk', flat=True)
+        )
+        batch_size = max(setting_ocr_page_batch_size.value, 1)
+
+        # Queue the pages in rounds. Each round is queued when the
+        # previous one finishes, behind the work submitted in the meantime,
+        # so that the pages of different documents take turns in the queue.
+        round_size = setting_ocr_scheduling_round_size.value
+        if round_size > 0:
+            # Keep the batches of a round complete.
+            round_size = -(-round_size // batch_size) * batch_size
+            page_offset_next = page_offset + round_size
+        else:
+            page_offset_next = len(document_version_page_ids)
+
+        document_version_page_ids = document_version_page_ids[
+            page_offset:page_offset_next
+        ]
+
         document_version_page_tasks = []
-        for document_version_page in document_version.pages.all():
-            document_version_page_tasks.append(
-                task_document_version_page_ocr_process.s(
-                    document_version_page_id=document_version_page.pk,
-                    user_id=user_id
+        if batch_size == 1:
+            for document_version_page_id in document_version_page_ids:
+                document_version_page_tasks.append(
+                    task_document_version_page_ocr_process.s(
+                        document_version_page_id=document_version_page_id,
+                        user_id=user_id
+                    ).set(queue=queue)
+                )
+        else:
+            for index in range(0, len(document_version_page_ids), batch_size):
+                document_version_page_tasks.append(
+                    task_document_version_page_ocr_process_batch.s(
+                        document_version_page_ids=document_version_page_ids[
+                            index:index + batch_size
+                        ], user_id=user_id
+                    ).set(queue=queue)
                 )
+
+        if page_offset_next < document_version.pages.count():
+            callback = task_document_version_ocr_process_next.s(
+                document_version_id=document_version.pk,
+                page_offset=page_offset_next, priority=priority,
+                user_id=user_id
             )
-        chord(document_version_page_tasks)(
-            task_document_version_ocr_finished.s(
+        else:
+            callback = task_document_version_ocr_finished.s(
                 document_version_id=document_version.pk, user_id=user_id
             )
-        )
+
+        chord(document_version_page_tasks)(callback.set(queue=queue))
     except Exception as exception:
         document_version.ocr_errors.create(result=exception)
         raise
 
 
+@app.task(bind=True, ignore_result=True)
+def task_document_version_ocr_process_next(
+    self, results, document_version_id, page_offset, priority,
+    user_id=None
+):
+    task_document_version_ocr_process.apply_async(
+        kwargs={
+            'document_version_id': document_version_id,
+            'page_offset': page_offset, 'priority': priority,
+            'user_id': user_id
+        }, queue=OCR_PRIORITY_QUEUE_NAMES[priority]
+    )
+
+
 @app.task(
     bind=True, default_retry_delay=TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY
 )
@@ -91,6 +155,48 @@ def task_document_version_page_ocr_process(
         raise self.retry(exc=exception)
 
 
+@app.task(
+    bind=True, default_retry_delay=TASK_DOCUMENT_VERSION_PAGE_OCR_RETRY_DELAY
+)
+def task_document_version_page_ocr_process_batch(
+    self, document_version_page_ids, user_id=None
+):
+    CachePartitionFile = apps.get_model(
+        app_label='file_caching', model_name='CachePartitionFile'
+    )
+    DocumentVersionPageOCRContent = apps.get_model(
+        app_label='ocr', model_name='DocumentVersionPageOCRContent'
+    )
+    DocumentVersionPage = apps.get_model(
+        app_label='documents', model_name='DocumentVersionPage'
+    )
+    document_version_pages = DocumentVersionPage.objects.filter(
+        pk__in=document_version_page_ids
+    ).order_by('page_number')
+
+    User = get_user_model()
+
+    if user_id:
+        user = User.objects.get(pk=user_id)
+    else:
+        user = None
+
+    try:
+        DocumentVersionPageOCRContent.objects.process_document_version_pages(
+            document_version_pages=document_version_pages, user=user
+        )
+    except CachePartitionFile.DoesNotExist as exception:
+        logger.info(
+            'Document version page image not found. Possible cause '
+            'overloaded system or cache size too small. Retrying task.',
+        )
+        raise self.retry(exc=exception)
+    except LockError as exception:
+        raise self.retry(exc=exception)
+    except OperationalError as exception:
+        raise self.retry(exc=exception)
+
+
 @app.task(bind=True, ignore_result=True)
 def task_document_version_ocr_finished(self, results, document_version_id, user_id=None):
     logger.info(
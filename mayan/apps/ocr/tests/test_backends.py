@@ -0,0 +1,138 @@
+import importlib
+import sys
+
+import mock
+
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..exceptions import OCRError
+
+from .literals import (
+    TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT, TEST_TESSERACT_API_LANGUAGE_1,
+    TEST_TESSERACT_API_LANGUAGE_2, TEST_TESSERACT_API_LANGUAGE_3,
+    TEST_TESSERACT_API_TESSDATA_PATH
+)
+
+
+class TesseractAPIBackendTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        # The tesserocr bindings are not a requirement, replace them with
+        # a mock that returns a new handle for each initialization.
+        self.mock_tesserocr = mock.MagicMock()
+        self.mock_tesserocr.PyTessBaseAPI.side_effect = lambda **kwargs: mock.MagicMock()
+
+        # Removes the backend module imported with the mock on stop.
+        patcher = mock.patch.dict(
+            in_dict=sys.modules, values={'tesserocr': self.mock_tesserocr}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.tesseract_api = importlib.import_module(
+            name='mayan.apps.ocr.backends.tesseract_api'
+        )
+
+    def _create_test_backend(self, **kwargs):
+        self.test_backend = self.tesseract_api.TesseractAPI(**kwargs)
+
+    def test_execute_image(self):
+        self._create_test_backend()
+
+        handle = self.test_backend.get_handle(
+            language=TEST_TESSERACT_API_LANGUAGE_1
+        )
+        handle.GetUTF8Text.return_value = TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT
+
+        self.assertEqual(
+            self.test_backend.execute_image(
+                image=mock.sentinel.image,
+                language=TEST_TESSERACT_API_LANGUAGE_1
+            ), TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT
+        )
+        handle.SetImage.assert_called_once_with(mock.sentinel.image)
+        self.assertTrue(handle.Clear.called)
+
+    def test_handle_reuse(self):
+        self._create_test_backend(
+            tessdata_path=TEST_TESSERACT_API_TESSDATA_PATH
+        )
+
+        handle = self.test_backend.get_handle(
+            language=TEST_TESSERACT_API_LANGUAGE_1
+        )
+
+        for index in range(2):
+            self.test_backend.execute_image(
+                image=mock.sentinel.image,
+                language=TEST_TESSERACT_API_LANGUAGE_1
+            )
+
+        self.assertEqual(
+            self.test_backend.get_handle(
+                language=TEST_TESSERACT_API_LANGUAGE_1
+            ), handle
+        )
+        self.mock_tesserocr.PyTessBaseAPI.assert_called_once_with(
+            lang=TEST_TESSERACT_API_LANGUAGE_1,
+            path=TEST_TESSERACT_API_TESSDATA_PATH
+        )
+
+        self.assertNotEqual(
+            self.test_backend.get_handle(
+                language=TEST_TESSERACT_API_LANGUAGE_2
+            ), handle
+        )
+        self.assertEqual(self.mock_tesserocr.PyTessBaseAPI.call_count, 2)
+
+    def test_handle_maximum(self):
+        self._create_test_backend(maximum_handles=2)
+
+        handle_1 = self.test_backend.get_handle(
+            language=TEST_TESSERACT_API_LANGUAGE_1
+        )
+        handle_2 = self.test_backend.get_handle(
+            language=TEST_TESSERACT_API_LANGUAGE_2
+        )
+
+        # Use the first language again to make the second one the least
+        # recently used.
+        self.test_backend.get_handle(language=TEST_TESSERACT_API_LANGUAGE_1)
+        self.test_backend.get_handle(language=TEST_TESSERACT_API_LANGUAGE_3)
+
+        self.assertEqual(
+            list(self.test_backend.handles),
+            [TEST_TESSERACT_API_LANGUAGE_1, TEST_TESSERACT_API_LANGUAGE_3]
+        )
+        self.assertFalse(handle_1.End.called)
+        self.assertTrue(handle_2.End.called)
+
+    def test_handle_initialization_error(self):
+        self._create_test_backend()
+
+        self.mock_tesserocr.PyTessBaseAPI.side_effect = RuntimeError
+
+        with self.assertRaises(expected_exception=OCRError):
+            self.test_backend.get_handle(
+                language=TEST_TESSERACT_API_LANGUAGE_1
+            )
+
+        self.assertEqual(self.test_backend.handles, {})
+
+    def test_execute_image_error(self):
+        self._silence_logger(name='mayan.apps.ocr.backends.tesseract_api')
+        self._create_test_backend()
+
+        handle = self.test_backend.get_handle(
+            language=TEST_TESSERACT_API_LANGUAGE_1
+        )
+        handle.GetUTF8Text.side_effect = RuntimeError
+
+        with self.assertRaises(expected_exception=OCRError):
+            self.test_backend.execute_image(
+                image=mock.sentinel.image,
+                language=TEST_TESSERACT_API_LANGUAGE_1
+            )
+
+        # The handle is cleared for the next page even after an error.
+        self.assertTrue(handle.Clear.called)
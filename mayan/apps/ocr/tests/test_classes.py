@@ -0,0 +1,30 @@
+from mayan.apps.smart_settings.tests.mixins import SmartSettingTestMixin
+from mayan.apps.testing.tests.base import BaseTestCase
+
+from ..classes import OCRBackendBase
+from ..settings import setting_ocr_backend, setting_ocr_backend_arguments
+
+
+class OCRBackendBaseTestCase(SmartSettingTestMixin, BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_ocr_backend.global_name),
+            value='mayan.apps.ocr.classes.OCRBackendBase'
+        )
+
+    def test_get_instance_reuse(self):
+        self.assertEqual(
+            id(OCRBackendBase.get_instance()),
+            id(OCRBackendBase.get_instance())
+        )
+
+    def test_get_instance_arguments_change(self):
+        ocr_backend = OCRBackendBase.get_instance()
+
+        setting_ocr_backend_arguments.set(value={'test_argument': 1})
+
+        ocr_backend_new = OCRBackendBase.get_instance()
+
+        self.assertNotEqual(id(ocr_backend), id(ocr_backend_new))
+        self.assertEqual(ocr_backend_new.kwargs, {'test_argument': 1})
@@ -1,11 +1,45 @@
+import math
+
+from actstream.models import Action
+import mock
+
 from django.test import override_settings
 
+from mayan.apps.converter.layers import layer_saved_transformations
+from mayan.apps.converter.transformations import TransformationRotate90
+from mayan.apps.document_parsing.events import (
+    event_parsing_document_file_finish
+)
+from mayan.apps.document_parsing.models import DocumentFilePageContent
 from mayan.apps.documents.tests.base import GenericDocumentTestCase
-from mayan.apps.documents.tests.literals import TEST_DEU_DOCUMENT_PATH
+from mayan.apps.documents.tests.literals import (
+    TEST_DEU_DOCUMENT_PATH, TEST_MULTI_PAGE_TIFF
+)
+from mayan.apps.smart_settings.tests.mixins import SmartSettingTestMixin
+from mayan.apps.task_manager.classes import CeleryQueue
+from mayan.apps.task_manager.workers import worker_d, worker_e
+
+from ..classes import OCRBackendBase
+from ..events import event_ocr_document_version_finish
+from ..literals import (
+    OCR_CONTENT_SOURCE_OCR, OCR_CONTENT_SOURCE_TEXT_LAYER, OCR_PRIORITY_BULK,
+    OCR_PRIORITY_INTERACTIVE, OCR_PRIORITY_QUEUE_NAMES, OCR_PRIORITY_REPROCESS
+)
+from ..models import DocumentVersionPageOCRContent, SourcePageOCRContent
+from ..settings import (
+    setting_ocr_backend, setting_ocr_backend_arguments,
+    setting_ocr_image_profile,
+    setting_ocr_page_batch_size, setting_ocr_scheduling_round_size,
+    setting_ocr_text_layer_threshold
+)
+from ..tasks import task_document_version_ocr_process
 
 from .literals import (
+    TEST_DOCUMENT_FILE_PAGE_TEXT_LAYER_CONTENT,
     TEST_DOCUMENT_VERSION_OCR_CONTENT, TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_1,
-    TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2
+    TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2,
+    TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT_UPDATED,
+    TEST_OCR_TEXT_LAYER_THRESHOLD
 )
 
 
@@ -30,3 +64,449 @@ class GermanOCRSupportTestCase(GenericDocumentTestCase):
         self.assertTrue(
             TEST_DOCUMENT_VERSION_OCR_CONTENT_DEU_2 in content
         )
+
+
+class DocumentVersionPageOCRBatchTestCase(
+    SmartSettingTestMixin, GenericDocumentTestCase
+):
+    test_document_filename = TEST_MULTI_PAGE_TIFF
+
+    def setUp(self):
+        super().setUp()
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_ocr_backend.global_name),
+            value='mayan.apps.ocr.classes.OCRBackendBase'
+        )
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_ocr_page_batch(self, mock_execute_method):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_ocr_page_batch_size.global_name),
+            value='2'
+        )
+
+        with mock.patch(
+            'mayan.apps.ocr.classes.OCRBackendBase.execute_many',
+            autospec=True, side_effect=OCRBackendBase.execute_many
+        ) as mock_execute_many_method:
+            self.test_document_version.submit_for_ocr()
+
+        page_count = self.test_document_version.pages.count()
+
+        self.assertEqual(
+            mock_execute_many_method.call_count, math.ceil(page_count / 2)
+        )
+        self.assertEqual(
+            DocumentVersionPageOCRContent.objects.filter(
+                document_version_page__document_version=self.test_document_version,
+                content=TEST_DOCUMENT_VERSION_OCR_CONTENT
+            ).count(), page_count
+        )
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_process_document_version_pages_update(self, mock_execute_method):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        test_document_version_page = self.test_document_version.pages.first()
+
+        DocumentVersionPageOCRContent.objects.create(
+            document_version_page=test_document_version_page, content='old'
+        )
+
+        DocumentVersionPageOCRContent.objects.process_document_version_pages(
+            document_version_pages=self.test_document_version.pages.all()
+        )
+
+        self.assertEqual(
+            DocumentVersionPageOCRContent.objects.get(
+                document_version_page=test_document_version_page
+            ).content, TEST_DOCUMENT_VERSION_OCR_CONTENT
+        )
+        self.assertEqual(
+            DocumentVersionPageOCRContent.objects.filter(
+                content=TEST_DOCUMENT_VERSION_OCR_CONTENT
+            ).count(), self.test_document_version.pages.count()
+        )
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_process_document_version_pages_concurrent_create(
+        self, mock_execute_method
+    ):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        test_document_version_page = self.test_document_version.pages.first()
+
+        bulk_create = DocumentVersionPageOCRContent.objects.bulk_create
+
+        def _bulk_create(*args, **kwargs):
+            # Another OCR process creates the content of the page after
+            # the query of the existing content.
+            DocumentVersionPageOCRContent.objects.create(
+                document_version_page=test_document_version_page,
+                content='concurrent'
+            )
+            return bulk_create(*args, **kwargs)
+
+        with mock.patch.object(
+            attribute='bulk_create', side_effect=_bulk_create,
+            target=DocumentVersionPageOCRContent.objects
+        ):
+            DocumentVersionPageOCRContent.objects.process_document_version_pages(
+                document_version_pages=self.test_document_version.pages.all()
+            )
+
+        self.assertEqual(
+            DocumentVersionPageOCRContent.objects.get(
+                document_version_page=test_document_version_page
+            ).content, TEST_DOCUMENT_VERSION_OCR_CONTENT
+        )
+        self.assertEqual(
+            DocumentVersionPageOCRContent.objects.filter(
+                content=TEST_DOCUMENT_VERSION_OCR_CONTENT
+            ).count(), self.test_document_version.pages.count()
+        )
+
+
+class DocumentVersionOCRSchedulingTestCase(
+    SmartSettingTestMixin, GenericDocumentTestCase
+):
+    test_document_filename = TEST_MULTI_PAGE_TIFF
+
+    def setUp(self):
+        super().setUp()
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_ocr_backend.global_name),
+            value='mayan.apps.ocr.classes.OCRBackendBase'
+        )
+
+    def test_priority_queue(self):
+        with mock.patch.object(
+            task_document_version_ocr_process, 'apply_async'
+        ) as mock_apply_async_method:
+            self.test_document_version.submit_for_ocr(
+                _priority=OCR_PRIORITY_BULK
+            )
+
+        self.assertEqual(
+            mock_apply_async_method.call_args[1]['queue'],
+            OCR_PRIORITY_QUEUE_NAMES[OCR_PRIORITY_BULK]
+        )
+        self.assertEqual(
+            mock_apply_async_method.call_args[1]['kwargs']['priority'],
+            OCR_PRIORITY_BULK
+        )
+
+    def test_priority_queue_worker(self):
+        queue_interactive = CeleryQueue.get(
+            queue_name=OCR_PRIORITY_QUEUE_NAMES[OCR_PRIORITY_INTERACTIVE]
+        )
+
+        for priority in (OCR_PRIORITY_BULK, OCR_PRIORITY_REPROCESS):
+            with mock.patch.object(
+                task_document_version_ocr_process, 'apply_async'
+            ) as mock_apply_async_method:
+                self.test_document_version.submit_for_ocr(
+                    _priority=priority
+                )
+
+            queue = CeleryQueue.get(
+                queue_name=mock_apply_async_method.call_args[1]['queue']
+            )
+
+            # The lower priority classes are consumed by a separate worker
+            # with a lower CPU priority than the interactive one.
+            self.assertTrue(queue in worker_e.queues)
+            self.assertFalse(queue_interactive in worker_e.queues)
+            self.assertTrue(queue_interactive in worker_d.queues)
+            self.assertTrue(worker_e.nice_level > worker_d.nice_level)
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_scheduling_rounds(self, mock_execute_method):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(
+                setting_ocr_scheduling_round_size.global_name
+            ), value='1'
+        )
+
+        Action.objects.all().delete()
+        self.test_document_version.submit_for_ocr()
+
+        self.assertEqual(
+            DocumentVersionPageOCRContent.objects.filter(
+                document_version_page__document_version=self.test_document_version,
+                content=TEST_DOCUMENT_VERSION_OCR_CONTENT
+            ).count(), self.test_document_version.pages.count()
+        )
+        self.assertEqual(
+            Action.objects.filter(
+                verb=event_ocr_document_version_finish.id
+            ).count(), 1
+        )
+
+
+class DocumentVersionPageOCRTextLayerTestCase(
+    SmartSettingTestMixin, GenericDocumentTestCase
+):
+    def setUp(self):
+        super().setUp()
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_ocr_backend.global_name),
+            value='mayan.apps.ocr.classes.OCRBackendBase'
+        )
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(
+                setting_ocr_text_layer_threshold.global_name
+            ), value=str(TEST_OCR_TEXT_LAYER_THRESHOLD)
+        )
+        self.test_document_version_page = self.test_document_version.pages.first()
+
+    def _create_test_document_file_page_content(self, content):
+        DocumentFilePageContent.objects.update_or_create(
+            document_file_page=self.test_document_version_page.content_object,
+            defaults={'content': content}
+        )
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_text_layer_above_threshold(self, mock_execute_method):
+        self._create_test_document_file_page_content(
+            content=TEST_DOCUMENT_FILE_PAGE_TEXT_LAYER_CONTENT
+        )
+
+        DocumentVersionPageOCRContent.objects.process_document_version_page(
+            document_version_page=self.test_document_version_page
+        )
+
+        self.assertFalse(mock_execute_method.called)
+        ocr_content = self.test_document_version_page.ocr_content
+        self.assertEqual(
+            ocr_content.content, TEST_DOCUMENT_FILE_PAGE_TEXT_LAYER_CONTENT
+        )
+        self.assertEqual(ocr_content.source, OCR_CONTENT_SOURCE_TEXT_LAYER)
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_text_layer_below_threshold(self, mock_execute_method):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        self._create_test_document_file_page_content(
+            content=TEST_DOCUMENT_FILE_PAGE_TEXT_LAYER_CONTENT[:-1]
+        )
+
+        DocumentVersionPageOCRContent.objects.process_document_version_page(
+            document_version_page=self.test_document_version_page
+        )
+
+        self.assertTrue(mock_execute_method.called)
+        ocr_content = self.test_document_version_page.ocr_content
+        self.assertEqual(
+            ocr_content.content, TEST_DOCUMENT_VERSION_OCR_CONTENT
+        )
+        self.assertEqual(ocr_content.source, OCR_CONTENT_SOURCE_OCR)
+
+
+class DocumentVersionPageOCRTextLayerUploadTestCase(
+    SmartSettingTestMixin, GenericDocumentTestCase
+):
+    auto_upload_test_document = False
+
+    def setUp(self):
+        super().setUp()
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_ocr_backend.global_name),
+            value='mayan.apps.ocr.classes.OCRBackendBase'
+        )
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(
+                setting_ocr_text_layer_threshold.global_name
+            ), value=str(TEST_OCR_TEXT_LAYER_THRESHOLD)
+        )
+        self.test_document_type.ocr_settings.auto_ocr = True
+        self.test_document_type.ocr_settings.save()
+
+    def _parse_document_file(self, document_file):
+        for document_file_page in document_file.pages.all():
+            DocumentFilePageContent.objects.update_or_create(
+                defaults={
+                    'content': TEST_DOCUMENT_FILE_PAGE_TEXT_LAYER_CONTENT
+                }, document_file_page=document_file_page
+            )
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    @mock.patch('mayan.apps.document_parsing.parsers.Parser.parse_document_file')
+    def test_text_layer_not_parsed_upload(
+        self, mock_parse_document_file_method, mock_execute_method
+    ):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        mock_parse_document_file_method.side_effect = self._parse_document_file
+
+        self.test_document_type.parsing_settings.auto_parsing = True
+        self.test_document_type.parsing_settings.save()
+
+        Action.objects.all().delete()
+
+        # Keep the parsing of the upload queued to have the OCR run first.
+        with mock.patch(
+            'mayan.apps.document_parsing.methods.task_parse_document_file.apply_async'
+        ):
+            self._upload_test_document()
+
+        self.assertTrue(mock_parse_document_file_method.called)
+        self.assertFalse(mock_execute_method.called)
+
+        ocr_content = self.test_document_version.pages.first().ocr_content
+        self.assertEqual(
+            ocr_content.content, TEST_DOCUMENT_FILE_PAGE_TEXT_LAYER_CONTENT
+        )
+        self.assertEqual(ocr_content.source, OCR_CONTENT_SOURCE_TEXT_LAYER)
+
+        # The parsing uses the normal path and commits its event.
+        self.assertTrue(
+            Action.objects.filter(
+                verb=event_parsing_document_file_finish.id
+            ).exists()
+        )
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    @mock.patch(
+        'mayan.apps.document_parsing.parsers.Parser.parse_document_file_page'
+    )
+    @mock.patch('mayan.apps.document_parsing.parsers.Parser.parse_document_file')
+    def test_text_layer_not_parsed_upload_parsing_disabled(
+        self, mock_parse_document_file_method,
+        mock_parse_document_file_page_method, mock_execute_method
+    ):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+
+        self.test_document_type.parsing_settings.auto_parsing = False
+        self.test_document_type.parsing_settings.save()
+
+        self._upload_test_document()
+
+        self.assertFalse(mock_parse_document_file_method.called)
+        self.assertFalse(mock_parse_document_file_page_method.called)
+        self.assertTrue(mock_execute_method.called)
+
+        ocr_content = self.test_document_version.pages.first().ocr_content
+        self.assertEqual(
+            ocr_content.content, TEST_DOCUMENT_VERSION_OCR_CONTENT
+        )
+        self.assertEqual(ocr_content.source, OCR_CONTENT_SOURCE_OCR)
+
+
+class DocumentVersionPageOCRImageTestCase(
+    SmartSettingTestMixin, GenericDocumentTestCase
+):
+    def test_ocr_image_profile(self):
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_ocr_image_profile.global_name),
+            value="{'dpi': 150, 'grayscale': True}"
+        )
+        test_document_version_page = self.test_document_version.pages.first()
+
+        image = DocumentVersionPageOCRContent.objects.get_ocr_image(
+            document_version_page=test_document_version_page
+        )
+        base_image = test_document_version_page.content_object.get_image(
+            _as_image=True
+        )
+
+        self.assertEqual(image.mode, 'L')
+        self.assertEqual(
+            image.size, (base_image.size[0] // 2, base_image.size[1] // 2)
+        )
+
+
+class SourcePageOCRContentTestCase(
+    SmartSettingTestMixin, GenericDocumentTestCase
+):
+    def setUp(self):
+        super().setUp()
+        self._set_environment_variable(
+            name='MAYAN_{}'.format(setting_ocr_backend.global_name),
+            value='mayan.apps.ocr.classes.OCRBackendBase'
+        )
+
+    def _process_test_document_version_pages(self):
+        DocumentVersionPageOCRContent.objects.process_document_version_pages(
+            document_version_pages=self.test_document_version.pages.all()
+        )
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_remap_reuse(self, mock_execute_method):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        self._process_test_document_version_pages()
+
+        self.test_document_version.pages_reset()
+        self._process_test_document_version_pages()
+
+        self.assertEqual(mock_execute_method.call_count, 1)
+        self.assertEqual(
+            self.test_document_version.pages.first().ocr_content.content,
+            TEST_DOCUMENT_VERSION_OCR_CONTENT
+        )
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_transformation_change(self, mock_execute_method):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        self._process_test_document_version_pages()
+
+        layer_saved_transformations.add_transformation_to(
+            obj=self.test_document_version.pages.first(),
+            arguments={}, transformation_class=TransformationRotate90
+        )
+        self._process_test_document_version_pages()
+
+        self.assertEqual(mock_execute_method.call_count, 2)
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_backend_arguments_change(self, mock_execute_method):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        self._process_test_document_version_pages()
+
+        setting_ocr_backend_arguments.set(value={'test_argument': 1})
+        self._process_test_document_version_pages()
+
+        self.assertEqual(mock_execute_method.call_count, 2)
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_delete_content(self, mock_execute_method):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        self._process_test_document_version_pages()
+
+        DocumentVersionPageOCRContent.objects.delete_content_for(
+            document_version=self.test_document_version
+        )
+
+        self.assertEqual(SourcePageOCRContent.objects.count(), 0)
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_source_delete(self, mock_execute_method):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        self._process_test_document_version_pages()
+
+        self.test_document_file.delete()
+
+        self.assertEqual(SourcePageOCRContent.objects.count(), 0)
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_submit_automatic_reuse(self, mock_execute_method):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        self._process_test_document_version_pages()
+
+        self.test_document_version.submit_for_ocr()
+
+        self.assertEqual(mock_execute_method.call_count, 1)
+
+    @mock.patch('mayan.apps.ocr.classes.OCRBackendBase.execute')
+    def test_submit_explicit_no_reuse(self, mock_execute_method):
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_OCR_CONTENT
+        self._process_test_document_version_pages()
+
+        mock_execute_method.return_value = TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT_UPDATED
+        self.test_document_version.submit_for_ocr(
+            _priority=OCR_PRIORITY_REPROCESS
+        )
+
+        self.assertEqual(mock_execute_method.call_count, 2)
+        self.assertEqual(
+            self.test_document_version.pages.first().ocr_content.content,
+            TEST_DOCUMENT_VERSION_PAGE_OCR_CONTENT_UPDATED
+        )
@@ -0,0 +1,55 @@
+from PIL import Image, ImageDraw
+
+from django.test import TestCase
+
+from ..transformations import (
+    TransformationBinarize, TransformationBorderRemoval,
+    TransformationDeskew, TransformationGrayscale
+)
+
+from .literals import TEST_OCR_IMAGE_SKEW_ANGLE
+
+
+class OCRTransformationTestCase(TestCase):
+    def _create_test_image(self):
+        self.test_image = Image.new(mode='RGB', size=(400, 400), color='white')
+        draw = ImageDraw.Draw(im=self.test_image)
+        for top in range(60, 340, 20):
+            draw.rectangle(xy=(60, top, 340, top + 6), fill='black')
+
+    def test_binarize(self):
+        self._create_test_image()
+        self.test_image.paste(im=(200, 200, 200), box=(0, 0, 40, 40))
+
+        image = TransformationBinarize().execute_on(image=self.test_image)
+
+        self.assertEqual(image.mode, '1')
+        self.assertEqual(image.getpixel(xy=(10, 10)), 255)
+        self.assertEqual(image.getpixel(xy=(100, 62)), 0)
+
+    def test_border_removal(self):
+        self._create_test_image()
+        image = Image.new(mode='RGB', size=(440, 460), color='black')
+        image.paste(im=self.test_image, box=(20, 30))
+
+        image = TransformationBorderRemoval().execute_on(image=image)
+
+        self.assertEqual(image.size, self.test_image.size)
+
+    def test_deskew_angle(self):
+        self._create_test_image()
+        image = self.test_image.rotate(
+            angle=TEST_OCR_IMAGE_SKEW_ANGLE, fillcolor='white'
+        )
+
+        self.assertEqual(
+            TransformationDeskew.get_skew_angle(image=image),
+            -TEST_OCR_IMAGE_SKEW_ANGLE
+        )
+
+    def test_grayscale(self):
+        self._create_test_image()
+
+        image = TransformationGrayscale().execute_on(image=self.test_image)
+
+        self.assertEqual(image.mode, 'L')
@@ -0,0 +1,185 @@
+from PIL import Image
+
+from django.utils.translation import ugettext_lazy as _
+
+from mayan.apps.converter.transformations import BaseTransformation
+
+from .literals import (
+    OCR_IMAGE_BORDER_THRESHOLD, OCR_IMAGE_DESKEW_MAXIMUM_ANGLE,
+    OCR_IMAGE_DESKEW_SAMPLE_WIDTH, OCR_IMAGE_DESKEW_STEP
+)
+
+
+class TransformationBinarize(BaseTransformation):
+    """
+    Convert the image to black and white using a threshold calculated
+    from the histogram of the image with the Otsu method.
+    """
+    label = _('Binarize')
+    name = 'ocr_binarize'
+
+    @staticmethod
+    def get_threshold(histogram):
+        total = sum(histogram)
+        total_sum = sum(index * count for index, count in enumerate(histogram))
+
+        background_count = 0
+        background_sum = 0
+        maximum_variance = 0
+        threshold = 128
+
+        for index, count in enumerate(histogram):
+            background_count += count
+            if not background_count:
+                continue
+
+            foreground_count = total - background_count
+            if not foreground_count:
+                break
+
+            background_sum += index * count
+            background_mean = background_sum / background_count
+            foreground_mean = (total_sum - background_sum) / foreground_count
+
+            variance = background_count * foreground_count * (
+                background_mean - foreground_mean
+            ) ** 2
+
+            if variance > maximum_variance:
+                maximum_variance = variance
+                threshold = index
+
+        return threshold
+
+    def execute_on(self, *args, **kwargs):
+        super().execute_on(*args, **kwargs)
+
+        image = self.image.convert('L')
+        threshold = self.get_threshold(histogram=image.histogram())
+
+        return image.point(lambda x: 0 if x <= threshold else 255, '1')
+
+
+class TransformationBorderRemoval(BaseTransformation):
+    """
+    Crop the dark borders left around the page by scanners. Rows and
+    columns are removed from each edge while their average brightness is
+    below the threshold.
+    """
+    label = _('Border removal')
+    name = 'ocr_border_removal'
+
+    @staticmethod
+    def get_margins(values):
+        start = 0
+        while start < len(values) and values[start] < OCR_IMAGE_BORDER_THRESHOLD:
+            start += 1
+
+        end = len(values)
+        while end > start and values[end - 1] < OCR_IMAGE_BORDER_THRESHOLD:
+            end -= 1
+
+        return start, end
+
+    def execute_on(self, *args, **kwargs):
+        super().execute_on(*args, **kwargs)
+
+        image = self.image.convert('L')
+
+        # Average each column and each row by downsampling.
+        left, right = self.get_margins(
+            values=list(
+                image.resize(size=(image.size[0], 1), resample=Image.BOX).getdata()
+            )
+        )
+        top, bottom = self.get_margins(
+            values=list(
+                image.resize(size=(1, image.size[1]), resample=Image.BOX).getdata()
+            )
+        )
+
+        if right <= left or bottom <= top:
+            # The entire image is dark.
+            return self.image
+
+        return self.image.crop(box=(left, top, right, bottom))
+
+
+class TransformationDeskew(BaseTransformation):
+    """
+    Rotate the image to make the text lines horizontal. The skew angle is
+    the one that maximizes the variance of the row profile of a reduced
+    copy of the image, which is highest when the text lines are aligned
+    with the rows.
+    """
+    label = _('Deskew')
+    name = 'ocr_deskew'
+
+    @staticmethod
+    def get_profile_variance(image):
+        values = list(
+            image.resize(size=(1, image.size[1]), resample=Image.BOX).getdata()
+        )
+        mean = sum(values) / len(values)
+
+        return sum((value - mean) ** 2 for value in values)
+
+    @classmethod
+    def get_skew_angle(cls, image):
+        sample = image.convert('L')
+
+        factor = OCR_IMAGE_DESKEW_SAMPLE_WIDTH / sample.size[0]
+        if factor < 1:
+            sample = sample.resize(
+                size=(
+                    OCR_IMAGE_DESKEW_SAMPLE_WIDTH,
+                    max(int(sample.size[1] * factor), 1)
+                ), resample=Image.BOX
+            )
+
+        # Invert so that the text is bright and the rotation fill color
+        # does not add to the profile.
+        sample = sample.point(lambda x: 255 - x)
+
+        best_angle = 0
+        best_variance = cls.get_profile_variance(image=sample)
+
+        step_count = int(
+            OCR_IMAGE_DESKEW_MAXIMUM_ANGLE / OCR_IMAGE_DESKEW_STEP
+        )
+        for step in range(-step_count, step_count + 1):
+            angle = step * OCR_IMAGE_DESKEW_STEP
+            if not angle:
+                continue
+
+            variance = cls.get_profile_variance(
+                image=sample.rotate(angle=angle, resample=Image.NEAREST)
+            )
+            if variance > best_variance:
+                best_angle = angle
+                best_variance = variance
+
+        return best_angle
+
+    def execute_on(self, *args, **kwargs):
+        super().execute_on(*args, **kwargs)
+
+        angle = self.get_skew_angle(image=self.image)
+
+        if not angle:
+            return self.image
+
+        return self.image.rotate(
+            angle=angle, expand=True, fillcolor='white',
+            resample=Image.BICUBIC
+        )
+
+
+class TransformationGrayscale(BaseTransformation):
+    label = _('Grayscale')
+    name = 'ocr_grayscale'
+
+    def execute_on(self, *args, **kwargs):
+        super().execute_on(*args, **kwargs)
+
+        return self.image.convert('L')
@@ -1,6 +1,17 @@
 from django.apps import apps
 from django.utils.encoding import force_text
 
+from mayan.apps.converter.literals import DEFAULT_PDFTOPPM_DPI
+from mayan.apps.converter.settings import setting_graphics_backend_arguments
+from mayan.apps.converter.transformations import TransformationZoom
+
+from .literals import DEFAULT_OCR_IMAGE_PROFILE
+from .settings import setting_ocr_image_profile
+from .transformations import (
+    TransformationBinarize, TransformationBorderRemoval,
+    TransformationDeskew, TransformationGrayscale
+)
+
 
 def get_instance_ocr_content(instance):
     DocumentVersionPageOCRContent = apps.get_model(
@@ -14,3 +25,40 @@ def get_instance_ocr_content(instance):
             """Not critical, just ignore and go to next page."""
         else:
             yield force_text(s=page_content)
+
+
+def get_ocr_image_transformations():
+    """
+    Return the transformations of the OCR image profile. The page images
+    are rasterized at the resolution of the graphics backend and scaled to
+    the resolution of the profile.
+    """
+    profile = DEFAULT_OCR_IMAGE_PROFILE.copy()
+    profile.update(setting_ocr_image_profile.value or {})
+
+    transformations = []
+
+    if profile['grayscale']:
+        transformations.append(TransformationGrayscale())
+
+    if profile['dpi']:
+        source_dpi = float(
+            setting_graphics_backend_arguments.value.get(
+                'pdftoppm_dpi', DEFAULT_PDFTOPPM_DPI
+            )
+        )
+        percent = 100.0 * float(profile['dpi']) / source_dpi
+
+        if percent != 100:
+            transformations.append(TransformationZoom(percent=percent))
+
+    if profile['border_removal']:
+        transformations.append(TransformationBorderRemoval())
+
+    if profile['deskew']:
+        transformations.append(TransformationDeskew())
+
+    if profile['binarize']:
+        transformations.append(TransformationBinarize())
+
+    return transformations
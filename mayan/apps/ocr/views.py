@@ -16,6 +16,7 @@ from mayan.apps.views.generics import (
 from mayan.apps.views.mixins import ExternalObjectViewMixin
 
 from .forms import DocumentVersionPageOCRContentForm, DocumentVersionOCRContentForm
+from .literals import OCR_PRIORITY_BULK, OCR_PRIORITY_REPROCESS
 from .models import DocumentVersionPageOCRContent, DocumentVersionOCRError
 from .permissions import (
     permission_document_version_ocr_content_view, permission_document_version_ocr,
@@ -127,7 +128,9 @@ class DocumentVersionOCRSubmitView(MultipleObjectConfirmActionView):
         return result
 
     def object_action(self, form, instance):
-        instance.submit_for_ocr(_user=self.request.user)
+        instance.submit_for_ocr(
+            _priority=OCR_PRIORITY_REPROCESS, _user=self.request.user
+        )
 
 
 class DocumentVersionPageOCRContentView(SingleObjectDetailView):
@@ -167,7 +170,9 @@ class DocumentTypeSubmitView(FormView):
 
         for document_type in form.cleaned_data['document_type']:
             for document in document_type.documents.filter(pk__in=valid_documents_queryset.values('pk')):
-                document.submit_for_ocr(_user=self.request.user)
+                document.submit_for_ocr(
+                    _priority=OCR_PRIORITY_BULK, _user=self.request.user
+                )
                 count += 1
 
         messages.success(
@@ -249,8 +249,7 @@ class StagingFile:
                 file_object.close()
             raise
 
-        for transformation in transformations:
-            converter.transform(transformation=transformation)
+        converter.transform_many(transformations=transformations)
 
         result = converter.get_page()
         file_object.close()
@@ -4,7 +4,9 @@ from mayan.settings.literals import (
     MAYAN_WORKER_B_MAX_MEMORY_PER_CHILD, MAYAN_WORKER_B_MAX_TASKS_PER_CHILD,
     MAYAN_WORKER_C_CONCURRENCY, MAYAN_WORKER_C_MAX_MEMORY_PER_CHILD,
     MAYAN_WORKER_C_MAX_TASKS_PER_CHILD, MAYAN_WORKER_D_CONCURRENCY,
-    MAYAN_WORKER_D_MAX_MEMORY_PER_CHILD, MAYAN_WORKER_D_MAX_TASKS_PER_CHILD
+    MAYAN_WORKER_D_MAX_MEMORY_PER_CHILD, MAYAN_WORKER_D_MAX_TASKS_PER_CHILD,
+    MAYAN_WORKER_E_CONCURRENCY, MAYAN_WORKER_E_MAX_MEMORY_PER_CHILD,
+    MAYAN_WORKER_E_MAX_TASKS_PER_CHILD
 )
 
 from .classes import Worker
@@ -33,3 +35,9 @@ worker_d = Worker(
     maximum_tasks_per_child=MAYAN_WORKER_D_MAX_TASKS_PER_CHILD,
     name='worker_d', nice_level=18
 )
+worker_e = Worker(
+    concurrency=MAYAN_WORKER_E_CONCURRENCY,
+    maximum_memory_per_child=MAYAN_WORKER_E_MAX_MEMORY_PER_CHILD,
+    maximum_tasks_per_child=MAYAN_WORKER_E_MAX_TASKS_PER_CHILD,
+    name='worker_e', nice_level=19
+)
@@ -56,3 +56,6 @@ MAYAN_WORKER_C_MAX_TASKS_PER_CHILD = 100
 MAYAN_WORKER_D_CONCURRENCY = 1
 MAYAN_WORKER_D_MAX_MEMORY_PER_CHILD = 300000
 MAYAN_WORKER_D_MAX_TASKS_PER_CHILD = 10
+MAYAN_WORKER_E_CONCURRENCY = 1
+MAYAN_WORKER_E_MAX_MEMORY_PER_CHILD = 300000
+MAYAN_WORKER_E_MAX_TASKS_PER_CHILD = 10